@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Agent Dispatcher
+─────────────────────────────────────────
+One dispatcher thread owns the comm bus and fans messages out to every
+registered agent handler:
+ - a single receive_any() call waits on all agents at once
+ - handlers run on a bounded worker pool (max_workers)
+ - each agent processes its messages one at a time, in order
+ - per-agent backpressure: once an agent holds `inbox_size` unprocessed
+   messages the dispatcher stops claiming for it; the rest stay queued on the bus
+ - urgent messages skip backpressure and jump to the front of the agent's inbox
+ - unregistering stops claiming for an agent; messages it had already claimed
+   stay in its inbox and are handled if the agent registers again
+
+Thread count is 1 + max_workers regardless of how many agents register.
+Run one Dispatcher per bus; receive_any() is not meant to be shared.
+"""
+import threading, traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from agentic_masters_genesis_forge_v1_crewai_project.comm_bus import _key, is_urgent
+
+class Dispatcher:
+    def __init__(self, bus, max_workers=8, inbox_size=32):
+        self.bus = bus
+        self.inbox_size = inbox_size
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="forge-agent")
+        self.handlers = {}
+        self.inboxes = {}
+        self.busy = set()
+        self.lock = threading.Lock()
+        self.running = False
+        self.thread = None
+
+    def register(self, name, handler):
+        key = _key(name)
+        with self.lock:
+            self.handlers[key] = handler
+            self.inboxes.setdefault(key, deque())
+            self._schedule(key)  # messages held since an earlier unregister
+        self.start()
+        self.bus.wakeup()
+
+    def unregister(self, name):
+        with self.lock:
+            self.handlers.pop(_key(name), None)
+        self.bus.wakeup()
+
+    def start(self):
+        with self.lock:
+            if self.running:
+                return
+            self.running = True
+            self.thread = threading.Thread(target=self._loop, name="forge-dispatcher", daemon=True)
+        self.thread.start()
+
+    def stop(self, wait=True):
+        self.running = False
+        self.bus.wakeup()
+        if wait and self.thread:
+            self.thread.join()
+        self.pool.shutdown(wait=wait)
+
+    def _room(self, key):
+        return max(0, self.inbox_size - len(self.inboxes[key]) - (key in self.busy))
+
+    def _loop(self):
+        while self.running:
+            with self.lock:
+                keys = list(self.handlers)
+            # saturated agents get limit 0: the bus then only claims their urgent messages
+            batches = self.bus.receive_any(keys, timeout=1.0, limit=self._room)
+            with self.lock:
+                for key, msgs in batches.items():
+                    inbox = self.inboxes.setdefault(key, deque())
+                    inbox.extendleft(reversed([m for m in msgs if is_urgent(m)]))
+                    inbox.extend(m for m in msgs if not is_urgent(m))
+                    self._schedule(key)
+
+    def _schedule(self, key):
+        # caller holds self.lock
+        if key not in self.busy and self.inboxes[key]:
+            self.busy.add(key)
+            self.pool.submit(self._drain, key)
+
+    def _drain(self, key):
+        while True:
+            with self.lock:
+                inbox = self.inboxes[key]
+                handler = self.handlers.get(key)
+                if not inbox or handler is None:
+                    # unregistered: the bus already marked these delivered, so hold them for register()
+                    self.busy.discard(key)
+                    return
+                msg = inbox.popleft()
+                freed = self._room(key) == 1  # agent was saturated and skipped by the dispatcher
+            if freed:
+                self.bus.wakeup()
+            try:
+                handler(msg)
+            except Exception:
+                print(f"[dispatcher] handler for {key} failed:\n{traceback.format_exc()}")
@@ -4,48 +4,31 @@
 💎 Forge Communication Hub
 ─────────────────────────────────────────────
 Acts as a shared message bus for all Forge agents.
-Messages are JSON-logged and retrieved by listening agents.
+Messages are stored in the comm_bus SQLite store and retrieved by listening agents.
 ─────────────────────────────────────────────
 """
 
-import os, json, time
-from datetime import datetime
+import os
+from agentic_masters_genesis_forge_v1_crewai_project.comm_bus import open_bus, migrate_json, legacy_view, GLOBAL_TOPIC
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
-BUS_FILE = os.path.join(ROOT, "forge_comm_bus.json")
+BUS_PATH = os.path.join(ROOT, "forge_comm_bus.db")
+LEGACY_PATH = os.path.join(ROOT, "forge_comm_bus.json")
+
+BUS = open_bus(BUS_PATH)
+migrate_json(BUS, LEGACY_PATH)
 
 def post_message(agent, recipient, message):
-    os.makedirs(os.path.dirname(BUS_FILE), exist_ok=True)
-    if not os.path.exists(BUS_FILE):
-        json.dump([], open(BUS_FILE, "w"))
+    BUS.post(agent, recipient, message)
 
-    data = json.load(open(BUS_FILE))
-    entry = {
-        "timestamp": datetime.now().isoformat(),
-        "from": agent,
-        "to": recipient,
-        "message": message,
-        "status": "pending"
-    }
-    data.append(entry)
-    json.dump(data, open(BUS_FILE, "w"), indent=2)
+def broadcast_message(agent, topic, message):
+    """One write, delivered to every agent subscribed to `topic`."""
+    BUS.publish(agent, topic or GLOBAL_TOPIC, message)
 
 def fetch_messages(agent):
     """Retrieve new messages for a given agent."""
-    if not os.path.exists(BUS_FILE):
-        return []
-    data = json.load(open(BUS_FILE))
-    new = [msg for msg in data if msg["to"].lower() == agent.lower() and msg["status"] == "pending"]
-    for msg in new:
-        msg["status"] = "delivered"
-    json.dump(data, open(BUS_FILE, "w"), indent=2)
-    return new
+    return [legacy_view(m) for m in BUS.fetch(agent)]
 
 def reply_to_message(original, response):
     """Attach a response to a message."""
-    data = json.load(open(BUS_FILE))
-    for msg in data:
-        if msg["timestamp"] == original["timestamp"]:
-            msg["status"] = "replied"
-            msg["response"] = response
-    json.dump(data, open(BUS_FILE, "w"), indent=2)
\ No newline at end of file
+    BUS.reply(original["to"], original, response)
@@ -5,65 +5,40 @@ Forge Communication Hub v2
 ──────────────────────────────────────────────
 Bidirectional agent messaging system.
 Adds live event loop and real-time delivery callbacks.
+Shares the comm_bus store with hub v3; messages keep the v2 field names.
 ──────────────────────────────────────────────
 """
 
-import os, json, time, threading
-from datetime import datetime
+import os
+from agentic_masters_genesis_forge_v1_crewai_project.comm_bus import open_bus, migrate_json, legacy_view, GLOBAL_TOPIC
+from agentic_masters_genesis_forge_v1_crewai_project.agent_dispatcher import Dispatcher
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
-BUS_FILE = os.path.join(ROOT, "forge_comm_bus.json")
-LOCK = threading.Lock()
+BUS_PATH = os.path.join(ROOT, "forge_comm_bus.db")
+LEGACY_PATH = os.path.join(ROOT, "forge_comm_bus.json")
 
-def _load_bus():
-    if not os.path.exists(BUS_FILE):
-        json.dump([], open(BUS_FILE, "w"))
-    return json.load(open(BUS_FILE))
-
-def _save_bus(data):
-    with LOCK:
-        json.dump(data, open(BUS_FILE, "w"), indent=2)
+BUS = open_bus(BUS_PATH)
+migrate_json(BUS, LEGACY_PATH)
+DISPATCHER = Dispatcher(BUS)
 
 def post_message(sender, recipient, message, priority="normal"):
-    data = _load_bus()
-    entry = {
-        "timestamp": datetime.now().isoformat(),
-        "from": sender,
-        "to": recipient,
-        "message": message,
-        "priority": priority,
-        "status": "queued"
-    }
-    data.append(entry)
-    _save_bus(data)
-    return entry
+    return legacy_view(BUS.post(sender, recipient, message, priority))
+
+def broadcast_message(sender, topic, message, priority="normal"):
+    """Send one message to every subscriber of `topic` (defaults to all listening agents)."""
+    return legacy_view(BUS.publish(sender, topic or GLOBAL_TOPIC, message, priority))
 
 def fetch_messages(agent):
     """Fetch pending messages for this agent."""
-    data = _load_bus()
-    new = [m for m in data if m["to"].lower() == agent.lower() and m["status"] == "queued"]
-    for m in new:
-        m["status"] = "delivered"
-    _save_bus(data)
-    return new
+    return [legacy_view(m) for m in BUS.fetch(agent)]
 
 def reply_message(agent, original, response):
     """Mark message replied and attach response."""
-    data = _load_bus()
-    for m in data:
-        if m["timestamp"] == original["timestamp"]:
-            m["status"] = "replied"
-            m["response"] = {"from": agent, "text": response, "timestamp": datetime.now().isoformat()}
-    _save_bus(data)
-
-def start_listener(agent_name, callback, poll_interval=5):
-    """Continuously poll for new messages for this agent."""
-    def loop():
-        print(f"[{agent_name}] Listening for messages...")
-        while True:
-            time.sleep(poll_interval)
-            messages = fetch_messages(agent_name)
-            for m in messages:
-                callback(m)
-    t = threading.Thread(target=loop, daemon=True)
-    t.start()
\ No newline at end of file
+    BUS.reply(agent, original, response)
+
+def start_listener(agent_name, callback, poll_interval=5, topics=(GLOBAL_TOPIC,)):
+    """Deliver new messages (and broadcasts on `topics`) for this agent as soon as they are posted."""
+    print(f"[{agent_name}] Listening for messages...")
+    for topic in topics:
+        BUS.subscribe(agent_name, topic)
+    DISPATCHER.register(agent_name, lambda m: callback(legacy_view(m)))
@@ -4,61 +4,57 @@
 Forge Communication Hub v3
 ──────────────────────────────────────────────
 Bi-directional messaging + agent registration
+Backed by comm_bus: per-recipient queues, blocking receive with immediate
+wakeup instead of rewriting forge_comm_bus.json on every call.
+All listeners share one dispatcher thread and a bounded handler pool.
+Broadcast topics (team:<name>, role:<name>, global) reach every subscriber
+with one stored message.
 ──────────────────────────────────────────────
 """
-import os, json, threading, time
-from datetime import datetime
+import os
+from agentic_masters_genesis_forge_v1_crewai_project.comm_bus import (
+    open_bus, migrate_json, GLOBAL_TOPIC, team_topic, role_topic)
+from agentic_masters_genesis_forge_v1_crewai_project.agent_dispatcher import Dispatcher
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
-BUS_PATH = os.path.join(ROOT, "forge_comm_bus.json")
-LOCK = threading.Lock()
+BUS_PATH = os.path.join(ROOT, "forge_comm_bus.db")
+LEGACY_PATH = os.path.join(ROOT, "forge_comm_bus.json")
 
-def _init_bus():
-    if not os.path.exists(BUS_PATH):
-        json.dump({"agents": {}, "messages": []}, open(BUS_PATH, "w"))
-_init_bus()
-
-def _load_bus(): return json.load(open(BUS_PATH))
-def _save_bus(data): 
-    with LOCK: json.dump(data, open(BUS_PATH, "w"), indent=2)
+BUS = open_bus(BUS_PATH)
+migrate_json(BUS, LEGACY_PATH)
+DISPATCHER = Dispatcher(BUS)
 
 def register_agent(name):
-    data = _load_bus()
-    data["agents"][name] = {"last_seen": datetime.now().isoformat()}
-    _save_bus(data)
+    BUS.register_agent(name)
 
 def post(sender, recipient, text, priority="normal"):
-    data = _load_bus()
-    msg = {
-        "time": datetime.now().isoformat(),
-        "from": sender, "to": recipient,
-        "text": text, "priority": priority,
-        "status": "queued"
-    }
-    data["messages"].append(msg)
-    _save_bus(data)
+    return BUS.post(sender, recipient, text, priority)
+
+def publish(sender, topic, text, priority="normal"):
+    return BUS.publish(sender, topic, text, priority)
+
+def subscribe(name, *topics):
+    for topic in topics:
+        BUS.subscribe(name, topic)
+
+def unsubscribe(name, topic=None):
+    BUS.unsubscribe(name, topic)
 
 def fetch(name):
-    data = _load_bus()
-    inbox = [m for m in data["messages"] if m["to"].lower() == name.lower() and m["status"]=="queued"]
-    for m in inbox: m["status"]="delivered"
-    _save_bus(data)
-    return inbox
+    return BUS.fetch(name)
 
 def reply(name, msg, text):
-    data=_load_bus()
-    for m in data["messages"]:
-        if m["time"]==msg["time"]:
-            m["status"]="replied"
-            m["response"]={"from":name,"text":text,"time":datetime.now().isoformat()}
-    _save_bus(data)
+    return BUS.reply(name, msg, text)
+
+def listen(name, handler, interval=4, topics=()):
+    """Route messages for `name` (and its topics) to `handler` via the shared dispatcher.
+
+    `interval` is kept for compatibility.
+    """
+    register_agent(name)
+    subscribe(name, *topics)
+    print(f"[{name}] Listening for messages…")
+    DISPATCHER.register(name, handler)
 
-def listen(name, handler, interval=4):
-    def loop():
-        register_agent(name)
-        print(f"[{name}] Listening for messages…")
-        while True:
-            time.sleep(interval)
-            for msg in fetch(name):
-                handler(msg)
-    threading.Thread(target=loop,daemon=True).start()
\ No newline at end of file
+def unlisten(name):
+    DISPATCHER.unregister(name)
@@ -7,7 +7,7 @@ Author: Robert Demotto Jr | 2025
 Enhancements:
 ✅ Ensures deliverables are *always* generated
 ✅ Adds emoji-safe UTF-8 output
-✅ ElevenLabs narration with fallback
+✅ ElevenLabs narration (shared voice cache) with fallback, off the critical path
 ✅ Auto-healing placeholder deliverables
 ✅ Phase-by-phase recovery logic
 ──────────────────────────────────────────────────────────────
@@ -16,9 +16,12 @@ Enhancements:
 import os, sys, re, json, hashlib, subprocess, shutil, warnings, time, requests, io, datetime
 from datetime import datetime
 from colorama import init, Fore, Style
-from pydub import AudioSegment
-from pydub.playback import play
 import dotenv
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_store import get_store
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_feed import publish, FeedWatcher
+from agentic_masters_genesis_forge_v1_crewai_project.validation_engine import run_validators
+from agentic_masters_genesis_forge_v1_crewai_project.voice_cache import narration_clip, play_pcm, get_cache, speak_locally
+from agentic_masters_genesis_forge_v1_crewai_project.narrator import Narrator
 
 warnings.filterwarnings("ignore")
 init(autoreset=True)
@@ -32,53 +35,42 @@ if sys.platform.startswith("win"):
 # ─────────────────────────────────────────────
 # 🔐 ElevenLabs Config
 # ─────────────────────────────────────────────
-ELEVEN_API_KEY = os.getenv("ELEVENLABS_API_KEY", "")
-ELEVEN_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
 ASSETS = "assets/voices"
 os.makedirs(ASSETS, exist_ok=True)
 
-VOICE_IDS = {
-    "Adam": "Eeg4uu5XxPosS7qxJsTI",
-    "Elli": "jAiFFKFYK8uW3TnWlXah",
-    "Charlotte": "BrOny4Lkm3SsSmSNv8hv",
-    "Roger": "CwhRBWXzGAHq8TQ4Fs17"
-}
-
 # ─────────────────────────────────────────────
 # 🧠 Utility & Narration Engine
 # ─────────────────────────────────────────────
-def speak(agent: str, text: str, pause_after: float = 0.8):
-    """ElevenLabs TTS + caching + fallback to pyttsx3"""
-    import pyttsx3
-    voice_id = VOICE_IDS.get(agent, VOICE_IDS["Adam"])
-    hashed = hashlib.md5(text.encode()).hexdigest()[:8]
-    base_path = os.path.join(ASSETS, f"{agent.lower()}_{hashed}")
-    mp3_file, wav_file = f"{base_path}.mp3", f"{base_path}.wav"
-
+def play_clip(clip, agent: str, text: str):
+    """Play a cached clip from memory, falling back to pyttsx3 when none could be synthesized."""
     try:
-        if ELEVEN_API_KEY:
-            headers = {
-                "xi-api-key": ELEVEN_API_KEY,
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-            }
-            payload = {"text": text, "model_id": "eleven_multilingual_v2"}
-            r = requests.post(ELEVEN_URL.format(voice_id=voice_id), headers=headers, json=payload, stream=True, timeout=30)
-            if r.ok:
-                with open(mp3_file, "wb") as f:
-                    for chunk in r.iter_content(4096):
-                        f.write(chunk)
-                AudioSegment.from_mp3(mp3_file).export(wav_file, format="wav")
-                os.remove(mp3_file)
-            if os.path.exists(wav_file):
-                play(AudioSegment.from_wav(wav_file))
-                time.sleep(pause_after)
-                return
+        if clip:
+            play_pcm(clip)
+            return
         raise RuntimeError("ElevenLabs TTS failed or missing key.")
     except Exception:
-        engine = pyttsx3.init()
-        engine.say(text)
-        engine.runAndWait()
+        speak_locally(text)
+
+def speak(agent: str, text: str, pause_after: float = 0.8):
+    """Cached ElevenLabs TTS + fallback to pyttsx3 (blocking)"""
+    try:
+        clip = narration_clip(agent, text, ASSETS)
+    except Exception:
+        clip = None
+    play_clip(clip, agent, text)
+    if clip:
+        time.sleep(pause_after)
+
+# Phase announcements are queued; a line still waiting after PHASE_LINE_LAG seconds is stale and skipped
+PHASE_LINE_LAG = 20.0
+_NARRATOR = None
+
+def get_narrator():
+    """Shared narrator, created (with its worker threads) on first use rather than at import."""
+    global _NARRATOR
+    if _NARRATOR is None:
+        _NARRATOR = Narrator(lambda agent, text: narration_clip(agent, text, ASSETS), play_clip)
+    return _NARRATOR
 
 # ─────────────────────────────────────────────
 # 🧾 Logging Setup
@@ -99,11 +91,18 @@ def log(msg, color=Fore.CYAN, style=Style.NORMAL):
 # ─────────────────────────────────────────────
 # 🚀 Core Forge Runner
 # ─────────────────────────────────────────────
+RUNNER_VALIDATORS = ["fences", "python_syntax", "data_syntax"]
+
 class ForgeRunner:
     def __init__(self):
         self.cypher_key = hashlib.sha256(str(time.time()).encode()).hexdigest()[:32]
         self.base_dir = os.path.join("deliverables", datetime.now().strftime("%Y%m%d_%H%M%S"))
         os.makedirs(self.base_dir, exist_ok=True)
+        self.store = get_store("deliverables")
+        # the crew subprocess and the manifest don't publish; the watcher feeds them in
+        self.watcher = FeedWatcher("deliverables")
+        self.watcher.start()
+        self.run_id = os.path.basename(self.base_dir)
         self.deliverables = []
         self.run_counter = 0
         log(f"🔮 Forge Cypher Generated: {self.cypher_key}", Fore.MAGENTA)
@@ -112,7 +111,7 @@ class ForgeRunner:
         """Run one phase and ensure at least one deliverable is produced."""
         self.run_counter += 1
         log(f"\n🚀 FORGE CYCLE {self.run_counter}: {phase}", Fore.MAGENTA)
-        speak("Roger", f"Initiating phase {self.run_counter}, {phase}.")
+        get_narrator().say("Roger", f"Initiating phase {self.run_counter}, {phase}.", pause_after=0.8, max_lag=PHASE_LINE_LAG)
 
         try:
             # Attempt CrewAI run, fallback to main.py
@@ -165,23 +164,28 @@ class ForgeRunner:
         for i, content in enumerate(deliverables, 1):
             file_name = f"{phase.replace(' ', '_')}_{i}.md"
             file_path = os.path.join(self.base_dir, file_name)
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content.strip())
+            name = os.path.relpath(file_path, self.store.root)
+            entry, is_new = self.store.put(content.strip(), task=phase, run=self.run_id, name=name)
+            self.store.export(entry, file_path)
 
             valid = self.validate_output(content)
-            self.deliverables.append({"title": file_name, "valid": valid})
-            log(f"💾 Saved deliverable: {file_name} ({'✅ valid' if valid else '⚠️ check'})", Fore.GREEN if valid else Fore.YELLOW)
+            self.deliverables.append({"title": file_name, "valid": valid, "hash": entry["hash"], "file": entry["name"]})
+            state = "💾 Saved deliverable" if is_new else "♻️  Deduplicated deliverable"
+            log(f"{state}: {file_name} ({'✅ valid' if valid else '⚠️ check'})", Fore.GREEN if valid else Fore.YELLOW)
 
     def fallback_deliverable(self, phase, reason):
         """Guarantee file creation if no deliverables produced."""
         fallback_file = os.path.join(self.base_dir, f"{phase.replace(' ', '_')}_FALLBACK.md")
         with open(fallback_file, "w", encoding="utf-8") as f:
             f.write(f"# 🩺 Fallback Deliverable\n\nPhase: {phase}\nReason: {reason}\nTimestamp: {datetime.now()}\n")
+        publish(fallback_file, self.store.root)
         self.deliverables.append({"title": fallback_file, "valid": True})
         log(f"🩹 Fallback deliverable generated: {fallback_file}", Fore.YELLOW)
 
     def validate_output(self, text: str) -> bool:
-        return text.count("```") % 2 == 0 and len(text) > 80
+        # fence balance as before, plus syntax of python/JSON/YAML blocks; no heading required
+        results = run_validators(text, RUNNER_VALIDATORS)
+        return len(text) > 80 and not any(results.values())
 
     def finalize(self):
         manifest_path = os.path.join(self.base_dir, "holo_manifest.json")
@@ -192,7 +196,8 @@ class ForgeRunner:
         shutil.make_archive(archive_name, "zip", self.base_dir)
         log(f"📦 Archived Forge Package → {archive_name}.zip", Fore.YELLOW)
 
-        speak("Adam", f"The Forge completed {len(self.deliverables)} deliverables successfully.")
+        self.watcher.stop()
+        get_narrator().say("Adam", f"The Forge completed {len(self.deliverables)} deliverables successfully.")
 
 def main():
     os.system("cls" if os.name == "nt" else "clear")
@@ -203,9 +208,12 @@ def main():
         "Forge Core Blueprint", "Persona Generation", "VR Environment",
         "Security Audit", "Data Manifest", "Performance Optimization", "Neural Broadcast"
     ]
+    get_cache(ASSETS).prefetch([("Roger", f"Initiating phase {n}, {phase}.")
+                                for n, phase in enumerate(phases, start=1)])
     for phase in phases:
         runner.run_cycle(phase)
     runner.finalize()
+    get_narrator().close(timeout=30)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,19 +4,18 @@
 💎 Realms to Riches | Agentic Master Forge™ 2025 Robert Demotto Jr
 FORGE PRESENTATION NEURAL — Cinematic Launch (System Player Edition)
 ─────────────────────────────────────────────────────────────
-✅ Real-time ElevenLabs narration
+✅ Real-time ElevenLabs narration (shared voice cache)
 ✅ Rocket video cinematic via system player (no MoviePy)
 ✅ Auto summary + deliverable narration
 ✅ Safe UTF-8 output
 ─────────────────────────────────────────────────────────────
 """
 
-import os, json, time, hashlib, warnings, requests, sys, threading, subprocess, platform
+import os, json, time, warnings, sys, threading, subprocess, platform
 from datetime import datetime
 from glob import glob
 from colorama import init, Fore, Style
-from pydub import AudioSegment
-from pydub.playback import play
+from agentic_masters_genesis_forge_v1_crewai_project.voice_cache import narration_clip, play_pcm
 
 # ─────────────────────────────────────────────
 # 🌐 Environment Setup
@@ -35,46 +34,15 @@ VIDEO_PATH = os.path.join("assets", "rocket_launch.mp4")
 os.makedirs(ASSETS, exist_ok=True)
 os.makedirs(DELIVERABLES, exist_ok=True)
 
-ELEVEN_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-ELEVEN_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
-
-VOICE_IDS = {
-    "Adam": "Eeg4uu5XxPosS7qxJsTI",
-    "Elli": "jAiFFKFYK8uW3TnWlXah",
-    "Charlotte": "BrOny4Lkm3SsSmSNv8hv",
-    "Roger": "CwhRBWXzGAHq8TQ4Fs17"
-}
-
 # ─────────────────────────────────────────────
 # 🔊 ElevenLabs Narration Utility
 # ─────────────────────────────────────────────
 def speak(agent, text, pause_after=0.8):
     """Generate, cache, and play speech for a given agent."""
-    voice_id = VOICE_IDS.get(agent, VOICE_IDS["Adam"])
-    hashed = hashlib.md5(text.encode()).hexdigest()[:8]
-    base = os.path.join(ASSETS, f"{agent.lower()}_{hashed}")
-    wav_file = f"{base}.wav"
-    mp3_file = f"{base}.mp3"
-
     try:
-        if ELEVEN_API_KEY and not os.path.exists(wav_file):
-            headers = {
-                "xi-api-key": ELEVEN_API_KEY,
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json"
-            }
-            payload = {"text": text, "model_id": "eleven_multilingual_v2"}
-            r = requests.post(ELEVEN_URL.format(voice_id=voice_id),
-                              headers=headers, json=payload, stream=True, timeout=20)
-            if r.ok:
-                with open(mp3_file, "wb") as f:
-                    for chunk in r.iter_content(4096):
-                        f.write(chunk)
-                AudioSegment.from_mp3(mp3_file).export(wav_file, format="wav")
-                os.remove(mp3_file)
-
-        if os.path.exists(wav_file):
-            play(AudioSegment.from_wav(wav_file))
+        clip = narration_clip(agent, text, ASSETS)
+        if clip:
+            play_pcm(clip)
         else:
             print(Fore.YELLOW + f"⚠️ Missing cached voice for {agent}")
         time.sleep(pause_after)
@@ -6,7 +6,7 @@ FORGE SYSTEM LAUNCH — Cinematic Neural Orchestration
 ───────────────────────────────────────────────────────────────
 ✅ Rebuilds manifest if missing
 ✅ Launches forge_master_runner + forge_presentation_neural with sync
-✅ Cinematic terminal + ElevenLabs narration
+✅ Cinematic terminal + ElevenLabs narration (shared voice cache)
 ✅ Logs full launch telemetry
 ───────────────────────────────────────────────────────────────
 """
@@ -14,9 +14,7 @@ FORGE SYSTEM LAUNCH — Cinematic Neural Orchestration
 import os, json, subprocess, time, threading, sys
 from datetime import datetime
 from colorama import Fore, Style, init
-from pydub import AudioSegment
-from pydub.playback import play
-import requests, hashlib
+from agentic_masters_genesis_forge_v1_crewai_project.voice_cache import narration_clip, play_pcm, get_cache
 
 if sys.platform.startswith("win"):
     import io, sys
@@ -39,38 +37,22 @@ PRESENTATION = os.path.join(FORGE_DIR, "forge_presentation_neural.py")
 os.makedirs(ASSETS, exist_ok=True)
 os.makedirs(DELIVERABLES, exist_ok=True)
 
-ELEVEN_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-ELEVEN_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
-
-VOICE_IDS = {
-    "Adam": "Eeg4uu5XxPosS7qxJsTI",
-    "Elli": "jAiFFKFYK8uW3TnWlXah",
-    "Charlotte": "BrOny4Lkm3SsSmSNv8hv",
-    "Roger": "CwhRBWXzGAHq8TQ4Fs17"
-}
+# Fixed narration lines, prefetched into the voice cache at launch
+LAUNCH_PHRASES = [
+    ("Adam", "Commencing Realms to Riches neural system activation sequence."),
+    ("Roger", "Neural Forge environment verified and ready."),
+    ("Adam", "Initializing Forge synthesis cycle."),
+    ("Elli", "No deliverables were found. System integrity under review."),
+    ("Adam", "Realms to Riches Forge complete. Public neural relay broadcast initialized."),
+    ("Charlotte", "Neural Presentation sequence now beginning."),
+]
 
 # ─────────────────────────────────────────────
 # 🎧 Narration Utility
 # ─────────────────────────────────────────────
 def speak(agent, text, pause=0.6):
-    voice_id = VOICE_IDS.get(agent, VOICE_IDS["Adam"])
-    hash_id = hashlib.md5(text.encode()).hexdigest()[:8]
-    base = os.path.join(ASSETS, f"{agent.lower()}_{hash_id}")
-    wav_file, mp3_file = f"{base}.wav", f"{base}.mp3"
-
     try:
-        if ELEVEN_API_KEY and not os.path.exists(wav_file):
-            headers = {"xi-api-key": ELEVEN_API_KEY, "Accept": "audio/mpeg", "Content-Type": "application/json"}
-            payload = {"text": text, "model_id": "eleven_multilingual_v2"}
-            r = requests.post(ELEVEN_URL.format(voice_id=voice_id), headers=headers, json=payload, stream=True, timeout=15)
-            if r.ok:
-                with open(mp3_file, "wb") as f:
-                    for chunk in r.iter_content(4096):
-                        f.write(chunk)
-                AudioSegment.from_mp3(mp3_file).export(wav_file, format="wav")
-                os.remove(mp3_file)
-        if os.path.exists(wav_file):
-            play(AudioSegment.from_wav(wav_file))
+        play_pcm(narration_clip(agent, text, ASSETS))
         time.sleep(pause)
     except Exception as e:
         print(Fore.YELLOW + f"⚠️ Voice synthesis skipped ({agent}): {e}")
@@ -158,6 +140,7 @@ def finalize():
 def main():
     divider()
     log("🌐 Neural Forge System Launch Initiated...", Fore.CYAN, Style.BRIGHT)
+    get_cache(ASSETS).prefetch(LAUNCH_PHRASES)
     speak("Adam", "Commencing Realms to Riches neural system activation sequence.")
     verify_environment()
     run_master()
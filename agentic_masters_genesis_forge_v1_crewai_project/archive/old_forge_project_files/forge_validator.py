@@ -4,6 +4,7 @@
 """
 import os, json, datetime
 from colorama import Fore, Style
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_feed import FeedReader, feed_covers
 
 def validate_forge_output(deliverables_path="deliverables"):
     print(Fore.CYAN + f"🔎 Validating deliverables in: {deliverables_path}")
@@ -11,23 +12,41 @@ def validate_forge_output(deliverables_path="deliverables"):
         print(Fore.RED + "❌ Deliverables folder missing.")
         return {"status": "failed"}
 
-    files = [f for f in os.listdir(deliverables_path)
-             if f.endswith((".md", ".json", ".txt"))]
-    if not files:
+    manifest = os.path.join(deliverables_path, "validation_manifest.json")
+    # both branches report the same set: existing top-level deliverables, minus the manifest itself
+    wanted = lambda f: (f.endswith((".md", ".json", ".txt")) and os.sep not in f and "/" not in f
+                        and f != os.path.basename(manifest))
+    if feed_covers(deliverables_path):
+        # Change feed (kept complete by a live watcher): start from the previous manifest and apply only new events
+        reader = FeedReader("validator", deliverables_path)
+        sizes = {}
+        if not reader.fresh and os.path.exists(manifest):
+            with open(manifest, encoding="utf-8") as fh:
+                sizes = {r["file"]: r["size"] for r in json.load(fh)}
+        for event in reader.read_new():
+            if event.get("event") == "deleted":
+                sizes.pop(event["path"], None)
+            elif wanted(event["path"]):
+                sizes[event["path"]] = event["size"]
+        reader.commit()
+        sizes = {f: s for f, s in sizes.items() if wanted(f) and os.path.isfile(os.path.join(deliverables_path, f))}
+    else:
+        sizes = {f: os.path.getsize(os.path.join(deliverables_path, f))
+                 for f in os.listdir(deliverables_path)
+                 if wanted(f) and os.path.isfile(os.path.join(deliverables_path, f))}
+    if not sizes:
         print(Fore.YELLOW + "⚠️ No deliverables detected.")
         return {"status": "empty"}
 
     report = []
-    for f in files:
-        path = os.path.join(deliverables_path, f)
-        size = os.path.getsize(path)
+    for f, size in sizes.items():
         if size == 0:
             print(Fore.YELLOW + f"⚠️ Empty file: {f}")
         else:
             print(Fore.GREEN + f"✅ {f} — {size} bytes")
         report.append({"file": f, "size": size})
 
-    manifest = os.path.join(deliverables_path, "validation_manifest.json")
-    json.dump(report, open(manifest, "w", encoding="utf-8"), indent=2)
+    with open(manifest, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
     print(Fore.CYAN + Style.BRIGHT + "📜 Validation complete.")
     return {"status": "complete", "files": len(report)}
\ No newline at end of file
@@ -10,8 +10,6 @@ CEO-level AI consciousness guiding the Forge.
 
 import os, sys, json, re, time, subprocess, datetime, threading, queue, hashlib, requests
 from colorama import Fore, Style, init
-from pydub import AudioSegment
-from pydub.playback import play
 
 # Local import layer
 ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -19,7 +17,8 @@ PARENT = os.path.dirname(ROOT)
 for p in (ROOT, PARENT):
     if p not in sys.path: sys.path.insert(0, p)
 
-from forge_comm_hub import post_message, fetch_messages, reply_to_message
+from forge_comm_hub import post_message, broadcast_message, fetch_messages, reply_to_message, GLOBAL_TOPIC
+from agentic_masters_genesis_forge_v1_crewai_project.voice_cache import narration_clip, play_pcm
 
 init(autoreset=True)
 
@@ -27,27 +26,16 @@ init(autoreset=True)
 CYAN = "\033[38;2;0;255;255m"
 PINK = "\033[38;2;255;105;180m"
 
-ELEVEN_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-ELEVEN_URL = "https://api.elevenlabs.io/v1/text-to-speech/Eeg4uu5XxPosS7qxJsTI/stream"
 VOICE_PATH = os.path.join(ROOT, "voices")
 os.makedirs(VOICE_PATH, exist_ok=True)
 
 def adam_speak(text):
-    """Use ElevenLabs to speak Adam’s voice."""
+    """Use ElevenLabs to speak Adam’s voice (cached)."""
     try:
-        hash_id = hashlib.md5(text.encode()).hexdigest()[:8]
-        wav_path = os.path.join(VOICE_PATH, f"adam_{hash_id}.wav")
-        mp3_path = os.path.join(VOICE_PATH, f"adam_{hash_id}.mp3")
-        if not os.path.exists(wav_path) and ELEVEN_API_KEY:
-            headers = {"xi-api-key": ELEVEN_API_KEY, "Accept": "audio/mpeg", "Content-Type": "application/json"}
-            payload = {"text": text, "model_id": "eleven_multilingual_v2"}
-            r = requests.post(ELEVEN_URL, headers=headers, json=payload, stream=True, timeout=15)
-            if r.ok:
-                with open(mp3_path, "wb") as f:
-                    for chunk in r.iter_content(4096): f.write(chunk)
-                AudioSegment.from_mp3(mp3_path).export(wav_path, format="wav")
-                os.remove(mp3_path)
-        play(AudioSegment.from_wav(wav_path))
+        clip = narration_clip("Adam", text, VOICE_PATH)
+        if clip is None:
+            raise RuntimeError("no voice clip")
+        play_pcm(clip)
     except Exception:
         print(PINK + f"🔊 [ADAM VOICE] {text}")
 
@@ -116,7 +104,11 @@ class OrchestratorAgent:
         msg = re.search(r"to \w+ (.+)", text)
         target = target.group(1) if target else "forge_team"
         msg = msg.group(1) if msg else text
-        post_message("orchestrator", target, msg)
+        if target in ("forge_team", "all", "everyone"):
+            target = GLOBAL_TOPIC
+            broadcast_message("orchestrator", target, msg)
+        else:
+            post_message("orchestrator", target, msg)
         self.log(f"📨 Message sent to {target}: {msg}", PINK)
         adam_speak(f"Instruction transmitted to {target}")
 
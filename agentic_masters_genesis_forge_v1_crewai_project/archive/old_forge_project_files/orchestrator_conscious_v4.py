@@ -19,10 +19,8 @@ import time
 import requests
 import speech_recognition as sr
 from colorama import init, Fore, Style
-from pydub import AudioSegment
-from pydub.playback import play
-import hashlib
 import pyttsx3
+from agentic_masters_genesis_forge_v1_crewai_project.voice_cache import get_cache, get_backend, play_pcm
 tts_engine = pyttsx3.init()
 
 # ─────────────────────────────────────────────
@@ -38,8 +36,6 @@ ASSETS = os.path.join(ROOT, "assets", "voices")
 os.makedirs(ASSETS, exist_ok=True)
 
 # voice setup
-ELEVEN_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-ELEVEN_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
 VOICE_ID = "Eeg4uu5XxPosS7qxJsTI"  # Adam
 
 # context
@@ -55,31 +51,11 @@ print(PINK + "💬 Adam: Standing by for your command, Commander.\n")
 # ─────────────────────────────────────────────
 def speak(text: str):
     print(PINK + f"💬 Adam: {text}")
-    if not ELEVEN_API_KEY:
-        tts_engine.say(text)
-        tts_engine.runAndWait()
-        return
-
-    hashname = hashlib.md5(text.encode()).hexdigest()[:8]
-    wav_file = os.path.join(ASSETS, f"adam_{hashname}.wav")
-    mp3_file = os.path.join(ASSETS, f"adam_{hashname}.mp3")
-
     try:
-        if not os.path.exists(wav_file):
-            headers = {
-                "xi-api-key": ELEVEN_API_KEY,
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json"
-            }
-            payload = {"text": text, "model_id": "eleven_multilingual_v2"}
-            r = requests.post(ELEVEN_URL.format(voice_id=VOICE_ID), headers=headers, json=payload, stream=True)
-            if r.ok:
-                with open(mp3_file, "wb") as f:
-                    for chunk in r.iter_content(4096):
-                        f.write(chunk)
-                AudioSegment.from_mp3(mp3_file).export(wav_file, format="wav")
-                os.remove(mp3_file)
-        play(AudioSegment.from_wav(wav_file))
+        clip = get_cache(ASSETS).clip(VOICE_ID, text, label="Adam", synth=get_backend())
+        if clip is None:
+            raise RuntimeError("no voice clip")
+        play_pcm(clip)
     except Exception:
         tts_engine.say(text)
         tts_engine.runAndWait()
@@ -22,34 +22,17 @@ try:
 except ImportError:
     print(Fore.RED + "⚠️ Required speech packages missing. Run: pip install pyttsx3 SpeechRecognition requests colorama")
 
-ELEVEN_API_KEY = os.getenv("ELEVENLABS_API_KEY")
+from agentic_masters_genesis_forge_v1_crewai_project.voice_cache import narration_clip, play_pcm, speak_locally
 
 def speak(text):
     try:
-        if ELEVEN_API_KEY:
-            r = requests.post(
-                "https://api.elevenlabs.io/v1/text-to-speech/Eeg4uu5XxPosS7qxJsTI/stream",
-                headers={
-                    "xi-api-key": ELEVEN_API_KEY,
-                    "Accept": "audio/mpeg",
-                    "Content-Type": "application/json"
-                },
-                json={"text": text, "model_id": "eleven_multilingual_v2"}
-            )
-            if r.ok:
-                import io
-                from pydub import AudioSegment
-                from pydub.playback import play
-                sound = AudioSegment.from_file(io.BytesIO(r.content), format="mp3")
-                play(sound)
-            else:
-                raise RuntimeError("ElevenLabs request failed")
+        clip = narration_clip("Adam", text)  # FORGE_TTS_BACKEND; ElevenLabs returns None without a key
+        if clip:
+            play_pcm(clip)
         else:
-            raise ValueError("Missing ElevenLabs key")
+            raise RuntimeError("Voice synthesis unavailable")
     except Exception:
-        engine = pyttsx3.init()
-        engine.say(text)
-        engine.runAndWait()
+        speak_locally(text)
 
 def diagnose_forge():
     speak("Initiating forge diagnostics.")
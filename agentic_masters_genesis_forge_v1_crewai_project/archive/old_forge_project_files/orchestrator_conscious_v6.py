@@ -11,31 +11,21 @@
 
 import os, sys, json, time, subprocess, threading, requests
 from colorama import Fore, Style, init
+from agentic_masters_genesis_forge_v1_crewai_project.voice_cache import narration_clip, play_pcm, speak_locally
 init(autoreset=True)
 
 # ─────────────────────────────────────────────
 # 🔊 Speech Utilities
 # ─────────────────────────────────────────────
 def speak(text, agent="Adam"):
-    key = os.getenv("ELEVENLABS_API_KEY", "").strip()
-    if key:
-        try:
-            r = requests.post(
-                "https://api.elevenlabs.io/v1/text-to-speech/Eeg4uu5XxPosS7qxJsTI/stream",
-                headers={"xi-api-key": key, "Accept": "audio/mpeg",
-                         "Content-Type": "application/json"},
-                json={"text": text, "model_id": "eleven_multilingual_v2"},
-                timeout=15
-            )
-            if r.ok:
-                import io; from pydub import AudioSegment; from pydub.playback import play
-                sound = AudioSegment.from_file(io.BytesIO(r.content), format="mp3")
-                play(sound); return
-        except Exception:
-            pass
+    try:
+        clip = narration_clip(agent, text)
+        if clip:
+            play_pcm(clip); return
+    except Exception:
+        pass
     # fallback
-    import pyttsx3
-    e = pyttsx3.init(); e.say(text); e.runAndWait()
+    speak_locally(text)
 
 # ─────────────────────────────────────────────
 def run_forge():
@@ -4,64 +4,53 @@
 💎 Realms to Riches | Agentic Master Forge™ 2025 Robert Demotto Jr
 PERFORMANCE OVERDRIVE — Cinematic Runtime Accelerator
 ────────────────────────────────────────────────────────────────────
-✅ ElevenLabs MP3→WAV conversion with cache
+✅ ElevenLabs narration via the shared voice cache (prefetched)
 ✅ Visual shimmer + launch animation
 ✅ Stable voice playback with error resilience
+✅ Cycle narration queued on a background narrator
 ✅ Runtime mode selector
 ✅ pydantic_core safety patch
 ────────────────────────────────────────────────────────────────────
 """
 
-import os, sys, time, random, hashlib, requests, shutil
+import os, sys, time, random, shutil
 from colorama import init, Fore, Style
-import simpleaudio as sa
-from pydub import AudioSegment
+from agentic_masters_genesis_forge_v1_crewai_project.voice_cache import narration_clip, play_pcm, get_cache
+from agentic_masters_genesis_forge_v1_crewai_project.narrator import Narrator
 
 init(autoreset=True)
 
 # ─────────────────────────────────────────────
 # 🔐 ElevenLabs Configuration
 # ─────────────────────────────────────────────
-ELEVEN_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-ELEVEN_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
 ASSETS = os.path.join("assets", "voices")
 os.makedirs(ASSETS, exist_ok=True)
 
-VOICE_IDS = {
-    "Adam": "Eeg4uu5XxPosS7qxJsTI",
-    "Elli": "jAiFFKFYK8uW3TnWlXah",
-    "Charlotte": "BrOny4Lkm3SsSmSNv8hv",
-    "Roger": "CwhRBWXzGAHq8TQ4Fs17"
-}
-
 # ─────────────────────────────────────────────
 # 🎧 Voice Engine
 # ─────────────────────────────────────────────
 def holographic_voice(agent, text, pause_after=0.8):
-    """Stable ElevenLabs TTS playback with caching + conversion."""
-    voice_id = VOICE_IDS.get(agent, VOICE_IDS["Adam"])
-    h = hashlib.md5(text.encode()).hexdigest()[:8]
-    mp3_file, wav_file = os.path.join(ASSETS, f"{agent}_{h}.mp3"), os.path.join(ASSETS, f"{agent}_{h}.wav")
-
+    """Stable ElevenLabs TTS playback from the shared voice cache (in-memory PCM)."""
     try:
-        if ELEVEN_API_KEY and not os.path.exists(wav_file):
-            headers = {"xi-api-key": ELEVEN_API_KEY, "Accept": "audio/mpeg", "Content-Type": "application/json"}
-            payload = {"text": text, "model_id": "eleven_multilingual_v2"}
-            r = requests.post(ELEVEN_URL.format(voice_id=voice_id), headers=headers, json=payload, stream=True, timeout=20)
-            if r.ok:
-                with open(mp3_file, "wb") as f:
-                    for chunk in r.iter_content(4096):
-                        f.write(chunk)
-                AudioSegment.from_mp3(mp3_file).export(wav_file, format="wav")
-                os.remove(mp3_file)
-        file = wav_file if os.path.exists(wav_file) else None
-        if file:
-            wave_obj = sa.WaveObject.from_wave_file(file)
-            wave_obj.play().wait_done()
+        clip = narration_clip(agent, text, ASSETS)
+        if clip:
+            play_pcm(clip)
             time.sleep(pause_after)
     except Exception as e:
         print(Fore.YELLOW + f"⚠️ Playback skipped ({agent}): {e}")
 
+# Cycle lines older than CYCLE_LINE_LAG seconds when their turn comes are dropped
+CYCLE_LINE_LAG = 6.0
+_NARRATOR = None
+
+def get_narrator():
+    """Shared narrator, created (with its worker threads) on first use rather than at import."""
+    global _NARRATOR
+    if _NARRATOR is None:
+        _NARRATOR = Narrator(lambda agent, text: narration_clip(agent, text, ASSETS),
+                             lambda clip, agent, text: play_pcm(clip))
+    return _NARRATOR
+
 # ─────────────────────────────────────────────
 # ⚙️ Modes
 # ─────────────────────────────────────────────
@@ -105,7 +94,8 @@ class ForgeDisplay:
         print(f"{Fore.MAGENTA}{Style.BRIGHT}\n🚀 FORGE CYCLE {n}: {phase}{Style.RESET_ALL}")
         if self.mode == "OVERDRIVE":
             self.shimmer("⚡ Powering Up Neural Forge Reactor...", 2.5)
-            holographic_voice("Roger", f"Cycle {n}: {phase} initialized successfully.")
+            get_narrator().say("Roger", f"Cycle {n}: {phase} initialized successfully.",
+                               pause_after=0.8, max_lag=CYCLE_LINE_LAG)
 
 # ─────────────────────────────────────────────
 # 🧩 pydantic_core Recovery
@@ -119,19 +109,30 @@ except ModuleNotFoundError:
 # ─────────────────────────────────────────────
 # 🧠 MAIN
 # ─────────────────────────────────────────────
+OVERDRIVE_PHASES = [
+    "Language Genesis", "Compiler Architecture", "Neural Core Activation",
+    "Optimization Streamlining", "Validation Sequence"
+]
+
+def known_phrases():
+    return [("Adam", "Welcome back to the Realms to Riches Forge System."),
+            ("Charlotte", "Activating performance overdrive mode.")] + \
+           [("Roger", f"Cycle {n}: {phase} initialized successfully.")
+            for n, phase in enumerate(OVERDRIVE_PHASES, start=1)] + \
+           [("Elli", "Performance diagnostics complete. All systems stable.")]
+
 def main():
+    get_cache(ASSETS).prefetch(known_phrases())
     disp = ForgeDisplay("OVERDRIVE")
     disp.clear()
     disp.banner()
     holographic_voice("Charlotte", "Activating performance overdrive mode.")
-    for i, phase in enumerate([
-        "Language Genesis", "Compiler Architecture", "Neural Core Activation",
-        "Optimization Streamlining", "Validation Sequence"
-    ], start=1):
+    for i, phase in enumerate(OVERDRIVE_PHASES, start=1):
         disp.render_cycle(i, phase)
         time.sleep(1.0)
-    holographic_voice("Elli", "Performance diagnostics complete. All systems stable.")
+    get_narrator().say("Elli", "Performance diagnostics complete. All systems stable.", pause_after=0.8)
     print(Fore.GREEN + "\n✅ Overdrive performance systems calibrated.\n")
+    get_narrator().close(timeout=30)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,13 +1,13 @@
 import os, time
 from colorama import Fore, Style, init
-from forge_comm_hub_v3 import post, reply, listen
+from forge_comm_hub_v3 import post, reply, listen, unlisten, GLOBAL_TOPIC
 
 init(autoreset=True)
 
 class ReactiveAgent:
-    def __init__(self, name):
+    def __init__(self, name, topics=()):
         self.name = name
-        listen(name, self.on_message)
+        listen(name, self.on_message, topics=(GLOBAL_TOPIC, *topics))
 
     def log(self,msg,color=Fore.CYAN):
         print(color+f"[{self.name}] {msg}"+Style.RESET_ALL)
@@ -19,3 +19,6 @@ class ReactiveAgent:
         self.log(f"💬 Replied: {response}",Fore.GREEN)
 
     def respond(self,text): raise NotImplementedError
+
+    def stop(self):
+        unlisten(self.name)
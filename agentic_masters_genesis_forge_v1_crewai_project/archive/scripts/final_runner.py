@@ -4,6 +4,7 @@ import os
 import json
 from datetime import datetime
 import re
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_store import get_store, content_hash
 
 class OptimizedGenesisForgeCrew:
     def __init__(self):
@@ -30,6 +31,7 @@ class OptimizedGenesisForgeCrew:
         self.rate_limit_delay = 90 # 1.5m after rate limit (unlikely now!)
         
         os.makedirs(self.deliverables_dir, exist_ok=True)
+        self.store = get_store(self.deliverables_dir)
         self.load_progress()
     
     def load_progress(self):
@@ -58,16 +60,20 @@ class OptimizedGenesisForgeCrew:
             if matches:
                 deliverable = matches[-1].strip()
                 if deliverable and len(deliverable) > 150:
-                    timestamp = datetime.now().strftime('%H%M%S')
-                    filename = f"{self.deliverables_dir}/{task_name}_{timestamp}.md"
-                    with open(filename, 'w', encoding='utf-8', errors='ignore') as f:
-                        f.write(f"# {task_name.replace('_', ' ').title()}\n")
-                        f.write(f"**Genesis Forge Project Deliverable**\n\n")
-                        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                        f.write(f"Task: {task_name}\n\n")
-                        f.write("---\n\n")
-                        f.write(deliverable)
-                    print(f"💾 SAVED: {filename}")
+                    name = f"{task_name}_{content_hash(deliverable)[:12]}.md"
+                    entry, _ = self.store.put(deliverable, task=task_name, name=name)
+                    filename = f"{self.deliverables_dir}/{entry['name']}"
+                    header = (
+                        f"# {task_name.replace('_', ' ').title()}\n"
+                        f"**Genesis Forge Project Deliverable**\n\n"
+                        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                        f"Task: {task_name}\n\n"
+                        "---\n\n"
+                    )
+                    if self.store.export(entry, filename, header):
+                        print(f"💾 SAVED: {filename}")
+                    else:
+                        print(f"♻️  UNCHANGED: {filename}")
                     return True
         return False
     
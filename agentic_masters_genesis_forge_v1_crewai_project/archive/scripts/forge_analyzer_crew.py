@@ -10,8 +10,13 @@ import os, json, re, time
 from datetime import datetime
 from colorama import init, Fore, Style
 from glob import glob
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_store import get_store, has_index
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_analyzer import analyze, AnalysisCache
 init(autoreset=True)
 
+RELATED_LINKS = 3
+RELATED_LIMIT = 10000  # all-pairs similarity beyond this is left to on-demand queries
+
 # ------------------ UTILS ------------------
 
 def log(msg, color=Fore.CYAN, style=Style.BRIGHT):
@@ -36,65 +41,73 @@ def banner():
 
 class ForgeAnalyzerCrew:
     def __init__(self):
-        self.deliverables = sorted(glob("deliverables/*.md"))
+        # the directory listing stays authoritative: crew outputs and fallback files don't go
+        # through the store; the store index adds what it exported into run directories
+        found = {os.path.normpath(p) for p in glob("deliverables/*.md")}
+        if has_index("deliverables"):
+            found.update(os.path.normpath(p) for p in get_store("deliverables").files() if p.endswith(".md"))
+        self.deliverables = sorted(found)
         self.report_file = "deliverables/Forge_Intelligence_Map.md"
-        self.dataset_file = "deliverables/Forge_Training_Dataset.json"
+        self.dataset_file = "deliverables/Forge_Training_Dataset.jsonl"
+        self.cache = AnalysisCache()
         self.dependency_graph = {}
         self.summary = []
+        self.index = None
 
     def scan_deliverables(self):
         log("🧠 Scanning deliverables for intelligence mapping...", Fore.CYAN)
-        for path in self.deliverables:
-            with open(path, encoding="utf-8") as f:
-                text = f.read()
-            title = re.search(r"# (.*?)\n", text)
-            title = title.group(1).strip() if title else os.path.basename(path)
-            codes = re.findall(r"```(.*?)```", text, re.DOTALL)
-            links = re.findall(r"\b(memory|compiler|agent|security|dsl|vr|diagnose)\b", text, re.I)
-            node = {
-                "file": os.path.basename(path),
-                "title": title,
-                "length": len(text),
-                "codes": len(codes),
-                "dependencies": sorted(set(links))
-            }
-            self.summary.append(node)
-            for dep in node["dependencies"]:
-                self.dependency_graph.setdefault(dep.lower(), []).append(title)
-        log(f"✅ {len(self.summary)} deliverables indexed.")
+        # one read per file: the training dataset is streamed out by the same pass
+        analysis = analyze(self.deliverables, dataset_path=self.dataset_file, cache=self.cache)
+        self.summary = analysis.summary
+        self.dependency_graph = analysis.dependency_graph
+        self.index = analysis.index
+        log(f"✅ {len(self.summary)} deliverables indexed ({analysis.analyzed} analyzed, {analysis.reused} cached).")
+
+    def mentions(self, query):
+        """Deliverable titles that mention a dependency term or phrase, from the term index."""
+        titles = {item["file"]: item["title"] for item in self.summary}
+        return [titles[doc] for doc in self.index.mentions(query)]
+
+    def related(self, k=RELATED_LINKS):
+        """file -> [(title, score)] of the k most similar other deliverables. Needs NumPy."""
+        from agentic_masters_genesis_forge_v1_crewai_project.similarity_index import SimilarityIndex
+        with open(self.dataset_file, encoding="utf-8") as f:
+            records = ((item["file"], json.loads(line)["text"]) for item, line in zip(self.summary, f))
+            index = SimilarityIndex().build(records)
+        titles = {item["file"]: item["title"] for item in self.summary}
+        return {key: [(titles[other], score) for other, score in row if score > 0]
+                for key, row in zip(index.keys, index.related(k))}
 
     def render_graph(self):
         log("\n🌐 Building dependency map...", Fore.YELLOW)
-        lines = ["# 🧩 Forge Intelligence Map\n\n## Dependency Network\n"]
-        for dep, targets in self.dependency_graph.items():
-            lines.append(f"### 🔗 {dep.title()} connects:")
-            for t in targets:
-                lines.append(f"- {t}")
-            lines.append("")
-        lines.append("\n---\n## Deliverable Details\n")
-        for item in self.summary:
-            lines.append(f"### {item['title']}")
-            lines.append(f"- File: `{item['file']}`")
-            lines.append(f"- Length: {item['length']} chars")
-            lines.append(f"- Code Blocks: {item['codes']}")
-            lines.append(f"- Dependencies: {', '.join(item['dependencies']) or 'None'}\n")
+        related = {}
+        if len(self.summary) <= RELATED_LIMIT:
+            try:
+                related = self.related()
+            except ImportError:
+                log("⚠️ NumPy not installed - skipping related-deliverable links.", Fore.YELLOW)
         with open(self.report_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+            f.write("# 🧩 Forge Intelligence Map\n\n## Dependency Network\n\n")
+            for dep, targets in self.dependency_graph.items():
+                f.write(f"### 🔗 {dep.title()} connects:\n")
+                f.writelines(f"- {t}\n" for t in targets)
+                f.write("\n")
+            f.write("\n---\n## Deliverable Details\n\n")
+            for item in self.summary:
+                f.write(f"### {item['title']}\n")
+                f.write(f"- File: `{item['file']}`\n")
+                f.write(f"- Length: {item['length']} chars\n")
+                f.write(f"- Code Blocks: {item['codes']}\n")
+                f.write(f"- Dependencies: {', '.join(item['dependencies']) or 'None'}\n")
+                if related.get(item["file"]):
+                    f.write(f"- Related: {', '.join(t for t, _ in related[item['file']])}\n")
+                f.write("\n")
         log(f"📜 Intelligence Map -> {self.report_file}", Fore.GREEN)
 
     def create_training_dataset(self):
         log("🧬 Compiling AI training dataset...", Fore.CYAN)
-        dataset = []
-        for item in self.summary:
-            with open(f"deliverables/{item['file']}", encoding="utf-8") as f:
-                content = f.read()
-            dataset.append({
-                "title": item["title"],
-                "text": content,
-                "dependencies": item["dependencies"]
-            })
-        with open(self.dataset_file, "w", encoding="utf-8") as f:
-            json.dump(dataset, f, indent=2)
+        if not os.path.exists(self.dataset_file):
+            analyze(self.deliverables, dataset_path=self.dataset_file, cache=self.cache)
         log(f"🧠 Dataset ready -> {self.dataset_file}", Fore.GREEN)
 
     def holographic_summary(self):
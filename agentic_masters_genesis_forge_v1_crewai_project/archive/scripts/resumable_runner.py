@@ -4,6 +4,7 @@ import os
 import json
 from datetime import datetime
 import re
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_store import get_store, content_hash
 
 class ResumableGenesisForgeCrew:
     def __init__(self):
@@ -25,6 +26,7 @@ class ResumableGenesisForgeCrew:
         }
         
         os.makedirs(self.deliverables_dir, exist_ok=True)
+        self.store = get_store(self.deliverables_dir)
         self.load_progress()
     
     def load_progress(self):
@@ -53,14 +55,17 @@ class ResumableGenesisForgeCrew:
             if matches:
                 deliverable = matches[-1].strip()
                 if deliverable and len(deliverable) > 100:
-                    # Save deliverable
-                    timestamp = datetime.now().strftime('%H%M%S')
-                    filename = f"{self.deliverables_dir}/{task_name}_{timestamp}.md"
-                    with open(filename, 'w', encoding='utf-8', errors='ignore') as f:
-                        f.write(f"# {task_name.replace('_', ' ').title()}\n\n")
-                        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                        f.write(deliverable)
-                    print(f"💾 Saved deliverable: {filename}")
+                    name = f"{task_name}_{content_hash(deliverable)[:12]}.md"
+                    entry, _ = self.store.put(deliverable, task=task_name, name=name)
+                    filename = f"{self.deliverables_dir}/{entry['name']}"
+                    header = (
+                        f"# {task_name.replace('_', ' ').title()}\n\n"
+                        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                    )
+                    if self.store.export(entry, filename, header):
+                        print(f"💾 Saved deliverable: {filename}")
+                    else:
+                        print(f"♻️  Deliverable unchanged: {filename}")
                     return True
         return False
     
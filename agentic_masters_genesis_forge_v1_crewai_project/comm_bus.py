@@ -0,0 +1,846 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Comm Bus
+─────────────────────────────────
+Low-latency agent messaging with per-recipient queues:
+ - MemoryBus: in-process, condition-variable wakeup
+ - SQLiteBus: cross-process, WAL-mode SQLite with an (recipient, status, id)
+   index; receivers are woken by a datagram on a per-recipient Unix socket
+   (short polling where Unix sockets are unavailable)
+
+Both expose post / fetch / receive / areceive / reply / register_agent.
+Posting and fetching touch only the recipient's queue, so cost per message
+does not grow with bus history.
+
+Messages carry monotonic ids and are indexed by id, recipient and status.
+Delivered and replied messages older than ARCHIVE_GRACE seconds are moved
+into compacted gzip JSONL segments; history() pages across live and
+archived messages with an after_id cursor.
+
+Broadcast topics (team:<name>, role:<name>, global): publish() stores one
+entry per broadcast and wakes every subscriber; each subscriber keeps its own
+cursor per topic and receives broadcasts through the normal fetch / receive
+path, tagged with "topic". Replying to a broadcast posts a direct message
+back to its sender.
+
+Delivery is priority-aware. Each message gets a virtual deadline: post time
+plus its class (urgent 0, high 1, normal 2, low 3) times AGING_STEP seconds.
+Queues are ordered by that deadline, so a waiting low-priority message
+eventually outranks newer chatter instead of starving. Urgent messages sit in
+their own lane: they are delivered first and are claimed even when the
+caller's per-recipient limit is exhausted.
+"""
+import os, gzip, json, time, bisect, heapq, socket, sqlite3, hashlib, asyncio, selectors, tempfile, threading
+from collections import defaultdict, deque, OrderedDict
+from datetime import datetime
+
+BACKEND = os.getenv("FORGE_BUS_BACKEND", "sqlite")
+POLL_FALLBACK = 0.05
+WAKE_SAFETY = 1.0
+ARCHIVE_GRACE = 3600
+COMPACT_EVERY = 1000
+SEGMENT_SIZE = 10000
+GLOBAL_TOPIC = "global"
+PRIORITY_CLASSES = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
+AGING_STEP = 30.0
+
+def _key(name):
+    return name.strip().lower()
+
+def _priority_class(priority):
+    return PRIORITY_CLASSES.get(str(priority).strip().lower(), PRIORITY_CLASSES["normal"])
+
+def _deadline(priority, ts=None):
+    return (ts if ts is not None else time.time()) + _priority_class(priority) * AGING_STEP
+
+def is_urgent(msg):
+    return _priority_class(msg.get("priority")) == 0
+
+def _claim(urgent, heap, broadcasts, cap):
+    """Delivery order for one recipient. Returns [(is_direct, id_or_broadcast)].
+
+    urgent: direct urgent message ids, always taken even past `cap`
+    heap: (deadline, id) heap of the other direct messages, popped in place
+    broadcasts: (deadline, msg) unread broadcasts in id order; only a prefix is
+    taken so topic cursors stay valid
+    """
+    picks = [(True, msg_id) for msg_id in urgent]
+    b = 0
+    while cap is None or len(picks) < cap:
+        if heap and (b == len(broadcasts) or heap[0][0] <= broadcasts[b][0]):
+            picks.append((True, heapq.heappop(heap)[1]))
+        elif b < len(broadcasts):
+            picks.append((False, broadcasts[b][1]))
+            b += 1
+        else:
+            break
+    while b < len(broadcasts) and is_urgent(broadcasts[b][1]):
+        picks.append((False, broadcasts[b][1]))
+        b += 1
+    return picks
+
+def team_topic(team):
+    return f"team:{_key(team)}"
+
+def role_topic(role):
+    return f"role:{_key(role)}"
+
+def _now():
+    return datetime.now().isoformat()
+
+# ------------------ ARCHIVE SEGMENTS ------------------
+
+class SegmentArchive:
+    """Immutable gzip JSONL segments of settled messages, with a recipient sidecar per segment."""
+
+    def __init__(self, directory):
+        self.dir = directory
+        self.segments = []
+        self._known = set()
+        self._cache = OrderedDict()
+        os.makedirs(directory, exist_ok=True)
+        self.refresh()
+
+    def refresh(self):
+        for name in os.listdir(self.dir):
+            if not name.endswith(".meta.json") or name in self._known:
+                continue
+            try:
+                with open(os.path.join(self.dir, name), encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self._known.add(name)
+            meta["recipients"] = set(meta["recipients"])
+            self.segments.append(meta)
+        self.segments.sort(key=lambda m: (m["first"], m["last"]))
+
+    def write(self, messages):
+        first, last = messages[0]["id"], messages[-1]["id"]
+        base = f"seg_{first:012d}_{last:012d}_{os.getpid()}"
+        data_path = os.path.join(self.dir, base + ".jsonl.gz")
+        with gzip.open(data_path + ".tmp", "wt", encoding="utf-8") as f:
+            for m in messages:
+                f.write(json.dumps(m, ensure_ascii=False) + "\n")
+        os.replace(data_path + ".tmp", data_path)
+        meta = {"file": base + ".jsonl.gz", "first": first, "last": last, "count": len(messages),
+                "recipients": sorted({_key(m["to"]) for m in messages})}
+        meta_path = os.path.join(self.dir, base + ".meta.json")
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + ".tmp", meta_path)  # segment becomes visible once its meta exists
+        self.refresh()
+
+    def _read(self, meta):
+        path = os.path.join(self.dir, meta["file"])
+        if path in self._cache:
+            self._cache.move_to_end(path)
+            return self._cache[path]
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            messages = [json.loads(line) for line in f]
+        self._cache[path] = messages
+        if len(self._cache) > 4:
+            self._cache.popitem(last=False)
+        return messages
+
+    def get(self, msg_id):
+        self.refresh()
+        for meta in self.segments:
+            if meta["first"] <= msg_id <= meta["last"]:
+                for m in self._read(meta):
+                    if m["id"] == msg_id:
+                        return m
+        return None
+
+    def page(self, recipient=None, status=None, after_id=0, limit=100):
+        self.refresh()
+        key = _key(recipient) if recipient else None
+        found = {}
+        for meta in self.segments:
+            if meta["last"] <= after_id or (key and key not in meta["recipients"]):
+                continue
+            if len(found) >= limit and meta["first"] > max(found):
+                break
+            for m in self._read(meta):
+                if m["id"] > after_id and (key is None or _key(m["to"]) == key) \
+                        and (status is None or m["status"] == status):
+                    found[m["id"]] = m
+        return [found[i] for i in sorted(found)[:limit]]
+
+def _merge_page(live, archived, limit):
+    merged = {m["id"]: m for m in archived}
+    merged.update((m["id"], m) for m in live)
+    page = [merged[i] for i in sorted(merged)[:limit]]
+    cursor = page[-1]["id"] if len(page) == limit else None
+    return page, cursor
+
+# ------------------ IN-PROCESS BACKEND ------------------
+
+class MemoryBus:
+    def __init__(self, archive_dir=None):
+        self.messages = {}
+        self.queues = defaultdict(list)
+        self.urgent = defaultdict(deque)
+        self.by_status = defaultdict(OrderedDict)
+        self.settled_at = {}
+        self.agents = {}
+        self.topics = defaultdict(list)
+        self.cursors = defaultdict(dict)
+        self.published_at = {}
+        self.next_id = 1
+        self.next_broadcast = 1
+        self.posted = 0
+        self.kicked = False
+        self.archive = SegmentArchive(archive_dir) if archive_dir else None
+        self.cond = threading.Condition()
+
+    def register_agent(self, name):
+        with self.cond:
+            self.agents[name] = {"last_seen": _now()}
+
+    def _set_status(self, msg, status):
+        self.by_status[msg["status"]].pop(msg["id"], None)
+        msg["status"] = status
+        self.by_status[status][msg["id"]] = None
+        if status != "queued":
+            self.settled_at[msg["id"]] = time.time()
+
+    def post(self, sender, recipient, text, priority="normal"):
+        with self.cond:
+            msg = {"id": self.next_id, "time": _now(), "from": sender, "to": recipient,
+                   "text": text, "priority": priority, "status": "queued"}
+            self.next_id += 1
+            self.messages[msg["id"]] = msg
+            self.by_status["queued"][msg["id"]] = None
+            if is_urgent(msg):
+                self.urgent[_key(recipient)].append(msg["id"])
+            else:
+                heapq.heappush(self.queues[_key(recipient)], (_deadline(priority), msg["id"]))
+            self.posted += 1
+            self.cond.notify_all()
+        if self.posted % COMPACT_EVERY == 0:
+            self.compact()
+        return dict(msg)
+
+    def publish(self, sender, topic, text, priority="normal"):
+        """Broadcast to every subscriber of `topic`; stored once regardless of audience size."""
+        topic = _key(topic)
+        with self.cond:
+            msg = {"id": self.next_broadcast, "time": _now(), "from": sender, "topic": topic,
+                   "text": text, "priority": priority}
+            self.next_broadcast += 1
+            self.topics[topic].append(msg)
+            self.published_at[msg["id"]] = time.time()
+            self.cond.notify_all()
+        return dict(msg)
+
+    def subscribe(self, name, topic, replay=False):
+        """Follow `topic` from now on (or from its oldest retained broadcast with replay=True)."""
+        with self.cond:
+            self.cursors[_key(name)].setdefault(_key(topic), 0 if replay else self.next_broadcast - 1)
+
+    def unsubscribe(self, name, topic=None):
+        with self.cond:
+            if topic is None:
+                self.cursors.pop(_key(name), None)
+            else:
+                self.cursors[_key(name)].pop(_key(topic), None)
+
+    def subscriptions(self, name):
+        with self.cond:
+            return sorted(self.cursors.get(_key(name), {}))
+
+    def _has_broadcasts(self, key):
+        for topic, cursor in self.cursors.get(key, {}).items():
+            log = self.topics.get(topic)
+            if log and log[-1]["id"] > cursor:
+                return True
+        return False
+
+    def _pending_broadcasts(self, key):
+        """Unread broadcasts for `key` as (deadline, msg), in id order."""
+        pending = []
+        for topic, cursor in self.cursors.get(key, {}).items():
+            log = self.topics.get(topic, [])
+            pending.extend(log[bisect.bisect_right(log, cursor, key=lambda m: m["id"]):])
+        pending.sort(key=lambda m: m["id"])
+        return [(_deadline(m["priority"], self.published_at[m["id"]]), m) for m in pending]
+
+    def _drain(self, name, limit=None):
+        key = _key(name)
+        urgent = self.urgent.pop(key, ())
+        inbox = []
+        for is_direct, item in _claim(urgent, self.queues.get(key, []), self._pending_broadcasts(key), limit):
+            if is_direct:
+                msg = self.messages[item]
+                self._set_status(msg, "delivered")
+                inbox.append(dict(msg))
+            else:
+                self.cursors[key][item["topic"]] = item["id"]  # ids only grow, so the last one taken per topic wins
+                inbox.append({**item, "to": key, "status": "delivered"})
+        return inbox
+
+    def _ready(self, key, limit=None):
+        if self.urgent.get(key):
+            return True
+        if limit is not None and limit <= 0:
+            pending = self._pending_broadcasts(key)
+            return bool(pending) and is_urgent(pending[0][1])
+        return bool(self.queues.get(key)) or self._has_broadcasts(key)
+
+    def fetch(self, name, limit=None):
+        with self.cond:
+            return self._drain(name, limit)
+
+    def receive(self, name, timeout=None):
+        """Block until at least one message is queued for `name` (or timeout)."""
+        with self.cond:
+            self.cond.wait_for(lambda: self._ready(_key(name)), timeout)
+            return self._drain(name)
+
+    def receive_any(self, names, timeout=None, limit=None):
+        """Block until any of `names` has queued messages. Returns {recipient_key: [msgs]}.
+
+        `limit` caps messages claimed per recipient (int, or callable(key) -> int);
+        urgent messages are claimed regardless.
+        """
+        keys = {_key(n) for n in names}
+        cap = limit if callable(limit) else lambda k: limit
+        with self.cond:
+            self.cond.wait_for(lambda: self.kicked or any(self._ready(k, cap(k)) for k in keys), timeout)
+            self.kicked = False
+            inboxes = {}
+            for k in keys:
+                inbox = self._drain(k, cap(k))
+                if inbox:
+                    inboxes[k] = inbox
+            return inboxes
+
+    def wakeup(self):
+        """Make a blocked receive_any() return early so its caller can re-evaluate."""
+        with self.cond:
+            self.kicked = True
+            self.cond.notify_all()
+
+    async def areceive(self, name, timeout=None):
+        return await asyncio.get_running_loop().run_in_executor(None, self.receive, name, timeout)
+
+    def reply(self, name, msg, text):
+        if msg.get("topic"):
+            return self.post(name, msg["from"], text)  # broadcasts are shared; answer the sender directly
+        with self.cond:
+            original = self.messages.get(msg["id"])
+            if original is None:
+                return None
+            original["response"] = {"from": name, "text": text, "time": _now()}
+            self._set_status(original, "replied")
+            return dict(original)
+
+    def get(self, msg_id):
+        with self.cond:
+            msg = self.messages.get(msg_id)
+            if msg:
+                return dict(msg)
+        return self.archive.get(msg_id) if self.archive else None
+
+    def count(self, status):
+        with self.cond:
+            return len(self.by_status[status])
+
+    def compact(self, grace=ARCHIVE_GRACE):
+        """Move delivered/replied messages settled more than `grace` seconds ago out of memory."""
+        cutoff = time.time() - grace
+        with self.cond:
+            settled = []
+            for status in ("delivered", "replied"):
+                for msg_id in self.by_status[status]:
+                    if self.settled_at[msg_id] > cutoff:
+                        break  # status index is ordered by settle time
+                    settled.append(msg_id)
+            settled.sort()
+            for start in range(0, len(settled), SEGMENT_SIZE):
+                batch = [self.messages[i] for i in settled[start:start + SEGMENT_SIZE]]
+                if self.archive:
+                    self.archive.write(batch)
+            for msg_id in settled:
+                msg = self.messages.pop(msg_id)
+                self.by_status[msg["status"]].pop(msg_id, None)
+                self.settled_at.pop(msg_id, None)
+            self._prune_broadcasts(cutoff)
+        return len(settled)
+
+    def _prune_broadcasts(self, cutoff):
+        """Drop broadcasts every current subscriber has read (or nobody follows) once past the grace period."""
+        floor = {}
+        for cursors in self.cursors.values():
+            for topic, cursor in cursors.items():
+                floor[topic] = min(cursor, floor.get(topic, cursor))
+        for topic, log in self.topics.items():
+            done = 0
+            for msg in log:
+                if self.published_at[msg["id"]] > cutoff or msg["id"] > floor.get(topic, msg["id"]):
+                    break
+                done += 1
+            for msg in log[:done]:
+                self.published_at.pop(msg["id"], None)
+            del log[:done]
+
+    def history(self, recipient=None, status=None, after_id=0, limit=100):
+        """Page through live and archived messages in id order. Returns (messages, next_after_id)."""
+        key = _key(recipient) if recipient else None
+        with self.cond:
+            ids = self.by_status[status].keys() if status else self.messages.keys()
+            live = [dict(self.messages[i]) for i in ids
+                    if i > after_id and (key is None or _key(self.messages[i]["to"]) == key)]
+        live.sort(key=lambda m: m["id"])
+        archived = self.archive.page(recipient, status, after_id, limit) if self.archive else []
+        return _merge_page(live[:limit], archived, limit)
+
+    def close(self):
+        pass
+
+# ------------------ CROSS-PROCESS BACKEND ------------------
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    time TEXT, sender TEXT, recipient TEXT, recipient_key TEXT,
+    text TEXT, priority TEXT, status TEXT, response TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_inbox ON messages(recipient_key, status, id);
+CREATE TABLE IF NOT EXISTS agents (name TEXT PRIMARY KEY, last_seen TEXT);
+CREATE TABLE IF NOT EXISTS broadcasts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    time TEXT, sender TEXT, topic TEXT, text TEXT, priority TEXT, created REAL
+);
+CREATE INDEX IF NOT EXISTS idx_topic ON broadcasts(topic, id);
+CREATE TABLE IF NOT EXISTS subscriptions (
+    subscriber_key TEXT, topic TEXT, cursor INTEGER,
+    PRIMARY KEY (subscriber_key, topic)
+);
+CREATE INDEX IF NOT EXISTS idx_subscribers ON subscriptions(topic);
+"""
+MIGRATIONS = {"updated": "ALTER TABLE messages ADD COLUMN updated REAL",
+              "deadline": "ALTER TABLE messages ADD COLUMN deadline REAL"}
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_settled ON messages(status, updated);
+CREATE INDEX IF NOT EXISTS idx_deadline ON messages(recipient_key, status, deadline, id);
+"""
+
+def _row(row):
+    msg = {"id": row[0], "time": row[1], "from": row[2], "to": row[3],
+           "text": row[4], "priority": row[5], "status": row[6]}
+    if row[7]:
+        msg["response"] = json.loads(row[7])
+    return msg
+
+COLUMNS = "id, time, sender, recipient, text, priority, status, response"
+
+PENDING_BROADCASTS = """
+SELECT s.subscriber_key, b.id, b.time, b.sender, b.topic, b.text, b.priority, b.created
+FROM subscriptions s JOIN broadcasts b ON b.topic = s.topic AND b.id > s.cursor
+WHERE s.subscriber_key IN ({marks})
+"""
+
+URGENT_SQL = "LOWER(TRIM(COALESCE({col}, ''))) = 'urgent'"
+
+# all urgent messages for one recipient, then at most LIMIT others by deadline
+DIRECT_BUDGETED = f"""
+SELECT * FROM (SELECT {COLUMNS}, deadline FROM messages
+               WHERE recipient_key = ? AND status = 'queued' AND {URGENT_SQL.format(col="priority")} ORDER BY deadline, id)
+UNION ALL
+SELECT * FROM (SELECT {COLUMNS}, deadline FROM messages
+               WHERE recipient_key = ? AND status = 'queued' AND NOT {URGENT_SQL.format(col="priority")} ORDER BY deadline, id LIMIT ?)
+"""
+
+def _broadcast_row(row):
+    return {"id": row[1], "time": row[2], "from": row[3], "topic": row[4], "to": row[0],
+            "text": row[5], "priority": row[6], "status": "delivered"}
+
+class _Waker:
+    """Per-recipient Unix datagram sockets used to wake blocked receivers."""
+
+    def __init__(self, db_path):
+        tag = hashlib.sha1(os.path.abspath(db_path).encode()).hexdigest()[:12]
+        self.dir = os.path.join(tempfile.gettempdir(), f"forge_bus_{tag}")
+        self.enabled = hasattr(socket, "AF_UNIX")
+        if self.enabled:
+            os.makedirs(self.dir, exist_ok=True)
+
+    def path(self, name):
+        return os.path.join(self.dir, hashlib.sha1(_key(name).encode()).hexdigest()[:16] + ".sock")
+
+    def listen(self, name):
+        """Bind the wake socket for `name`; None if unavailable or already owned by a live receiver."""
+        if not self.enabled:
+            return None
+        path = self.path(name)
+        if os.path.exists(path):
+            if self.notify(name):
+                return None
+            try:
+                os.unlink(path)
+            except OSError:
+                return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.bind(path)
+        except OSError:
+            sock.close()
+            return None
+        return sock
+
+    def notify(self, name):
+        if not self.enabled:
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.sendto(b"!", self.path(name))
+            return True
+        except OSError:
+            return False  # nobody listening, or their buffer is already full of wakeups
+        finally:
+            sock.close()
+
+    def release(self, name, sock):
+        sock.close()
+        try:
+            os.unlink(self.path(name))
+        except OSError:
+            pass
+
+class SQLiteBus:
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        columns = {r[1] for r in self.conn.execute("PRAGMA table_info(messages)")}
+        for column, ddl in MIGRATIONS.items():
+            if column not in columns:
+                self.conn.execute(ddl)
+        self.conn.executescript(INDEXES)
+        self.lock = threading.Lock()
+        self.waker = _Waker(path)
+        self.listeners = {}
+        self.selector = selectors.DefaultSelector()
+        self._kick_r, self._kick_w = socket.socketpair()
+        self._kick_r.setblocking(False)
+        self.selector.register(self._kick_r, selectors.EVENT_READ, None)
+        self.archive = SegmentArchive(path + ".segments")
+        self.posted = 0
+
+    def register_agent(self, name):
+        with self.lock:
+            self.conn.execute("INSERT OR REPLACE INTO agents VALUES (?, ?)", (name, _now()))
+
+    def post(self, sender, recipient, text, priority="normal"):
+        now, ts = _now(), time.time()
+        with self.lock:
+            cur = self.conn.execute(
+                "INSERT INTO messages (time, sender, recipient, recipient_key, text, priority, status, updated, deadline) "
+                "VALUES (?, ?, ?, ?, ?, ?, 'queued', ?, ?)",
+                (now, sender, recipient, _key(recipient), text, priority, ts, _deadline(priority, ts)))
+            msg_id = cur.lastrowid
+            self.posted += 1
+        self.waker.notify(recipient)
+        if self.posted % COMPACT_EVERY == 0:
+            self.compact()
+        return {"id": msg_id, "time": now, "from": sender, "to": recipient,
+                "text": text, "priority": priority, "status": "queued"}
+
+    def publish(self, sender, topic, text, priority="normal"):
+        """Broadcast to every subscriber of `topic` with a single row insert."""
+        topic, now = _key(topic), _now()
+        with self.lock:
+            cur = self.conn.execute(
+                "INSERT INTO broadcasts (time, sender, topic, text, priority, created) VALUES (?, ?, ?, ?, ?, ?)",
+                (now, sender, topic, text, priority, time.time()))
+            subscribers = [r[0] for r in self.conn.execute(
+                "SELECT subscriber_key FROM subscriptions WHERE topic = ?", (topic,))]
+        for key in subscribers:
+            self.waker.notify(key)
+        return {"id": cur.lastrowid, "time": now, "from": sender, "topic": topic,
+                "text": text, "priority": priority}
+
+    def subscribe(self, name, topic, replay=False):
+        """Follow `topic` from now on (or from its oldest retained broadcast with replay=True).
+
+        An existing subscription keeps its cursor, so a restarted agent resumes where it left off.
+        """
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO subscriptions VALUES (?, ?, "
+                "CASE WHEN ? THEN 0 ELSE (SELECT COALESCE(MAX(id), 0) FROM broadcasts) END)",
+                (_key(name), _key(topic), replay))
+
+    def unsubscribe(self, name, topic=None):
+        with self.lock:
+            if topic is None:
+                self.conn.execute("DELETE FROM subscriptions WHERE subscriber_key = ?", (_key(name),))
+            else:
+                self.conn.execute("DELETE FROM subscriptions WHERE subscriber_key = ? AND topic = ?",
+                                  (_key(name), _key(topic)))
+
+    def subscriptions(self, name):
+        with self.lock:
+            return [r[0] for r in self.conn.execute(
+                "SELECT topic FROM subscriptions WHERE subscriber_key = ? ORDER BY topic", (_key(name),))]
+
+    def _fetch_keys(self, keys, limit=None):
+        """Claim queued messages and unread broadcasts for several recipient keys in one transaction.
+
+        Returns {key: [msgs]} in delivery order (urgent first, then by deadline).
+        Each key reads at most its budget of non-urgent rows; keys with no budget
+        left only look for urgent ones.
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+        caps = {key: limit(key) if callable(limit) else limit for key in keys}
+        open_keys = [k for k in keys if caps[k] is None or caps[k] > 0]
+        full_keys = [k for k in keys if k not in open_keys]
+
+        with self.lock:
+            if not self._has_pending(open_keys) and not self._has_pending(full_keys, urgent_only=True):
+                return {}  # read-only fast path, no write lock for empty (or saturated) inboxes
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                claimed, cursors = {}, {}
+                for key in self._pending_keys(keys):
+                    cap = caps[key]
+                    budget = -1 if cap is None else max(0, cap)  # LIMIT -1: no limit
+                    urgent, heap, direct = [], [], {}
+                    for row in self.conn.execute(DIRECT_BUDGETED, (key, key, budget)):
+                        msg = direct[row[0]] = _row(row[:-1])
+                        if is_urgent(msg):
+                            urgent.append(row[0])
+                        else:
+                            heap.append((row[-1] or 0, row[0]))  # already sorted, so a valid heap
+                    pending = []
+                    # broadcasts are taken as an id-ordered prefix: stop at the first non-urgent one past the budget
+                    for row in self.conn.execute(PENDING_BROADCASTS.format(marks="?") + " ORDER BY b.id", (key,)):
+                        if budget >= 0 and len(pending) >= budget and _priority_class(row[6]) != 0:
+                            break
+                        pending.append((_deadline(row[6], row[7]), _broadcast_row(row)))
+                    msgs = claimed[key] = []
+                    for is_direct, item in _claim(urgent, heap, pending, cap):
+                        if is_direct:
+                            msgs.append(direct[item])
+                        else:
+                            msgs.append(item)
+                            cursors[(key, item["topic"])] = item["id"]
+                settled = time.time()
+                self.conn.executemany("UPDATE messages SET status = 'delivered', updated = ? WHERE id = ?",
+                                      [(settled, m["id"]) for msgs in claimed.values() for m in msgs
+                                       if "topic" not in m])
+                # each subscriber advances only its own cursor rows
+                self.conn.executemany("UPDATE subscriptions SET cursor = ? WHERE subscriber_key = ? AND topic = ?",
+                                      [(c, key, topic) for (key, topic), c in cursors.items()])
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        for msgs in claimed.values():
+            for msg in msgs:
+                msg["status"] = "delivered"
+        return {key: msgs for key, msgs in claimed.items() if msgs}
+
+    def _has_pending(self, keys, urgent_only=False):
+        # caller holds self.lock
+        if not keys:
+            return False
+        marks = ",".join("?" * len(keys))
+        urgent = " AND " + URGENT_SQL.format(col="priority") if urgent_only else ""
+        if self.conn.execute(f"SELECT 1 FROM messages WHERE recipient_key IN ({marks}) "
+                             f"AND status = 'queued'{urgent} LIMIT 1", keys).fetchone():
+            return True
+        urgent = " AND " + URGENT_SQL.format(col="b.priority") if urgent_only else ""
+        return self.conn.execute(PENDING_BROADCASTS.format(marks=marks) + urgent + " LIMIT 1", keys).fetchone() is not None
+
+    def _pending_keys(self, keys):
+        # caller holds self.lock; only these keys are worth a per-key claim query
+        marks = ",".join("?" * len(keys))
+        found = {r[0] for r in self.conn.execute(
+            f"SELECT DISTINCT recipient_key FROM messages WHERE recipient_key IN ({marks}) AND status = 'queued'", keys)}
+        found.update(r[0] for r in self.conn.execute(
+            f"SELECT DISTINCT s.subscriber_key FROM subscriptions s JOIN broadcasts b "
+            f"ON b.topic = s.topic AND b.id > s.cursor WHERE s.subscriber_key IN ({marks})", keys))
+        return [k for k in keys if k in found]
+
+    def fetch(self, name, limit=None):
+        return self._fetch_keys([_key(name)], limit).get(_key(name), [])
+
+    def _wake_socket(self, name):
+        key = _key(name)
+        if key not in self.listeners:
+            sock = self.waker.listen(name)
+            self.listeners[key] = sock
+            if sock is not None:
+                sock.setblocking(False)
+                self.selector.register(sock, selectors.EVENT_READ, key)
+        return self.listeners[key]
+
+    def receive_any(self, names, timeout=None, limit=None):
+        """Block until any of `names` has queued messages. Returns {recipient_key: [msgs]}.
+
+        `limit` caps messages claimed per recipient (int, or callable(key) -> int);
+        urgent messages are claimed regardless.
+        """
+        keys = {_key(n) for n in names}
+        polled = {k for k in keys if self._wake_socket(k) is None}
+        deadline = None if timeout is None else time.monotonic() + timeout
+        check = keys
+        while True:
+            inboxes = self._fetch_keys(check, limit)
+            if inboxes:
+                return inboxes
+            wait = POLL_FALLBACK if polled else WAKE_SAFETY
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return {}
+                wait = min(wait, remaining)
+            woken = set()
+            kicked = False
+            for sel_key, _ in self.selector.select(wait):
+                try:
+                    while True:  # drain coalesced wakeups
+                        sel_key.fileobj.recv(64)
+                except (BlockingIOError, OSError):
+                    pass
+                if sel_key.data is None:
+                    kicked = True
+                else:
+                    woken.add(sel_key.data)
+            if kicked:
+                return self._fetch_keys(keys, limit)
+            # only recipients we were pinged for (plus unpingable ones); full sweep on the safety timeout
+            check = (woken & keys) | polled if woken else keys
+
+    def receive(self, name, timeout=None):
+        """Block until at least one message is queued for `name` (or timeout)."""
+        while True:
+            inbox = self.receive_any([name], timeout).get(_key(name), [])
+            if inbox or timeout is not None:
+                return inbox
+
+    def wakeup(self):
+        """Make a blocked receive_any() return early so its caller can re-evaluate."""
+        try:
+            self._kick_w.send(b"!")
+        except OSError:
+            pass
+
+    async def areceive(self, name, timeout=None):
+        return await asyncio.get_running_loop().run_in_executor(None, self.receive, name, timeout)
+
+    def reply(self, name, msg, text):
+        if msg.get("topic"):
+            return self.post(name, msg["from"], text)  # broadcasts are shared; answer the sender directly
+        response = {"from": name, "text": text, "time": _now()}
+        with self.lock:
+            self.conn.execute("UPDATE messages SET status = 'replied', response = ?, updated = ? WHERE id = ?",
+                              (json.dumps(response), time.time(), msg["id"]))
+        return self.get(msg["id"])
+
+    def get(self, msg_id):
+        with self.lock:
+            row = self.conn.execute(f"SELECT {COLUMNS} FROM messages WHERE id = ?", (msg_id,)).fetchone()
+        return _row(row) if row else self.archive.get(msg_id)
+
+    def count(self, status):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM messages WHERE status = ?", (status,)).fetchone()[0]
+
+    def compact(self, grace=ARCHIVE_GRACE):
+        """Move delivered/replied messages settled more than `grace` seconds ago into archive segments."""
+        cutoff = time.time() - grace
+        with self.lock:
+            # broadcasts every current subscriber has read (or nobody follows)
+            self.conn.execute(
+                "DELETE FROM broadcasts WHERE created <= ? AND id <= COALESCE("
+                "(SELECT MIN(cursor) FROM subscriptions s WHERE s.topic = broadcasts.topic), id)", (cutoff,))
+        moved = 0
+        while True:
+            with self.lock:
+                self.conn.execute("BEGIN IMMEDIATE")
+                try:
+                    rows = self.conn.execute(
+                        f"SELECT {COLUMNS} FROM messages WHERE status IN ('delivered', 'replied') "
+                        "AND updated <= ? ORDER BY id LIMIT ?", (cutoff, SEGMENT_SIZE)).fetchall()
+                    if rows:
+                        # segment is written before the delete commits: a crash can only duplicate, never lose
+                        self.archive.write([_row(r) for r in rows])
+                        self.conn.executemany("DELETE FROM messages WHERE id = ?", [(r[0],) for r in rows])
+                    self.conn.execute("COMMIT")
+                except Exception:
+                    self.conn.execute("ROLLBACK")
+                    raise
+            moved += len(rows)
+            if len(rows) < SEGMENT_SIZE:
+                return moved
+
+    def history(self, recipient=None, status=None, after_id=0, limit=100):
+        """Page through live and archived messages in id order. Returns (messages, next_after_id)."""
+        sql, args = f"SELECT {COLUMNS} FROM messages WHERE id > ?", [after_id]
+        if recipient:
+            sql += " AND recipient_key = ?"
+            args.append(_key(recipient))
+        if status:
+            sql += " AND status = ?"
+            args.append(status)
+        with self.lock:
+            rows = self.conn.execute(sql + " ORDER BY id LIMIT ?", args + [limit]).fetchall()
+        archived = self.archive.page(recipient, status, after_id, limit)
+        return _merge_page([_row(r) for r in rows], archived, limit)
+
+    def close(self):
+        for key, sock in self.listeners.items():
+            if sock is not None:
+                self.selector.unregister(sock)
+                self.waker.release(key, sock)
+        self.listeners.clear()
+        self.selector.close()
+        self._kick_r.close()
+        self._kick_w.close()
+        self.conn.close()
+
+# ------------------ FACTORY ------------------
+
+def open_bus(path, backend=None):
+    backend = (backend or BACKEND).lower()
+    if backend == "memory":
+        return MemoryBus(path + ".segments" if path else None)
+    if backend == "sqlite":
+        return SQLiteBus(path)
+    raise ValueError(f"Unknown bus backend: {backend}")
+
+def migrate_json(bus, json_path):
+    """One-time import of still-pending messages from a legacy forge_comm_bus.json."""
+    claimed = json_path + ".migrated"
+    try:
+        os.replace(json_path, claimed)  # only one process wins the rename
+    except OSError:
+        return 0
+    try:
+        with open(claimed, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return 0
+    messages = data.get("messages", []) if isinstance(data, dict) else data
+    moved = 0
+    for m in messages:
+        if m.get("status") in ("pending", "queued"):
+            bus.post(m.get("from", "unknown"), m.get("to", ""), m.get("text", m.get("message", "")),
+                     m.get("priority", "normal"))
+            moved += 1
+    return moved
+
+def legacy_view(msg):
+    """Add the v1/v2 hub field names (timestamp, message) to a bus message."""
+    if msg is None:
+        return None
+    return {**msg, "timestamp": msg["time"], "message": msg["text"]}
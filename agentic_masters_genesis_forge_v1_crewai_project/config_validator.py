@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Config Validator
+─────────────────────────────────────────
+Checks config/agents.yaml and config/tasks.yaml in a single pass:
+ - each file is parsed once; the node tree gives line numbers, the same parse gives the data
+ - every entry is checked against compiled pydantic models (required fields, types)
+ - cross-references in the same loop: duplicate ids and names, task agents that
+   must resolve to a real agent, output.file paths under deliverables/, duplicate
+   outputs, and team labels that agree with agent ids, output dirs and task tags
+ - every problem is collected and reported as file:line, nothing stops at the first error
+
+load_config() returns the validated agents and tasks and caches them per file stamp,
+in process and in config/.validated.json, so CrewManager skips re-parsing unchanged configs.
+"""
+import os, re, sys, json, argparse
+from typing import NamedTuple, Optional
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_DIR = os.path.join(BASE_DIR, "config")
+CACHE_NAME = ".validated.json"
+CACHE_VERSION = 1
+OUTPUT_ROOT = "deliverables"
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+ID_TEAM = re.compile(r"^T(\d+)_")
+LABEL_TEAM = re.compile(r"(\d+)\s*$")
+DIR_TEAM = re.compile(r"(?:^|/)team_(\d+)(?:/|$)")
+FILE_TEAM = re.compile(r"_team(\d+)\.\w+$")
+TAG_TEAM = re.compile(r"^\[([^\]]+)\]")
+BAD_PATH_CHARS = re.compile(r'[<>:"|?*\x00-\x1f]')
+
+# ------------------ SCHEMAS ------------------
+
+class AgentConfig(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    id: str = Field(min_length=1)
+    name: str = Field(min_length=1)
+    team: str = Field(min_length=1)
+    role: str = Field(min_length=1)
+    output_dir: Optional[str] = None
+    capabilities: list[str] = []
+    tools: list[str] = []
+
+class TaskOutput(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    file: str = Field(min_length=1)
+    format: str = "markdown"
+    validation: list[str] = []
+
+class TaskConfig(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    id: Optional[str] = Field(default=None, min_length=1)
+    agent: str = Field(min_length=1)
+    title: Optional[str] = None
+    instructions: Optional[str] = None
+    output: TaskOutput
+
+class Issue(NamedTuple):
+    file: str
+    line: Optional[int]
+    message: str
+
+    def __str__(self):
+        where = f"{self.file}:{self.line}" if self.line else self.file
+        return f"{where}: {self.message}"
+
+class ConfigValidationError(ValueError):
+    def __init__(self, issues):
+        self.issues = issues
+        super().__init__(f"{len(issues)} config problem(s):\n" + "\n".join(f"  {i}" for i in issues))
+
+class ForgeConfig(NamedTuple):
+    agents: list
+    tasks: list
+    issues: list
+
+# ------------------ PARSING ------------------
+
+def _parse(path):
+    """(root node, data) from one parse of a YAML file."""
+    with open(path, "rb") as f:
+        loader = Loader(f)
+        try:
+            node = loader.get_single_node()
+            return node, (loader.construct_document(node) if node is not None else None)
+        finally:
+            loader.dispose()
+
+def _line(node, loc=()):
+    """1-based line of the deepest node along loc (mapping keys / sequence indexes)."""
+    line = node.start_mark.line + 1
+    for part in loc:
+        if isinstance(node, yaml.MappingNode):
+            for key, value in node.value:
+                if key.value == part:
+                    line, node = key.start_mark.line + 1, value
+                    break
+            else:
+                break
+        elif isinstance(node, yaml.SequenceNode) and isinstance(part, int) and part < len(node.value):
+            node = node.value[part]
+            line = node.start_mark.line + 1
+        else:
+            break
+    return line
+
+def _entries(path, key, issues):
+    """(entries, nodes) for the top-level `key` list or {id: entry} mapping of a config file."""
+    try:
+        root, data = _parse(path)
+    except OSError as e:
+        issues.append(Issue(path, None, f"cannot read file ({e.strerror})"))
+        return [], []
+    except yaml.YAMLError as e:
+        mark = getattr(e, "problem_mark", None)
+        issues.append(Issue(path, mark.line + 1 if mark else None, f"invalid YAML: {getattr(e, 'problem', e)}"))
+        return [], []
+
+    node = root
+    if isinstance(data, dict) and key in data:
+        node = next(v for k, v in root.value if k.value == key)
+        data = data[key]
+    if isinstance(data, dict):
+        return [{"id": k, **v} if isinstance(v, dict) else v for k, v in data.items()], [v for _, v in node.value]
+    if isinstance(data, list):
+        return data, node.value
+    issues.append(Issue(path, _line(root) if root else None, f"expected a list of {key} (or a top-level '{key}:' key)"))
+    return [], []
+
+def _check(model, entry, node, path, issues):
+    if not isinstance(entry, dict):
+        issues.append(Issue(path, _line(node), "entry is not a mapping"))
+        return False
+    try:
+        model.model_validate(entry)
+        return True
+    except ValidationError as e:
+        for err in e.errors():
+            loc = ".".join(str(p) for p in err["loc"])
+            issues.append(Issue(path, _line(node, err["loc"]), f"{loc}: {err['msg'].lower()}"))
+        return False
+
+def _team_number(pattern, text):
+    match = pattern.search(text or "")
+    return int(match.group(1)) if match else None
+
+def _path_problem(path):
+    if BAD_PATH_CHARS.search(path):
+        return "contains characters that are not valid in a file name"
+    if os.path.isabs(path) or path.startswith(("/", "\\")):
+        return "must be relative to the forge root"
+    norm = os.path.normpath(path).replace("\\", "/")
+    if norm == ".." or norm.startswith("../"):
+        return "escapes the forge root"
+    if norm.split("/")[0] != OUTPUT_ROOT:
+        return f"must be under {OUTPUT_ROOT}/"
+    if path.endswith(("/", "\\")) or norm == OUTPUT_ROOT:
+        return "must name a file, not a directory"
+    return None
+
+# ------------------ VALIDATION ------------------
+
+def validate_config(config_dir=CONFIG_DIR):
+    """Validate agents.yaml + tasks.yaml; returns a ForgeConfig with every issue found."""
+    agents_path = os.path.join(config_dir, "agents.yaml")
+    tasks_path = os.path.join(config_dir, "tasks.yaml")
+    issues = []
+
+    agents, agent_nodes = _entries(agents_path, "agents", issues)
+    by_id, by_name, labels, rejected = {}, {}, {}, set()
+    for agent, node in zip(agents, agent_nodes):
+        if not _check(AgentConfig, agent, node, agents_path, issues):
+            # still resolvable by tasks, so one bad agent doesn't also flag all of its tasks
+            if isinstance(agent, dict):
+                rejected.update(v for v in (agent.get("id"), agent.get("name")) if isinstance(v, str))
+            continue
+        line = _line(node)
+        aid, name, team = agent["id"], agent["name"], agent["team"]
+        if aid in by_id:
+            issues.append(Issue(agents_path, _line(node, ("id",)), f"duplicate agent id '{aid}' (first on line {by_id[aid][1]})"))
+        else:
+            by_id[aid] = (agent, line)
+        if name in by_name:
+            issues.append(Issue(agents_path, _line(node, ("name",)), f"duplicate agent name '{name}' (first on line {by_name[name][1]})"))
+        else:
+            by_name[name] = (agent, line)
+
+        label_key = " ".join(team.split()).casefold()
+        first = labels.setdefault(label_key, (team, line))
+        if first[0] != team:
+            issues.append(Issue(agents_path, _line(node, ("team",)), f"team label '{team}' differs from '{first[0]}' (line {first[1]})"))
+        number = _team_number(LABEL_TEAM, team)
+        for field, pattern in (("id", ID_TEAM), ("output_dir", DIR_TEAM)):
+            other = _team_number(pattern, agent.get(field))
+            if number is not None and other is not None and other != number:
+                issues.append(Issue(agents_path, _line(node, (field,)), f"{field} '{agent[field]}' points at team {other}, but team is '{team}'"))
+
+    tasks, task_nodes = _entries(tasks_path, "tasks", issues)
+    task_ids, outputs, valid_tasks = {}, {}, []
+    for i, (task, node) in enumerate(zip(tasks, task_nodes)):
+        if not _check(TaskConfig, task, node, tasks_path, issues):
+            continue
+        line = _line(node)
+        task = task if "id" in task else {**task, "id": f"task_{i+1}"}
+        tid = task["id"]
+        if tid in task_ids:
+            issues.append(Issue(tasks_path, _line(node, ("id",)), f"duplicate task id '{tid}' (first on line {task_ids[tid]})"))
+        else:
+            task_ids[tid] = line
+
+        owner = by_name.get(task["agent"]) or by_id.get(task["agent"])
+        if owner is None and task["agent"] not in rejected:
+            issues.append(Issue(tasks_path, _line(node, ("agent",)), f"task '{tid}' references unknown agent '{task['agent']}'"))
+
+        out = task["output"]["file"]
+        out_line = _line(node, ("output", "file"))
+        problem = _path_problem(out)
+        if problem:
+            issues.append(Issue(tasks_path, out_line, f"output.file '{out}' {problem}"))
+        elif out in outputs:
+            issues.append(Issue(tasks_path, out_line, f"output.file '{out}' is also written by task '{outputs[out][0]}' (line {outputs[out][1]})"))
+        else:
+            outputs[out] = (tid, line)
+
+        if owner is not None:
+            team = owner[0]["team"]
+            tag = TAG_TEAM.match(task.get("instructions") or "")
+            if tag and " ".join(tag.group(1).split()).casefold() != " ".join(team.split()).casefold():
+                issues.append(Issue(tasks_path, _line(node, ("instructions",)), f"task '{tid}' is tagged [{tag.group(1)}] but its agent is in '{team}'"))
+            number, file_number = _team_number(LABEL_TEAM, team), _team_number(FILE_TEAM, out)
+            if number is not None and file_number is not None and number != file_number:
+                issues.append(Issue(tasks_path, out_line, f"output.file '{out}' is for team {file_number}, but its agent is in '{team}'"))
+        valid_tasks.append(task)
+
+    valid_agents = [a for a, _ in by_id.values()]
+    return ForgeConfig(valid_agents, valid_tasks, issues)
+
+# ------------------ CACHE ------------------
+
+_VALIDATED = {}
+
+def _stamps(config_dir):
+    out = []
+    for name in ("agents.yaml", "tasks.yaml"):
+        info = os.stat(os.path.join(config_dir, name))
+        out.append([name, info.st_mtime_ns, info.st_size])
+    return out
+
+def _read_cache(path, stamps):
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("version") != CACHE_VERSION or cached.get("stamps") != stamps:
+        return None
+    return ForgeConfig(cached["agents"], cached["tasks"], [])
+
+def _write_cache(path, stamps, config):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "stamps": stamps, "agents": config.agents, "tasks": config.tasks},
+                      f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        # unwritable config dir or values JSON can't hold: keep the in-process cache only
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+def load_config(config_dir=CONFIG_DIR):
+    """Validated config, reused while agents.yaml and tasks.yaml are unchanged.
+
+    Raises ConfigValidationError listing every problem. The cached lists are shared, so don't mutate them.
+    """
+    key = os.path.abspath(config_dir)
+    try:
+        stamps = _stamps(key)
+    except OSError:
+        stamps = None
+    if stamps is not None:
+        hit = _VALIDATED.get(key)
+        if hit and hit[0] == stamps:
+            return hit[1]
+        config = _read_cache(os.path.join(key, CACHE_NAME), stamps)
+        if config is not None:
+            _VALIDATED[key] = (stamps, config)
+            return config
+
+    config = validate_config(key)
+    if config.issues:
+        raise ConfigValidationError(config.issues)
+    if stamps is not None:
+        _write_cache(os.path.join(key, CACHE_NAME), stamps, config)
+        _VALIDATED[key] = (stamps, config)
+    return config
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validate Forge agents/tasks configs")
+    parser.add_argument("config_dir", nargs="?", default=CONFIG_DIR)
+    args = parser.parse_args()
+    result = validate_config(args.config_dir)
+    for issue in result.issues:
+        print(f"❌ {issue}")
+    print(f"{'✅' if not result.issues else '⚠️'} {len(result.agents)} agents, {len(result.tasks)} tasks, "
+          f"{len(result.issues)} problems")
+    sys.exit(1 if result.issues else 0)
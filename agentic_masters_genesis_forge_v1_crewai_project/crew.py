@@ -5,8 +5,10 @@
 Manages all 200 agents across 20 teams, loads configuration, assigns tasks, and autoheals errors.
 """
 
-import os, yaml, json, random, time, traceback
+import os, json, random, time, uuid, traceback
 from colorama import Fore, Style
+from agentic_masters_genesis_forge_v1_crewai_project.run_metrics import get_metrics
+from agentic_masters_genesis_forge_v1_crewai_project.config_validator import load_config
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_DIR = os.path.join(BASE_DIR, "config")
@@ -23,6 +25,7 @@ class ForgeAgent:
         self.performance = {"tasks_completed": 0, "errors": 0}
 
     def perform_task(self, task):
+        started = time.perf_counter()
         try:
             task_name = task.get("name") or task.get("title") or "Unnamed Task"
             print(Fore.CYAN + f"🧠 {self.name} executing: {task_name}")
@@ -33,7 +36,8 @@ class ForgeAgent:
                     "agent_id": self.id,
                     "task_id": task.get("id", "unknown"),
                     "status": "completed",
-                    "timestamp": time.time()
+                    "timestamp": time.time(),
+                    "duration": round(time.perf_counter() - started, 4)
                 }
             else:
                 raise RuntimeError("Simulated execution error")
@@ -45,7 +49,8 @@ class ForgeAgent:
                 "status": "error",
                 "error": str(e),
                 "traceback": traceback.format_exc(),
-                "timestamp": time.time()
+                "timestamp": time.time(),
+                "duration": round(time.perf_counter() - started, 4)
             }
 
 class CrewManager:
@@ -53,33 +58,17 @@ class CrewManager:
         self.agents = []
         self.tasks = []
         self.memory = {}
+        self._agent_index = None
+        self.metrics = get_metrics()
+        self.run_id = None
         self.load_configs()
         self.load_memory()
 
     def load_configs(self):
-        with open(os.path.join(CONFIG_DIR, "agents.yaml"), encoding="utf-8") as f:
-            agents_data = yaml.safe_load(f)
-            self.agents = agents_data["agents"] if isinstance(agents_data, dict) and "agents" in agents_data else agents_data
-
-        with open(os.path.join(CONFIG_DIR, "tasks.yaml"), encoding="utf-8") as f:
-            tasks_data = yaml.safe_load(f)
-            raw_tasks = tasks_data["tasks"] if isinstance(tasks_data, dict) and "tasks" in tasks_data else tasks_data
-
-            if isinstance(raw_tasks, dict):
-                self.tasks = [
-                    {"id": task_id, **task_info}
-                    for task_id, task_info in raw_tasks.items()
-                    if isinstance(task_info, dict)
-                ]
-            elif isinstance(raw_tasks, list):
-                self.tasks = [
-                    task if "id" in task else {**task, "id": f"task_{i+1}"}
-                    for i, task in enumerate(raw_tasks)
-                    if isinstance(task, dict)
-                ]
-            else:
-                raise ValueError("Invalid tasks.yaml format: must be list or dict")
-
+        # validated in one pass (schema + cross-references) and reused while the YAML is unchanged
+        config = load_config(CONFIG_DIR)
+        self.agents = list(config.agents)
+        self.tasks = list(config.tasks)
         print(Fore.GREEN + f"✅ Loaded {len(self.agents)} agents and {len(self.tasks)} tasks.")
 
     def load_memory(self):
@@ -92,15 +81,21 @@ class CrewManager:
     def assign_and_execute(self):
         print(Fore.MAGENTA + "\n🚀 Assigning tasks to teams...\n")
         results = []
+        self.run_id = uuid.uuid4().hex[:12]
+        self.metrics.start_run(self.run_id, len(self.agents), len(self.tasks))
         for agent_data in self.agents:
             agent = ForgeAgent(agent_data)
             assigned_tasks = random.sample(self.tasks, min(3, len(self.tasks)))
             for task in assigned_tasks:
                 result = agent.perform_task(task)
                 results.append(result)
+                self.metrics.record(self.run_id, result, agent_data.get("team"))
                 if result["status"] == "error":
                     self.delegate_repair(agent, task, result)
+            self.metrics.flush()
+        self.metrics.finish_run(self.run_id)
         self.memory["runs"].append({
+            "run_id": self.run_id,
             "timestamp": time.time(),
             "results": results,
             "agents": [a["id"] for a in self.agents],
@@ -110,8 +105,30 @@ class CrewManager:
             json.dump(self.memory, f, indent=2)
         print(Fore.YELLOW + f"\n📊 {len(results)} task instances executed.\n")
 
+    def agent_index(self):
+        """Similarity index over agent dossiers, built on first use (None without NumPy)."""
+        if self._agent_index is None:
+            try:
+                from agentic_masters_genesis_forge_v1_crewai_project.similarity_index import SimilarityIndex, agent_profile
+            except ImportError:
+                self._agent_index = False
+            else:
+                self._agent_index = SimilarityIndex().build((a.get("id"), agent_profile(a)) for a in self.agents)
+        return self._agent_index or None
+
+    def pick_fallback(self, failed_agent, task):
+        """Most capable other agent for `task` by dossier similarity; random if unavailable."""
+        index = self.agent_index()
+        if index is not None:
+            query = "\n".join(str(task.get(k) or "") for k in ("title", "name", "instructions", "description"))
+            best = index.top_k([query], k=1, exclude=[{failed_agent.id}])[0]
+            if best:
+                by_id = {a.get("id"): a for a in self.agents}
+                return by_id[best[0][0]]
+        return random.choice(self.agents)
+
     def delegate_repair(self, failed_agent, failed_task, error_result):
-        fallback_data = random.choice(self.agents)
+        fallback_data = self.pick_fallback(failed_agent, failed_task)
         fallback_agent = ForgeAgent(fallback_data)
         task_name = failed_task.get("name") or failed_task.get("title") or "Unnamed Task"
         print(Fore.RED + f"⚠️ {failed_agent.name} failed task '{task_name}'. Delegating to {fallback_agent.name}...")
@@ -119,6 +136,8 @@ class CrewManager:
         time.sleep(0.2)
         print(Fore.BLUE + f"🛠️ {fallback_agent.name} received instructions:\n{instructions}")
         retry_result = fallback_agent.perform_task(failed_task)
+        if self.run_id:
+            self.metrics.record(self.run_id, retry_result, fallback_data.get("team"), repair=True)
 
     # Ensure memory["runs"] exists
         if "runs" not in self.memory or not self.memory["runs"]:
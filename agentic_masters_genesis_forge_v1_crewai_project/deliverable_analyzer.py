@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Deliverable Analyzer
+─────────────────────────────────────────────
+Streaming map-reduce over the deliverables corpus for ForgeAnalyzerCrew:
+ - map: worker processes read each file exactly once and extract title,
+   code-block count and the positions of every vocabulary term
+ - the same pass serializes the training-dataset record, so nothing rereads the file
+ - reduce: nodes are folded into the dependency graph and an InvertedIndex as they arrive
+ - dataset records are written straight to JSONL, never collected in memory
+ - only a bounded window of chunks is in flight, so memory stays flat with corpus size
+
+Small corpora (or workers=1) are analyzed in-process without a pool.
+
+With an AnalysisCache, files whose path, size and mtime are unchanged are not
+opened at all: their node comes from the cache and their dataset record is
+copied byte-for-byte from the previous JSONL. Touched files whose content hash
+still matches keep their cached node.
+"""
+import os, re, json, hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_index import (
+    DELIVERABLES, DEPENDENCY_TERMS, InvertedIndex, doc_key, term_positions, vocabulary_hits,
+)
+
+TITLE = re.compile(r"# (.*?)\n")
+CODE = re.compile(r"```(.*?)```", re.DOTALL)
+
+CACHE_PATH = os.path.join(DELIVERABLES, ".analysis_cache.json")
+CACHE_VERSION = 3
+
+CHUNK = 64
+POOL_MIN = 2 * CHUNK  # below this, process start-up costs more than it saves
+
+# ------------------ MAP ------------------
+
+def analyze_text(text, path, vocabulary=DEPENDENCY_TERMS):
+    """Intelligence node for one deliverable body."""
+    title = TITLE.search(text)
+    terms, tokens = term_positions(text, vocabulary)
+    return {
+        "file": doc_key(path),
+        "title": title.group(1).strip() if title else os.path.basename(path),
+        "length": len(text),
+        "codes": len(CODE.findall(text)),
+        "dependencies": vocabulary_hits(terms, vocabulary),
+        "terms": terms,
+        "tokens": tokens,
+    }
+
+def analyze_file(path, known=None, vocabulary=DEPENDENCY_TERMS):
+    """(node, dataset JSONL line, content hash) from a single read of `path`.
+
+    `known` is a previous node with its hash; it is reused when the content hash still matches.
+    """
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    if known and known["hash"] == digest:
+        node = known["node"]
+    else:
+        node = analyze_text(text, path, vocabulary)
+    record = {"title": node["title"], "text": text, "dependencies": node["dependencies"]}
+    return node, json.dumps(record, ensure_ascii=False) + "\n", digest
+
+def _map_chunk(jobs, vocabulary):
+    return [analyze_file(path, known, vocabulary) for path, known in jobs]
+
+def _chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def iter_analyses(jobs, workers=None, chunk=CHUNK, vocabulary=DEPENDENCY_TERMS):
+    """Yield (node, dataset line, hash) per (path, known) job, in input order.
+
+    At most 2 * workers chunks are outstanding at once, so results never pile up
+    faster than the caller consumes them.
+    """
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < POOL_MIN:
+        for path, known in jobs:
+            yield analyze_file(path, known, vocabulary)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for batch in _chunks(jobs, chunk):
+            window.append(pool.submit(_map_chunk, batch, vocabulary))
+            if len(window) >= 2 * workers:
+                yield from window.popleft().result()
+        while window:
+            yield from window.popleft().result()
+
+# ------------------ CACHE ------------------
+
+def _stamp(path):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime": st.st_mtime_ns}
+
+class AnalysisCache:
+    """Per-file nodes keyed by path, checked against size, mtime and content hash.
+
+    Each entry also remembers where its record sits in the last written dataset,
+    which is only trusted while that dataset's own size and mtime are unchanged.
+    Nodes are only reused under the vocabulary they were indexed with.
+    """
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.files = {}
+        self.dataset = {}
+        self.vocabulary = None
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    self.files = data.get("files", {})
+                    self.dataset = data.get("dataset", {})
+                    self.vocabulary = data.get("vocabulary")
+            except (OSError, ValueError):
+                pass
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "vocabulary": self.vocabulary,
+                       "dataset": self.dataset, "files": self.files}, f)
+        os.replace(tmp, self.path)
+
+    def dataset_valid(self, dataset_path):
+        if not dataset_path or not os.path.exists(dataset_path):
+            return False
+        return self.dataset == {"path": dataset_path, **_stamp(dataset_path)}
+
+# ------------------ REDUCE ------------------
+
+class DeliverableAnalysis:
+    """Running reduction: summary nodes, keyword -> titles graph and the term index."""
+    def __init__(self, vocabulary=DEPENDENCY_TERMS):
+        self.summary = []
+        self.dependency_graph = {}
+        self.index = InvertedIndex(vocabulary)
+        self.analyzed = 0
+        self.reused = 0
+
+    def add(self, node):
+        self.summary.append(node)
+        self.index.add_terms(node["file"], node["terms"], node["tokens"])
+        for dep in node["dependencies"]:
+            self.dependency_graph.setdefault(dep.lower(), []).append(node["title"])
+
+def analyze(paths, dataset_path=None, workers=None, chunk=CHUNK, cache=None, vocabulary=DEPENDENCY_TERMS):
+    """Analyze `paths` in one streaming pass, writing the JSONL dataset if a path is given.
+
+    With a cache, only new or changed files are read; the cache is saved afterwards.
+    """
+    vocabulary = sorted(set(vocabulary))
+    result = DeliverableAnalysis(vocabulary)
+    old_files = cache.files if cache and cache.vocabulary == vocabulary else {}
+    old_dataset = None
+    if cache and dataset_path and cache.dataset_valid(dataset_path):
+        old_dataset = open(dataset_path, "rb")
+
+    # a file is skipped only if its stamp matches and (when writing a dataset) its old record is copyable
+    plan, jobs = [], []
+    for path in paths:
+        stamp = _stamp(path)
+        known = old_files.get(path)
+        fresh = known is not None and known["size"] == stamp["size"] and known["mtime"] == stamp["mtime"]
+        if fresh and dataset_path and (old_dataset is None or known.get("offset") is None):
+            fresh = False
+        plan.append((path, stamp, known if fresh else None))
+        if not fresh:
+            jobs.append((path, known))
+
+    files = {}
+    out = None
+    if dataset_path:
+        os.makedirs(os.path.dirname(dataset_path) or ".", exist_ok=True)
+        out = open(dataset_path + ".tmp", "wb")
+    try:
+        fresh_results = iter_analyses(jobs, workers, chunk, vocabulary)
+        offset = 0
+        for path, stamp, known in plan:
+            if known is not None:
+                node, digest = known["node"], known["hash"]
+                line = None
+                if out:
+                    old_dataset.seek(known["offset"])
+                    line = old_dataset.read(known["length"])
+                result.reused += 1
+            else:
+                node, text_line, digest = next(fresh_results)
+                line = text_line.encode("utf-8")
+                result.analyzed += 1
+            entry = {**stamp, "hash": digest, "node": node, "offset": None, "length": None}
+            if out:
+                out.write(line)
+                entry["offset"], entry["length"] = offset, len(line)
+                offset += len(line)
+            files[path] = entry
+            result.add(node)
+    finally:
+        if old_dataset:
+            old_dataset.close()
+        if out:
+            out.close()
+    if out:
+        os.replace(dataset_path + ".tmp", dataset_path)
+
+    if cache is not None:
+        if dataset_path:
+            cache.dataset = {"path": dataset_path, **_stamp(dataset_path)}
+        elif cache.dataset:
+            # no dataset written this run: earlier offsets stay valid only for unchanged entries
+            for path, entry in files.items():
+                prev = old_files.get(path)
+                if prev and prev["hash"] == entry["hash"] and prev["size"] == entry["size"]:
+                    entry["offset"], entry["length"] = prev.get("offset"), prev.get("length")
+        cache.files = files
+        cache.vocabulary = vocabulary
+        cache.save()
+    return result
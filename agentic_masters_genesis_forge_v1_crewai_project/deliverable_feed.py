@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Deliverable Feed
+─────────────────────────────────────────
+Append-only change feed for the deliverables folder:
+ - Writers call publish() when they create or rewrite an artifact
+ - Each event is one JSONL line in deliverables/.feed.jsonl (ts, path, size)
+ - Consumers keep a named byte cursor and only read events appended since
+ - tail(since=...) reads the feed backwards, so "last 30 minutes" costs O(new files)
+ - FeedWatcher (Linux inotify) publishes files dropped in by external writers,
+   and "deleted" events when files are removed or moved away, after catching
+   the feed up with anything written or removed while no watcher ran
+ - live_paths() folds events to the latest one per path and drops deleted files
+ - a new FeedReader starts from one directory scan, then follows the feed
+
+The feed only stands in for a directory scan while a watcher is live
+(feed_covers); otherwise files from writers that don't publish would be missed.
+Events may repeat for the same path; consumers key by path.
+"""
+import os, json, time, struct, threading
+
+DELIVERABLES = "deliverables"
+FEED_NAME = ".feed.jsonl"
+WATCHER_NAME = ".feed.watcher"
+SUFFIXES = (".md", ".json", ".txt")
+BLOCK = 64 * 1024
+
+def feed_path(root=DELIVERABLES):
+    return os.path.join(root, FEED_NAME)
+
+def has_feed(root=DELIVERABLES):
+    return os.path.exists(feed_path(root))
+
+def feed_covers(root=DELIVERABLES):
+    """True when the feed can replace a directory scan: it exists and a watcher is publishing for other writers."""
+    return has_feed(root) and watcher_alive(root)
+
+def scan(root=DELIVERABLES, suffixes=SUFFIXES):
+    """One event per file currently in the tree (ts = mtime), for seeding consumers."""
+    events = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.startswith(".") or not name.endswith(suffixes):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                info = os.stat(path)
+            except OSError:
+                continue
+            events.append({"ts": info.st_mtime, "path": os.path.relpath(path, root), "size": info.st_size, "event": "scanned"})
+    return events
+
+def publish(path, root=DELIVERABLES, size=None, event="created"):
+    """Record that `path` was written. Returns the event."""
+    rel = os.path.relpath(path, root)
+    if size is None:
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+    entry = {"ts": time.time(), "path": rel, "size": size, "event": event}
+    os.makedirs(root, exist_ok=True)
+    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+    # single O_APPEND write keeps concurrent writers' lines intact
+    fd = os.open(feed_path(root), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+    return entry
+
+def _parse(raw):
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+def _read_forward(path, offset=0):
+    """(events, end offset) for complete lines after offset."""
+    events = []
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            offset += len(raw)
+            entry = _parse(raw)
+            if entry:
+                events.append(entry)
+    return events, offset
+
+def live_paths(root=DELIVERABLES, since=None):
+    """{path: latest event} for files whose newest event in the window is not a delete."""
+    latest = {}
+    for entry in tail(root, since):
+        latest.setdefault(entry["path"], entry)
+    return {p: e for p, e in latest.items() if e.get("event") != "deleted"}
+
+def tail(root=DELIVERABLES, since=None, limit=None):
+    """Newest-first events with ts >= since, read backwards from the end of the feed."""
+    path = feed_path(root)
+    if not os.path.exists(path):
+        return []
+    events = []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        rest = b""
+        while pos > 0:
+            step = min(BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + rest).split(b"\n")
+            rest = lines.pop(0) if pos > 0 else b""
+            for raw in reversed(lines):
+                entry = _parse(raw) if raw else None
+                if entry is None:
+                    continue
+                if since is not None and entry["ts"] < since:
+                    return events
+                events.append(entry)
+                if limit and len(events) >= limit:
+                    return events
+    return events
+
+class FeedReader:
+    """Named consumer that resumes from its own persisted byte offset."""
+
+    def __init__(self, name, root=DELIVERABLES):
+        self.root = root
+        self.cursor_path = os.path.join(root, f".feed.{name}.cursor")
+        self.offset = 0
+        self.fresh = not os.path.exists(self.cursor_path)
+        if not self.fresh:
+            with open(self.cursor_path, encoding="utf-8") as f:
+                self.offset = int(f.read().strip() or 0)
+
+    def read_new(self):
+        path = feed_path(self.root)
+        events = []
+        if self.fresh:
+            # a new consumer starts from what is on disk (files older than the feed
+            # or never published included), then follows the feed from its current end
+            self.offset = os.path.getsize(path) if os.path.exists(path) else 0
+            events = scan(self.root)
+            self.fresh = False
+        if not os.path.exists(path):
+            return events
+        if os.path.getsize(path) < self.offset:
+            self.offset = 0  # feed was reset
+        new, self.offset = _read_forward(path, self.offset)
+        return events + new
+
+    def commit(self):
+        tmp = self.cursor_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(str(self.offset))
+        os.replace(tmp, self.cursor_path)
+
+# ------------------ INOTIFY WATCHER ------------------
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_CREATE = 0x00000100
+IN_ISDIR = 0x40000000
+_EVENT = struct.Struct("iIII")
+
+def watcher_alive(root=DELIVERABLES):
+    """Whether a FeedWatcher process is currently publishing for this root."""
+    if not FeedWatcher.available():
+        return False
+    try:
+        with open(os.path.join(root, WATCHER_NAME), encoding="utf-8") as f:
+            pid = int(f.read().strip())
+        os.kill(pid, 0)
+    except PermissionError:
+        return True
+    except (OSError, ValueError):
+        return False
+    return True
+
+class FeedWatcher:
+    """Publish files written into the deliverables tree by processes that don't call publish()."""
+
+    def __init__(self, root=DELIVERABLES, suffixes=(".md", ".json", ".txt")):
+        self.root = root
+        self.suffixes = suffixes
+        self.fd = None
+        self.watches = {}
+        self.thread = None
+
+    @staticmethod
+    def available():
+        import sys
+        return sys.platform.startswith("linux")
+
+    def _libc(self):
+        import ctypes, ctypes.util
+        return ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+
+    def _watch(self, path):
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MOVED_FROM
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd >= 0:
+            self.watches[wd] = path
+
+    def start(self):
+        if not self.available():
+            return False
+        self.libc = self._libc()
+        self.fd = self.libc.inotify_init()
+        if self.fd < 0:
+            return False
+        os.makedirs(self.root, exist_ok=True)
+        for dirpath, dirnames, _ in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            self._watch(dirpath)
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+        self.catch_up()
+        pid_path = os.path.join(self.root, WATCHER_NAME)
+        with open(pid_path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(str(os.getpid()))
+        os.replace(pid_path + ".tmp", pid_path)
+        return True
+
+    def catch_up(self):
+        """Publish files written, changed or removed while no watcher was running. Returns how many."""
+        path = feed_path(self.root)
+        seen = {}
+        if os.path.exists(path):
+            for e in _read_forward(path)[0]:
+                seen[e["path"]] = e
+        published = 0
+        on_disk = set()
+        for e in scan(self.root, self.suffixes):
+            on_disk.add(e["path"])
+            last = seen.get(e["path"])
+            if last is None or last.get("event") == "deleted" or e["ts"] > last["ts"] or e["size"] != last.get("size"):
+                publish(os.path.join(self.root, e["path"]), self.root, e["size"], event="scanned")
+                published += 1
+        for rel, last in seen.items():
+            if rel not in on_disk and last.get("event") != "deleted" and rel.endswith(self.suffixes):
+                publish(os.path.join(self.root, rel), self.root, 0, event="deleted")
+                published += 1
+        return published
+
+    def _loop(self):
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except OSError:
+                return
+            pos = 0
+            while pos < len(buf):
+                wd, mask, _, length = _EVENT.unpack_from(buf, pos)
+                pos += _EVENT.size
+                name = buf[pos:pos + length].rstrip(b"\0").decode("utf-8", errors="ignore")
+                pos += length
+                base = self.watches.get(wd)
+                if not base or not name or name.startswith("."):
+                    continue
+                path = os.path.join(base, name)
+                if mask & IN_ISDIR:
+                    if mask & IN_CREATE:
+                        self._watch(path)
+                elif name.endswith(self.suffixes):
+                    try:
+                        if mask & (IN_DELETE | IN_MOVED_FROM):
+                            publish(path, self.root, 0, event="deleted")
+                        elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                            publish(path, self.root)
+                    except OSError:
+                        pass
+
+    def stop(self):
+        pid_path = os.path.join(self.root, WATCHER_NAME)
+        try:
+            with open(pid_path, encoding="utf-8") as f:
+                if f.read().strip() == str(os.getpid()):
+                    os.remove(pid_path)
+        except OSError:
+            pass
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
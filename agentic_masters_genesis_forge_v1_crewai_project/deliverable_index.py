@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Deliverable Index
+──────────────────────────────────────────
+Tokenizer and positional inverted index over the deliverables corpus:
+ - tokens are lowercase word runs (the same boundaries as regex \\b)
+ - postings: term -> {doc: [positions]}, so counts are len(positions)
+ - vocabularies restrict what gets indexed; entries may be multi-word phrases
+ - phrase queries walk positions instead of rescanning text
+ - TF-IDF ranking for free-text queries
+
+The analyzer builds one with the dependency vocabulary as it streams the corpus;
+`python deliverable_index.py <query>` builds (or loads) a full-text index and answers
+"which deliverables mention X" from it.
+"""
+import os, re, sys, json, math, heapq, argparse
+
+TOKEN = re.compile(r"\w+")
+
+DEPENDENCY_TERMS = ("memory", "compiler", "agent", "security", "dsl", "vr", "diagnose")
+DELIVERABLES = "deliverables"
+INDEX_PATH = os.path.join(DELIVERABLES, ".term_index.json")
+
+def doc_key(path, root=DELIVERABLES):
+    """Document id for a deliverable: its path relative to the deliverables root.
+
+    Run directories reuse file names (Phase_1.md), so the basename alone is not unique.
+    """
+    try:
+        rel = os.path.relpath(path, root)
+    except ValueError:  # different drive on Windows
+        rel = path
+    if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+        rel = os.path.normpath(path)
+    return rel.replace(os.sep, "/")
+
+def tokenize(text):
+    return TOKEN.findall(text.lower())
+
+def vocabulary_words(vocabulary):
+    """Single words that must be indexed to answer every entry of `vocabulary`."""
+    if vocabulary is None:
+        return None
+    return {w for entry in vocabulary for w in tokenize(entry)}
+
+def term_positions(text, vocabulary=None):
+    """(term -> positions, token count) for one document, restricted to `vocabulary` if given."""
+    words = vocabulary_words(vocabulary)
+    terms = {}
+    n = 0
+    for n, tok in enumerate(tokenize(text), 1):
+        if words is None or tok in words:
+            terms.setdefault(tok, []).append(n - 1)
+    return terms, n
+
+def phrase_starts(terms, phrase):
+    """Start positions of `phrase` in one document's term -> positions map."""
+    return _starts(terms, tokenize(phrase))
+
+def _starts(terms, words):
+    if not words or any(w not in terms for w in words):
+        return []
+    starts = set(terms[words[0]])
+    for offset, w in enumerate(words[1:], 1):
+        starts &= {p - offset for p in terms[w]}
+        if not starts:
+            return []
+    return sorted(starts)
+
+def vocabulary_hits(terms, vocabulary):
+    """Vocabulary entries present in a document, sorted."""
+    return sorted(entry for entry in vocabulary if phrase_starts(terms, entry))
+
+# ------------------ INDEX ------------------
+
+class InvertedIndex:
+    def __init__(self, vocabulary=None):
+        self.vocabulary = list(vocabulary) if vocabulary is not None else None
+        self.docs = []
+        self.lengths = []
+        self.postings = {}
+
+    def __len__(self):
+        return len(self.docs)
+
+    def add(self, doc, text):
+        terms, length = term_positions(text, self.vocabulary)
+        return self.add_terms(doc, terms, length)
+
+    def add_terms(self, doc, terms, length):
+        """Merge one document's precomputed term positions (e.g. from an analyzer worker)."""
+        doc_id = len(self.docs)
+        self.docs.append(doc)
+        self.lengths.append(length)
+        for term, positions in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = positions
+        return doc_id
+
+    # ------------------ QUERIES ------------------
+
+    def count(self, term, doc_id):
+        return len(self.postings.get(term, {}).get(doc_id, ()))
+
+    def mentions(self, query):
+        """Docs containing `query` (a word or phrase), in index order."""
+        words = tokenize(query)
+        if not words:
+            return []
+        if len(words) == 1:
+            return [self.docs[d] for d in self.postings.get(words[0], {})]
+        return [self.docs[d] for d in self._phrase_docs(words)]
+
+    def phrase(self, query):
+        """{doc: [start positions]} for an exact phrase."""
+        words = tokenize(query)
+        return {self.docs[d]: starts for d, starts in self._phrase_docs(words).items()}
+
+    def _phrase_docs(self, words):
+        lists = [self.postings.get(w) for w in words]
+        if not words or not all(lists):
+            return {}
+        # intersect starting from the rarest term
+        candidates = set(min(lists, key=len))
+        for postings in lists:
+            candidates.intersection_update(postings)
+        found = {}
+        for d in sorted(candidates):
+            starts = _starts({w: lists[i][d] for i, w in enumerate(words)}, words)
+            if starts:
+                found[d] = starts
+        return found
+
+    def idf(self, term):
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + len(self.docs) / df) if df else 0.0
+
+    def search(self, query, k=10):
+        """Top-k (doc, score) by TF-IDF over the query's terms."""
+        scores = {}
+        for term in set(tokenize(query)):
+            idf = self.idf(term)
+            for d, positions in self.postings.get(term, {}).items():
+                tf = (1 + math.log(len(positions))) / math.sqrt(self.lengths[d] or 1)
+                scores[d] = scores.get(d, 0.0) + tf * idf
+        best = heapq.nlargest(k, scores.items(), key=lambda kv: kv[1])
+        return [(self.docs[d], round(s, 6)) for d, s in best]
+
+    # ------------------ PERSISTENCE ------------------
+
+    def save(self, path=INDEX_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"vocabulary": self.vocabulary, "docs": self.docs,
+                       "lengths": self.lengths, "postings": self.postings}, f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        index = cls(data["vocabulary"])
+        index.docs = data["docs"]
+        index.lengths = data["lengths"]
+        index.postings = {t: {int(d): p for d, p in docs.items()} for t, docs in data["postings"].items()}
+        return index
+
+def build_index(paths, vocabulary=None, root=DELIVERABLES):
+    index = InvertedIndex(vocabulary)
+    for path in paths:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            index.add(doc_key(path, root), f.read())
+    return index
+
+def main(argv=None):
+    from glob import glob
+    parser = argparse.ArgumentParser(description="Query the deliverables term index")
+    parser.add_argument("query", nargs="*")
+    parser.add_argument("--root", default="deliverables")
+    parser.add_argument("--rebuild", action="store_true")
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--phrase", action="store_true", help="exact phrase match instead of ranking")
+    args = parser.parse_args(argv)
+
+    path = os.path.join(args.root, os.path.basename(INDEX_PATH))
+    if args.rebuild or not os.path.exists(path):
+        index = build_index(sorted(glob(os.path.join(args.root, "**", "*.md"), recursive=True)), root=args.root)
+        index.save(path)
+        print(f"🗂️ Indexed {len(index)} deliverables, {len(index.postings)} terms -> {path}")
+    else:
+        index = InvertedIndex.load(path)
+    query = " ".join(args.query)
+    if not query:
+        return 0
+    if args.phrase:
+        for doc, starts in index.phrase(query).items():
+            print(f"{doc}: {len(starts)}x")
+    else:
+        for doc, score in index.search(query, args.k):
+            print(f"{score:8.4f}  {doc}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
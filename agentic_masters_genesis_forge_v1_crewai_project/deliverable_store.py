@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Deliverable Store
+──────────────────────────────────────────
+Content-addressed storage for agent deliverables:
+ - Every artifact is keyed by the SHA-256 of its body and stored once
+ - Blobs are zlib-compressed on disk (`deliverables/.store/objects`) by default;
+   the readable copy is the exported file, so the store adds only a fraction of it
+ - An append-only JSONL index records task, run, timestamp, hash and size
+ - Retries that reproduce identical content only cost an index lookup
+
+The analyzer adds the index's exported files (run directories included) to
+its listing of the deliverables folder.
+"""
+import os, json, time, zlib, hashlib
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_feed import publish
+
+DELIVERABLES = "deliverables"
+STORE_DIR = ".store"
+
+def content_hash(content):
+    return hashlib.sha256(content.encode("utf-8", errors="ignore")).hexdigest()
+
+class DeliverableStore:
+    def __init__(self, root=DELIVERABLES, compress=True):
+        self.root = root
+        self.compress = compress
+        self.store_dir = os.path.join(root, STORE_DIR)
+        self.objects_dir = os.path.join(self.store_dir, "objects")
+        self.index_path = os.path.join(self.store_dir, "index.jsonl")
+        self.entries = []
+        self.by_hash = {}
+        self._keys = {}
+        self._offset = 0
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.refresh()
+
+    # ------------------ INDEX ------------------
+
+    def refresh(self):
+        """Load index lines appended since the last refresh (by this or another process)."""
+        if not os.path.exists(self.index_path):
+            return 0
+        added = 0
+        with open(self.index_path, "rb") as f:
+            f.seek(self._offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # partially written line, pick it up next time
+                self._offset += len(raw)
+                try:
+                    entry = json.loads(raw)
+                except ValueError:
+                    continue
+                self._add(entry)
+                added += 1
+        return added
+
+    def _add(self, entry):
+        self.entries.append(entry)
+        self.by_hash.setdefault(entry["hash"], entry)
+        self._keys[(entry.get("task"), entry.get("run"), entry["hash"], entry.get("name"))] = entry
+
+    def _append(self, entry):
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(self.index_path, "ab") as f:
+            f.write(line)
+        self._offset += len(line)
+        self._add(entry)
+
+    # ------------------ OBJECTS ------------------
+
+    def _object_path(self, digest, compressed):
+        name = digest + (".z" if compressed else "")
+        return os.path.join(self.objects_dir, digest[:2], name)
+
+    def _write_object(self, digest, data, compressed):
+        path = self._object_path(digest, compressed)
+        if os.path.exists(path):
+            return os.path.getsize(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        blob = zlib.compress(data, 6) if compressed else data
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        return len(blob)
+
+    # ------------------ PUBLIC API ------------------
+
+    def put(self, content, task, run=None, name=None, compress=None):
+        """Store a deliverable body. Returns (entry, is_new).
+
+        is_new only says whether the blob was new to the store; a known body under a
+        new name still needs export() to put a copy at that name.
+        """
+        self.refresh()
+        data = content.encode("utf-8", errors="ignore")
+        digest = content_hash(content)
+        known = self.by_hash.get(digest)
+        if known and name is None:
+            name = known.get("name")
+        existing = self._keys.get((task, run, digest, name))
+        if existing:
+            return existing, False
+
+        if known:
+            compressed, stored = known["compressed"], known["stored_size"]
+        else:
+            compressed = self.compress if compress is None else compress
+            stored = self._write_object(digest, data, compressed)
+
+        entry = {
+            "hash": digest,
+            "task": task,
+            "run": run,
+            "name": name,
+            "timestamp": time.time(),
+            "size": len(data),
+            "stored_size": stored,
+            "compressed": compressed,
+        }
+        self._append(entry)
+        return entry, known is None
+
+    def contains(self, content):
+        return content_hash(content) in self.by_hash
+
+    def get(self, digest):
+        entry = self.by_hash.get(digest)
+        if entry is None:
+            raise KeyError(digest)
+        with open(self._object_path(digest, entry["compressed"]), "rb") as f:
+            blob = f.read()
+        data = zlib.decompress(blob) if entry["compressed"] else blob
+        return data.decode("utf-8")
+
+    def query(self, task=None, run=None, since=None):
+        self.refresh()
+        return [
+            e for e in self.entries
+            if (task is None or e.get("task") == task)
+            and (run is None or e.get("run") == run)
+            and (since is None or e["timestamp"] >= since)
+        ]
+
+    def latest(self):
+        """Most recent entry per task."""
+        self.refresh()
+        latest = {}
+        for e in self.entries:
+            latest[e.get("task")] = e
+        return list(latest.values())
+
+    def files(self):
+        """Unique exported deliverable paths that exist on disk, in first-seen order."""
+        self.refresh()
+        seen = {}
+        for e in self.entries:
+            if e.get("name") and e["name"] not in seen:
+                seen[e["name"]] = os.path.join(self.root, e["name"])
+        return [path for path in seen.values() if os.path.isfile(path)]
+
+    def export(self, entry, path, header=""):
+        """Write a human-readable copy of a stored deliverable if it is not already on disk.
+
+        Call it after every put(), not only for new blobs: identical content from
+        another run or task still needs its own copy. Returns True if a file was written.
+        """
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8", errors="ignore") as f:
+            f.write(header)
+            f.write(self.get(entry["hash"]))
+        publish(path, self.root)
+        return True
+
+_STORES = {}
+
+def get_store(root=DELIVERABLES):
+    """Shared store per deliverables root."""
+    key = os.path.abspath(root)
+    if key not in _STORES:
+        _STORES[key] = DeliverableStore(root)
+    return _STORES[key]
+
+def has_index(root=DELIVERABLES):
+    return os.path.exists(os.path.join(root, STORE_DIR, "index.jsonl"))
@@ -10,13 +10,19 @@ Scans the entire Forge workspace to verify that:
 """
 import os, json, time, re, glob, datetime
 from colorama import Fore, Style, init
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_feed import feed_covers, live_paths
+from agentic_masters_genesis_forge_v1_crewai_project.log_index import LogIndex
 init(autoreset=True)
 
 DELIVERABLES = "deliverables"
-LOGS = glob.glob("**/*.log", recursive=True)
 
 def recent_files(base=DELIVERABLES, minutes=30):
     now = time.time()
+    if feed_covers(base):
+        # same set as the glob below: top-level .md files that still exist
+        names = [n for n in live_paths(base, since=now - minutes*60)
+                 if n.endswith(".md") and os.sep not in n and "/" not in n]
+        return [p for p in (os.path.join(base, n) for n in sorted(names)) if os.path.exists(p)]
     files = []
     for p in glob.glob(os.path.join(base, "*.md")):
         if os.path.getmtime(p) > now - minutes*60:
@@ -34,11 +40,9 @@ def analyze_last_run():
             print(Fore.GREEN + f"✅ {f} — {size} bytes")
 
     print(Fore.CYAN + "\n🧩 Scanning logs for agent activity…")
-    hits = 0
-    for log in LOGS:
-        txt = open(log, errors="ignore").read()
-        if "Final Answer" in txt or "Task Completed" in txt:
-            hits += 1
+    index = LogIndex()
+    index.update()
+    hits = len(index.active_logs())
     print(Fore.GREEN + f"Agent output signatures: {hits}")
 
     if hits == 0:
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Launch Jobs
+────────────────────────────────────
+Background dispatch for the Streamlit launcher:
+ - submit() records a job in a SQLite status store and returns its id at once
+ - worker threads take queued jobs in order and run every selected agent's
+   tasks through the crew executor (ForgeAgent.perform_task)
+ - progress is written as the job runs: counters on the job row plus an
+   append-only event log with a monotonic seq
+ - pollers read job rows and events after a cursor, so a UI rerun never waits on a job
+ - several launches can queue at once; WORKERS jobs run side by side
+
+Jobs left queued by a previous process are picked up again on start; jobs that
+were mid-run are marked interrupted.
+"""
+import os, json, time, uuid, queue, sqlite3, threading, traceback
+from agentic_masters_genesis_forge_v1_crewai_project.crew import ForgeAgent
+from agentic_masters_genesis_forge_v1_crewai_project.run_metrics import get_metrics
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+JOBS_DB = os.getenv("FORGE_JOBS_DB", os.path.join(BASE_DIR, "memory", "launch_jobs.db"))
+WORKERS = int(os.getenv("FORGE_LAUNCH_WORKERS", "2"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    status TEXT NOT NULL,
+    project_type TEXT,
+    prompt TEXT,
+    agents TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created);
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    time REAL NOT NULL,
+    level TEXT NOT NULL,
+    message TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_job ON events(job_id, seq);
+"""
+
+JOB_COLUMNS = ("id", "created", "started", "finished", "status", "project_type", "prompt", "total", "done", "errors")
+ACTIVE = ("queued", "running")
+
+# ------------------ STATUS STORE ------------------
+
+class JobStore:
+    def __init__(self, path=JOBS_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+
+    def create(self, agents, project_type=None, prompt=None):
+        job_id = uuid.uuid4().hex[:12]
+        total = sum(len(a.get("tasks") or []) for a in agents)
+        with self.lock:
+            self.conn.execute(
+                "INSERT INTO jobs (id, created, status, project_type, prompt, agents, total) VALUES (?, ?, 'queued', ?, ?, ?, ?)",
+                (job_id, time.time(), project_type, prompt, json.dumps(agents, ensure_ascii=False), total))
+        return job_id
+
+    def update(self, job_id, **fields):
+        cols = ", ".join(f"{k} = ?" for k in fields)
+        with self.lock:
+            self.conn.execute(f"UPDATE jobs SET {cols} WHERE id = ?", (*fields.values(), job_id))
+
+    def progress(self, job_id, ok, level, message):
+        """Advance a job's counters and log one event in a single transaction."""
+        with self.lock:
+            self.conn.execute("BEGIN")
+            self.conn.execute("UPDATE jobs SET done = done + 1, errors = errors + ? WHERE id = ?", (0 if ok else 1, job_id))
+            self.conn.execute("INSERT INTO events (job_id, time, level, message) VALUES (?, ?, ?, ?)",
+                              (job_id, time.time(), level, message))
+            self.conn.execute("COMMIT")
+
+    def event(self, job_id, level, message):
+        with self.lock:
+            self.conn.execute("INSERT INTO events (job_id, time, level, message) VALUES (?, ?, ?, ?)",
+                              (job_id, time.time(), level, message))
+
+    def _query(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def agents(self, job_id):
+        rows = self._query("SELECT agents FROM jobs WHERE id = ?", (job_id,))
+        return json.loads(rows[0][0]) if rows else []
+
+    def get(self, job_id):
+        rows = self._query(f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs WHERE id = ?", (job_id,))
+        return dict(zip(JOB_COLUMNS, rows[0])) if rows else None
+
+    def recent(self, limit=10):
+        rows = self._query(f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs ORDER BY created DESC LIMIT ?", (limit,))
+        return [dict(zip(JOB_COLUMNS, r)) for r in rows]
+
+    def with_status(self, *statuses):
+        marks = ", ".join("?" for _ in statuses)
+        return [r[0] for r in self._query(f"SELECT id FROM jobs WHERE status IN ({marks}) ORDER BY created", statuses)]
+
+    def events(self, job_id, after=0, limit=500):
+        """Events of a job with seq > after, oldest first: poll with the last seq seen."""
+        rows = self._query(
+            "SELECT seq, time, level, message FROM events WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+            (job_id, after, limit))
+        return [{"seq": s, "time": t, "level": lvl, "message": m} for s, t, lvl, m in rows]
+
+# ------------------ EXECUTION ------------------
+
+def run_job(store, job_id):
+    """Run every task of every agent in a job through the crew executor, recording progress.
+
+    Results also feed the run-history rollups, with the job id as the run id.
+    """
+    store.update(job_id, status="running", started=time.time())
+    agents = store.agents(job_id)
+    metrics = get_metrics()
+    metrics.start_run(job_id, len(agents), sum(len(a.get("tasks") or []) for a in agents))
+    store.event(job_id, "info", f"Dispatching {len(agents)} agents")
+    try:
+        for data in agents:
+            agent = ForgeAgent({**data, "id": data.get("id") or data.get("employee_id")})
+            for task in data.get("tasks") or []:
+                task = {**task, "id": task.get("id") or task.get("default_filename")}
+                result = agent.perform_task(task)
+                metrics.record(job_id, result, data.get("team"))
+                ok = result["status"] == "completed"
+                label = task.get("name") or task["id"]
+                if ok:
+                    store.progress(job_id, True, "info", f"✅ {agent.name}: {label}")
+                else:
+                    store.progress(job_id, False, "error", f"❌ {agent.name}: {label} - {result.get('error')}")
+            metrics.flush()
+        job = store.get(job_id)
+        store.update(job_id, status="done", finished=time.time())
+        store.event(job_id, "info", f"Finished: {job['done']}/{job['total']} tasks, {job['errors']} errors")
+    except Exception:
+        store.update(job_id, status="failed", finished=time.time())
+        store.event(job_id, "error", traceback.format_exc())
+    finally:
+        metrics.finish_run(job_id)
+
+class LaunchQueue:
+    def __init__(self, store, workers=WORKERS):
+        self.store = store
+        self.pending = queue.Queue()
+        for job_id in store.with_status("running"):
+            store.update(job_id, status="interrupted", finished=time.time())
+            store.event(job_id, "error", "Interrupted by a restart before completion")
+        for job_id in store.with_status("queued"):
+            self.pending.put(job_id)
+        self.threads = [threading.Thread(target=self._work, name=f"forge-launch-{i}", daemon=True)
+                        for i in range(max(1, workers))]
+        for t in self.threads:
+            t.start()
+
+    def submit(self, agents, project_type=None, prompt=None):
+        """Queue a launch and return its job id immediately."""
+        job_id = self.store.create(agents, project_type, prompt)
+        self.store.event(job_id, "info", f"Queued {len(agents)} agents for a {project_type} project")
+        self.pending.put(job_id)
+        return job_id
+
+    def _work(self):
+        while True:
+            run_job(self.store, self.pending.get())
+
+_QUEUES = {}
+_QUEUES_LOCK = threading.Lock()
+
+def get_queue(path=JOBS_DB, workers=WORKERS):
+    """Shared launch queue per status store; workers start on first use."""
+    key = os.path.abspath(path)
+    with _QUEUES_LOCK:
+        if key not in _QUEUES:
+            _QUEUES[key] = LaunchQueue(JobStore(path), workers)
+        return _QUEUES[key]
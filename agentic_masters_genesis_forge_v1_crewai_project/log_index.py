@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Log Index
+──────────────────────────────────
+Incremental indexer for agent attempt logs:
+ - Remembers byte offset, inode, mtime and a digest of the last indexed bytes per log file
+ - Scans only bytes appended since the previous probe
+ - Rescans a file from zero when it is rotated, truncated or rewritten in place
+   (mtime moved without growth, or the bytes before the offset changed)
+ - Keeps a small inverted index: signature → {run: hit count}
+
+Diagnostics answer "which runs produced agent output" from the index
+instead of rereading every log.
+"""
+import os, json, fnmatch, hashlib
+
+SIGNATURES = ("Final Answer", "Task Completed")
+INDEX_PATH = os.path.join("memory", "log_index.json")
+SKIP_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__"}
+CHUNK = 1 << 20
+TAIL = 256  # bytes before the offset fingerprinted to spot in-place rewrites
+
+def run_id(path):
+    """Run key for a log file, e.g. outputs/dev_run_3_101500.log → dev_run_3_101500."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+def _tail_digest(f, offset):
+    start = max(0, offset - TAIL)
+    f.seek(start)
+    return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+class LogIndex:
+    def __init__(self, root=".", index_path=INDEX_PATH, signatures=SIGNATURES, pattern="*.log"):
+        self.root = root
+        self.index_path = index_path
+        self.signatures = tuple(signatures)
+        self.pattern = pattern
+        self.files = {}
+        self.postings = {sig: {} for sig in self.signatures}
+        self.load()
+
+    # ------------------ PERSISTENCE ------------------
+
+    def load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if tuple(data.get("signatures", ())) != self.signatures:
+            return  # signature set changed, rebuild from scratch
+        self.files = data.get("files", {})
+        for sig, runs in data.get("postings", {}).items():
+            self.postings.setdefault(sig, {}).update(runs)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"signatures": list(self.signatures), "files": self.files,
+                       "postings": self.postings}, f)
+        os.replace(tmp, self.index_path)
+
+    # ------------------ SCANNING ------------------
+
+    def discover(self):
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for name in fnmatch.filter(filenames, self.pattern):
+                yield os.path.normpath(os.path.join(dirpath, name))
+
+    def _forget(self, path):
+        run = run_id(path)
+        for sig, count in self.files.get(path, {}).get("hits", {}).items():
+            runs = self.postings.get(sig, {})
+            runs[run] = runs.get(run, 0) - count
+            if runs[run] <= 0:
+                runs.pop(run, None)
+        self.files.pop(path, None)
+
+    def _rewritten(self, path, state, st):
+        """True if the indexed prefix of a file no longer matches what was scanned."""
+        if st.st_mtime_ns == state.get("mtime_ns"):
+            return False
+        if st.st_size == state["offset"]:
+            return True  # modified without growing: rewritten in place
+        with open(path, "rb") as f:
+            return _tail_digest(f, state["offset"]) != state.get("tail")
+
+    def _scan(self, path, st):
+        state = self.files.get(path)
+        if state and (state["inode"] != st.st_ino or st.st_size < state["offset"] or self._rewritten(path, state, st)):
+            self._forget(path)  # rotated, truncated or rewritten
+            state = None
+        if state is None:
+            state = {"inode": st.st_ino, "mtime_ns": 0, "offset": 0, "tail": None, "carry": "", "hits": {}}
+            self.files[path] = state
+        if st.st_size == state["offset"] and st.st_mtime_ns == state["mtime_ns"]:
+            return 0
+
+        overlap = max(len(s) for s in self.signatures) - 1
+        carry = state["carry"]
+        found = 0
+        with open(path, "rb") as f:
+            f.seek(state["offset"])
+            while True:
+                chunk = f.read(CHUNK)
+                if not chunk:
+                    break
+                state["offset"] += len(chunk)
+                text = carry + chunk.decode("utf-8", errors="ignore")
+                for sig in self.signatures:
+                    # skip matches lying wholly inside the carried tail; they were counted already
+                    n = text.count(sig, max(0, len(carry) - len(sig) + 1))
+                    if n:
+                        state["hits"][sig] = state["hits"].get(sig, 0) + n
+                        runs = self.postings.setdefault(sig, {})
+                        runs[run_id(path)] = runs.get(run_id(path), 0) + n
+                        found += n
+                carry = text[-overlap:] if overlap else ""
+            state["tail"] = _tail_digest(f, state["offset"])
+            # mtime as of the bytes actually read, so appends during the scan don't look like a rewrite
+            state["mtime_ns"] = os.fstat(f.fileno()).st_mtime_ns
+        state["carry"] = carry
+        return found
+
+    def update(self):
+        """Index new bytes in every log under root. Returns the number of new signature hits."""
+        found = 0
+        seen = set()
+        for path in self.discover():
+            seen.add(path)
+            try:
+                found += self._scan(path, os.stat(path))
+            except OSError:
+                continue
+        for path in list(self.files):
+            if path not in seen:
+                self._forget(path)
+        self.save()
+        return found
+
+    # ------------------ QUERIES ------------------
+
+    def runs_with(self, signature):
+        return dict(self.postings.get(signature, {}))
+
+    def active_logs(self):
+        """Log files containing at least one signature."""
+        return sorted(p for p, s in self.files.items() if any(s["hits"].values()))
+
+    def hit_count(self, signature=None):
+        sigs = [signature] if signature else self.signatures
+        return sum(sum(self.postings.get(s, {}).values()) for s in sigs)
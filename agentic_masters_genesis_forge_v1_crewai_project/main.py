@@ -14,7 +14,7 @@ def run_diagnostics():
     print(Fore.CYAN + "📁 Directory structure validated. Config and memory paths resolved.")
     print(Fore.CYAN + "🧠 Agent and task formats normalized. Ready for dispatch.")
 
-def validate_forge(memory):
+def validate_forge(memory, metrics=None):
     print(Fore.YELLOW + "📦 Validation: Checking deliverables and fallback logs...")
     if not memory.get("runs"):
         print(Fore.RED + "❌ No runs recorded in memory.")
@@ -23,9 +23,13 @@ def validate_forge(memory):
         print(Fore.YELLOW + f"🧾 Last run timestamp: {time.ctime(last_run['timestamp'])}")
         print(Fore.YELLOW + f"👥 Agents involved: {len(last_run.get('agents', []))}")
         print(Fore.YELLOW + f"📋 Tasks executed: {len(last_run.get('results', []))}")
-        errors = [r for r in last_run["results"] if r["status"] == "error"]
+        rollup = metrics.runs(1) if metrics and last_run.get("run_id") else []
+        if rollup and rollup[0]["run_id"] == last_run["run_id"]:
+            errors = rollup[0]["errors"]
+        else:
+            errors = sum(1 for r in last_run["results"] if r["status"] == "error")
         if errors:
-            print(Fore.RED + f"⚠️ {len(errors)} errors detected. All delegated and retried.")
+            print(Fore.RED + f"⚠️ {errors} errors detected. All delegated and retried.")
         else:
             print(Fore.GREEN + "✅ No errors detected in last run.")
 
@@ -36,7 +40,7 @@ def main():
     print(Fore.CYAN + "\n🔍 Running system diagnostics...\n")
     run_diagnostics()
     print(Fore.YELLOW + "\n🧩 Validating Forge deliverables...\n")
-    validate_forge(crew.memory)
+    validate_forge(crew.memory, crew.metrics)
     print(Fore.GREEN + "\n🌟 Forge operation complete — deliverables generated and verified.\n")
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Narrator
+─────────────────────────────────
+Asynchronous narration pipeline so voice never blocks a forge cycle:
+ - say() only enqueues and returns immediately
+ - a synth worker prepares clips (cache lookup / TTS) ahead of playback
+ - a playback worker plays them in order
+ - drop-if-late: lines older than max_lag seconds when their turn comes are skipped
+ - close(timeout) lets the last lines finish at shutdown
+
+prepare(agent, text) returns a playable handle (e.g. a voice_cache.Clip, or None);
+play(handle, agent, text) performs it, including any local fallback.
+"""
+import os, time, queue, threading
+
+MAX_LAG = float(os.getenv("FORGE_NARRATION_MAX_LAG", "0")) or None
+_STOP = object()
+
+class Narrator:
+    def __init__(self, prepare, play, max_lag=MAX_LAG, maxsize=32):
+        self.prepare = prepare
+        self.play = play
+        self.max_lag = max_lag
+        self.pending = queue.Queue(maxsize)
+        self.ready = queue.Queue()
+        self.spoken = 0
+        self.dropped = 0
+        self.closed = False
+        self.synth_thread = threading.Thread(target=self._synth_loop, name="narrator-synth", daemon=True)
+        self.play_thread = threading.Thread(target=self._play_loop, name="narrator-play", daemon=True)
+        self.synth_thread.start()
+        self.play_thread.start()
+
+    def say(self, agent, text, pause_after=0.0, max_lag=None):
+        """Queue a line. Returns False if it was dropped because the queue is full or closed."""
+        if self.closed:
+            return False
+        lag = max_lag if max_lag is not None else self.max_lag
+        try:
+            self.pending.put_nowait((time.monotonic(), agent, text, pause_after, lag))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _synth_loop(self):
+        while True:
+            item = self.pending.get()
+            if item is _STOP:
+                self.ready.put(_STOP)
+                return
+            queued, agent, text, pause_after, lag = item
+            handle = None
+            if not (lag and time.monotonic() - queued > lag):
+                try:
+                    handle = self.prepare(agent, text)
+                except Exception as e:
+                    print(f"⚠️ Narration synthesis skipped ({agent}): {e}")
+            self.ready.put((queued, agent, text, pause_after, lag, handle))
+
+    def _play_loop(self):
+        while True:
+            item = self.ready.get()
+            if item is _STOP:
+                return
+            queued, agent, text, pause_after, lag, handle = item
+            if lag and time.monotonic() - queued > lag:
+                self.dropped += 1
+                continue
+            try:
+                self.play(handle, agent, text)
+                self.spoken += 1
+            except Exception as e:
+                print(f"⚠️ Narration playback skipped ({agent}): {e}")
+            if pause_after:
+                time.sleep(pause_after)
+
+    def close(self, timeout=None):
+        """Stop accepting lines and wait up to `timeout` seconds for queued ones to play."""
+        if self.closed:
+            return
+        self.closed = True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self.pending.put(_STOP, timeout=timeout)
+        except queue.Full:
+            # still backed up after the timeout: drop what hasn't been synthesized so the workers can stop
+            self._drain()
+        self.play_thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def _drain(self):
+        while True:
+            try:
+                self.pending.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            try:
+                self.pending.put_nowait(_STOP)
+                return
+            except queue.Full:
+                continue
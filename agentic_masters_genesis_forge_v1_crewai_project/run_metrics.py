@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Run Metrics
+────────────────────────────────────
+Pre-aggregated run history for dashboards, maintained as results are written:
+ - per-run, per-team and per-agent rollups of completions, errors and repairs
+   (completions/errors count primary attempts only; repair retries count as repairs)
+ - latency kept as log-spaced histograms per scope (~12% bucket width), so
+   p50/p90/p99 come from a handful of rows instead of raw results
+ - record() only accumulates deltas in memory; flush() upserts them in one transaction
+
+Readers never touch crew_memory.json. `python run_metrics.py --backfill` imports
+runs recorded before the metrics store existed.
+"""
+import os, sys, json, math, time, sqlite3, threading, argparse
+from collections import defaultdict
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+METRICS_DB = os.getenv("FORGE_METRICS_DB", os.path.join(BASE_DIR, "memory", "run_metrics.db"))
+MEMORY_PATH = os.path.join(BASE_DIR, "memory", "crew_memory.json")
+
+BUCKET_BASE = 1.25  # histogram bucket b covers (BUCKET_BASE**b, BUCKET_BASE**(b+1)] milliseconds
+PERCENTILES = (50, 90, 99)
+COUNTERS = ("completions", "errors", "repairs")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started REAL NOT NULL,
+    finished REAL,
+    agents INTEGER NOT NULL DEFAULT 0,
+    tasks INTEGER NOT NULL DEFAULT 0,
+    completions INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    repairs INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started);
+CREATE TABLE IF NOT EXISTS team_stats (
+    run_id TEXT NOT NULL,
+    team TEXT NOT NULL,
+    completions INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    repairs INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, team)
+);
+CREATE TABLE IF NOT EXISTS agent_stats (
+    run_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    team TEXT NOT NULL,
+    completions INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    repairs INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, agent_id)
+);
+CREATE TABLE IF NOT EXISTS latency (
+    run_id TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (run_id, scope, key, bucket)
+);
+"""
+
+def bucket_of(seconds):
+    ms = seconds * 1000.0
+    return 0 if ms <= 1.0 else math.ceil(math.log(ms) / math.log(BUCKET_BASE)) - 1
+
+def bucket_upper(bucket):
+    """Upper edge of a histogram bucket, in seconds."""
+    return BUCKET_BASE ** (bucket + 1) / 1000.0
+
+def percentiles(histogram, qs=PERCENTILES):
+    """{q: seconds} from a {bucket: count} histogram (upper bucket edge, so never under-reported)."""
+    total = sum(histogram.values())
+    if not total:
+        return {q: None for q in qs}
+    out, seen = {}, 0
+    targets = sorted(qs)
+    it = iter(sorted(histogram.items()))
+    for q in targets:
+        rank = math.ceil(q / 100 * total)
+        while seen < rank:
+            bucket, count = next(it)
+            seen += count
+        out[q] = bucket_upper(bucket)
+    return out
+
+class RunMetrics:
+    def __init__(self, path=METRICS_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._runs = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        self._teams = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        self._agents = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        self._latency = defaultdict(int)
+
+    # ------------------ WRITING ------------------
+
+    def start_run(self, run_id, agents=0, tasks=0, started=None):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO runs (run_id, started, agents, tasks) VALUES (?, ?, ?, ?)",
+                (run_id, started or time.time(), agents, tasks))
+
+    def record(self, run_id, result, team=None, repair=False):
+        """Fold one crew result into the pending rollups (written on flush).
+
+        A repair retry only counts towards repairs, so completions and errors stay
+        the outcome of each task's primary attempt.
+        """
+        team = team or "Unassigned"
+        agent = str(result.get("agent_id") or "unknown")
+        if repair:
+            field = "repairs"
+        else:
+            field = "completions" if result.get("status") == "completed" else "errors"
+        with self.lock:
+            for row in (self._runs[run_id], self._teams[(run_id, team)], self._agents[(run_id, agent, team)]):
+                row[field] += 1
+            duration = result.get("duration")
+            if duration is not None:
+                b = bucket_of(duration)
+                for scope, key in (("run", ""), ("team", team), ("agent", agent)):
+                    self._latency[(run_id, scope, key, b)] += 1
+
+    def flush(self):
+        with self.lock:
+            if not self._runs:
+                return
+            upsert = ", ".join(f"{c} = {c} + excluded.{c}" for c in COUNTERS)
+            c = self.conn
+            c.execute("BEGIN")
+            for run_id, d in self._runs.items():
+                c.execute(f"INSERT INTO runs (run_id, started, completions, errors, repairs) VALUES (?, ?, ?, ?, ?) "
+                          f"ON CONFLICT(run_id) DO UPDATE SET {upsert}",
+                          (run_id, time.time(), *(d[k] for k in COUNTERS)))
+            c.executemany(f"INSERT INTO team_stats (run_id, team, completions, errors, repairs) VALUES (?, ?, ?, ?, ?) "
+                          f"ON CONFLICT(run_id, team) DO UPDATE SET {upsert}",
+                          [(*key, *(d[k] for k in COUNTERS)) for key, d in self._teams.items()])
+            c.executemany(f"INSERT INTO agent_stats (run_id, agent_id, team, completions, errors, repairs) VALUES (?, ?, ?, ?, ?, ?) "
+                          f"ON CONFLICT(run_id, agent_id) DO UPDATE SET {upsert}",
+                          [(*key, *(d[k] for k in COUNTERS)) for key, d in self._agents.items()])
+            c.executemany("INSERT INTO latency (run_id, scope, key, bucket, count) VALUES (?, ?, ?, ?, ?) "
+                          "ON CONFLICT(run_id, scope, key, bucket) DO UPDATE SET count = count + excluded.count",
+                          [(*key, n) for key, n in self._latency.items()])
+            c.execute("COMMIT")
+            self._reset()
+
+    def finish_run(self, run_id, finished=None):
+        self.flush()
+        with self.lock:
+            self.conn.execute("UPDATE runs SET finished = ? WHERE run_id = ?", (finished or time.time(), run_id))
+
+    # ------------------ READING ------------------
+
+    def _query(self, sql, params=()):
+        with self.lock:
+            cur = self.conn.execute(sql, params)
+            cols = [d[0] for d in cur.description]
+            return [dict(zip(cols, r)) for r in cur.fetchall()]
+
+    def runs(self, limit=50):
+        """Most recent runs first."""
+        return self._query("SELECT * FROM runs ORDER BY started DESC LIMIT ?", (limit,))
+
+    def teams(self, run_id=None):
+        """Per-team rollup for one run, or summed over all runs."""
+        where, params = ("WHERE run_id = ?", (run_id,)) if run_id else ("", ())
+        return self._query(
+            f"SELECT team, SUM(completions) AS completions, SUM(errors) AS errors, SUM(repairs) AS repairs "
+            f"FROM team_stats {where} GROUP BY team ORDER BY team", params)
+
+    def agents(self, run_id=None, team=None, limit=100):
+        """Per-agent rollup, most errors first."""
+        clauses, params = [], []
+        if run_id:
+            clauses.append("run_id = ?"); params.append(run_id)
+        if team:
+            clauses.append("team = ?"); params.append(team)
+        where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+        return self._query(
+            f"SELECT agent_id, team, SUM(completions) AS completions, SUM(errors) AS errors, SUM(repairs) AS repairs "
+            f"FROM agent_stats {where} GROUP BY agent_id, team ORDER BY errors DESC, agent_id LIMIT ?", (*params, limit))
+
+    def latency(self, scope="run", key="", run_id=None, qs=PERCENTILES):
+        """Latency percentiles (seconds) for a scope key, for one run or across all runs."""
+        where, params = "scope = ? AND key = ?", [scope, key]
+        if run_id:
+            where += " AND run_id = ?"; params.append(run_id)
+        rows = self._query(f"SELECT bucket, SUM(count) AS n FROM latency WHERE {where} GROUP BY bucket", params)
+        return percentiles({r["bucket"]: r["n"] for r in rows}, qs)
+
+    # ------------------ BACKFILL ------------------
+
+    def backfill(self, memory_path=MEMORY_PATH, teams=None):
+        """Import runs from crew_memory.json that the store has not seen yet. Returns runs added."""
+        with open(memory_path, encoding="utf-8") as f:
+            memory = json.load(f)
+        known = {r["run_id"] for r in self._query("SELECT run_id FROM runs")}
+        teams = teams or {}
+        added = 0
+        for run in memory.get("runs", []):
+            run_id = run.get("run_id") or f"legacy-{run.get('timestamp')}"
+            if run_id in known:
+                continue
+            self.start_run(run_id, len(run.get("agents", [])), len(run.get("tasks", [])), run.get("timestamp"))
+            for result in run.get("results", []):
+                self.record(run_id, result, teams.get(result.get("agent_id")))
+            self.finish_run(run_id, run.get("timestamp"))
+            added += 1
+        return added
+
+_METRICS = {}
+
+def get_metrics(path=METRICS_DB):
+    """Shared metrics store per database path."""
+    key = os.path.abspath(path)
+    if key not in _METRICS:
+        _METRICS[key] = RunMetrics(path)
+    return _METRICS[key]
+
+def agent_teams():
+    """agent id -> team label from config/agents.yaml."""
+    import yaml
+    with open(os.path.join(BASE_DIR, "config", "agents.yaml"), encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    agents = data.get("agents", []) if isinstance(data, dict) else data or []
+    return {a.get("id"): a.get("team") for a in agents if isinstance(a, dict)}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Forge run metrics")
+    parser.add_argument("--backfill", action="store_true", help="import runs from crew_memory.json")
+    args = parser.parse_args()
+    metrics = get_metrics()
+    if args.backfill:
+        print(f"📥 Imported {metrics.backfill(teams=agent_teams())} runs from {MEMORY_PATH}")
+    for run in metrics.runs(10):
+        print(f"{time.ctime(run['started'])}  {run['run_id']}: {run['completions']} completed, "
+              f"{run['errors']} errors, {run['repairs']} repairs")
+    sys.exit(0)
@@ -1,11 +1,27 @@
-import yaml, random, os
-from collections import defaultdict
+import yaml, random, os, sys, gc, re, json, shutil, argparse, itertools
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+
+# LibYAML bindings when available; the pure-Python emitter dominates on large mappings
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+class Dumper(getattr(yaml, "CSafeDumper", yaml.SafeDumper)):
+    # enriched dossiers are plain trees: skip anchor bookkeeping for every node
+    def ignore_aliases(self, data):
+        return True
 
 # === PATHS ===
 PREFILL_PATH = "ui/prefill_mappings.yaml"
 BACKUP_PATH = "ui/backup/prefill_mappings_backup.yaml"
 TEAMS_PATH = "ui/teams.yaml"
 MASTER_FORGE_PATH = "ui/master_forge.yaml"
+ROSTER_PATH = "ui/roster.jsonl"
+
+# === SHARDING ===
+SHARD_SIZE = 2000
+DEFAULT_SEED = 2025
 
 # === CONFIG ===
 ROLE_TO_TEAM = {
@@ -18,6 +34,17 @@ ROLE_TO_TEAM = {
     "Consent": "Legal & Privacy", "FOIA": "Legal & Privacy", "eDiscovery": "Legal & Privacy"
 }
 
+DEFAULT_TEAM = "General Ops"
+
+# checked in order, case-sensitive: the first rule with a keyword in the role wins
+PERSONA_RULES = [
+    (("Audit", "Governance"), "Strict compliance enforcer with zero tolerance for ambiguity"),
+    (("Memory",), "Long-context strategist with deep recall and semantic threading"),
+    (("Dispatch",), "Fast-routing tactician with fallback logic and verification rituals"),
+    (("Tone", "UX"), "Empathic communicator tuned for multilingual emotional resonance"),
+]
+DEFAULT_PERSONA = "Modular agent with adaptive orchestration capabilities"
+
 TOOLS_BY_EXTENSION = {
     "py": ["Python", "Debugger", "Validator"], "json": ["JSON", "Registry", "Tracker"],
     "yaml": ["YAML", "Pipeline", "Protocol"], "md": ["Markdown", "Documentation"],
@@ -27,56 +54,137 @@ TOOLS_BY_EXTENSION = {
 
 PHYSICAL_FORMS = ["Hologram", "Avatar", "Drone", "Console", "Terminal", "Floating HUD", "AR Panel"]
 
+MAX_SKIP_WARNINGS = 10
+
 # === UTILS ===
-def generate_name():
-    first = random.choice(["Nova", "Echo", "Zara", "Axel", "Kai", "Luna", "Orion", "Juno", "Rex", "Vega"])
-    last = random.choice(["Prime", "Core", "Flux", "Drift", "Pulse", "Forge", "Trace", "Spark", "Byte", "Node"])
+def generate_name(rng=random):
+    first = rng.choice(["Nova", "Echo", "Zara", "Axel", "Kai", "Luna", "Orion", "Juno", "Rex", "Vega"])
+    last = rng.choice(["Prime", "Core", "Flux", "Drift", "Pulse", "Forge", "Trace", "Spark", "Byte", "Node"])
     return f"{first} {last}"
 
+# === ROLE MATCHER ===
+# One case-insensitive scan finds every keyword occurrence; rule priority is then
+# resolved from a precomputed table, so matching cost does not grow with the rule count.
+TEAM_PRIORITY = {}
+for rank, (keyword, team) in enumerate(ROLE_TO_TEAM.items()):
+    TEAM_PRIORITY.setdefault(keyword.lower(), (rank, team))
+PERSONA_PRIORITY = {}
+for rank, (keywords, persona) in enumerate(PERSONA_RULES):
+    for keyword in keywords:
+        PERSONA_PRIORITY.setdefault(keyword, (rank, persona))
+
+KEYWORDS = sorted(set(TEAM_PRIORITY) | {k.lower() for k in PERSONA_PRIORITY}, key=len, reverse=True)
+# lookahead so overlapping keywords are all seen; longest alternative wins at a position
+KEYWORD_SCAN = re.compile("(?=(" + "|".join(map(re.escape, KEYWORDS)) + "))", re.I)
+# keywords that are prefixes of a longer one also occur wherever the longer one matched
+PREFIXES = {k: [p for p in KEYWORDS if k.startswith(p)] for k in KEYWORDS}
+
+@lru_cache(maxsize=None)
+def match_role(role):
+    """(team, persona) for a role string, in one pass; memoized per distinct role."""
+    team, persona = (len(ROLE_TO_TEAM), DEFAULT_TEAM), (len(PERSONA_RULES), DEFAULT_PERSONA)
+    for m in KEYWORD_SCAN.finditer(role):
+        start = m.start()
+        for keyword in PREFIXES[m.group(1).lower()]:
+            team = min(team, TEAM_PRIORITY.get(keyword, team))
+            persona = min(persona, PERSONA_PRIORITY.get(role[start:start + len(keyword)], persona))
+    return team[1], persona[1]
+
 def infer_team(role):
-    for keyword, team in ROLE_TO_TEAM.items():
-        if keyword.lower() in role.lower():
-            return team
-    return "General Ops"
+    return match_role(role)[0]
 
-def infer_tools(tasks):
+@lru_cache(maxsize=None)
+def _tools_for(extensions):
     tools = set()
-    for task in tasks:
-        ext = task.get("file_type", "")
+    for ext in extensions:
         tools.update(TOOLS_BY_EXTENSION.get(ext, []))
-    return sorted(tools)
+    return tuple(sorted(tools))
+
+def infer_tools(tasks):
+    return list(_tools_for(frozenset(task.get("file_type", "") for task in tasks)))
 
 def infer_persona(role):
-    if "Audit" in role or "Governance" in role:
-        return "Strict compliance enforcer with zero tolerance for ambiguity"
-    if "Memory" in role:
-        return "Long-context strategist with deep recall and semantic threading"
-    if "Dispatch" in role:
-        return "Fast-routing tactician with fallback logic and verification rituals"
-    if "Tone" in role or "UX" in role:
-        return "Empathic communicator tuned for multilingual emotional resonance"
-    return "Modular agent with adaptive orchestration capabilities"
+    return match_role(role)[1]
 
 def infer_rate(tools):
     base = 35
     return base + len(tools) * 5
 
+@contextmanager
+def gc_paused():
+    """Bulk YAML load/emit allocates millions of small objects; cyclic GC passes only slow it down."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def dump_yaml(data):
+    return yaml.dump(data, Dumper=Dumper, sort_keys=False, default_flow_style=False).encode("utf-8")
+
+def write_atomic(path, data):
+    """Write bytes to `path` via a temp file so readers never see a half-written YAML."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+# === ENRICHMENT ===
+def enrich_agent(agent, i, rng=random):
+    """Fill in dossier fields for the agent at 1-based position i. Returns a skip reason or None."""
+    if not isinstance(agent, dict):
+        return f"non-dict entry at index {i}: {type(agent)}"
+    if "role" not in agent or "tasks" not in agent:
+        return f"incomplete agent at index {i}: missing 'role' or 'tasks'"
+
+    agent["employee_id"] = f"AGENT-{i:04d}"
+    agent["name"] = generate_name(rng)
+    agent["team"] = infer_team(agent["role"])
+    agent["persona"] = infer_persona(agent["role"])
+    agent["tools_assigned"] = infer_tools(agent["tasks"])
+    agent["hourly_rate"] = infer_rate(agent["tools_assigned"])
+    agent["physical_form"] = rng.choice(PHYSICAL_FORMS)
+    return None
+
+def print_summary(count, teams, skipped, outputs):
+    for reason in skipped[:MAX_SKIP_WARNINGS]:
+        print(f"⚠️ Skipping {reason}")
+    if len(skipped) > MAX_SKIP_WARNINGS:
+        print(f"⚠️ ... and {len(skipped) - MAX_SKIP_WARNINGS} more skipped entries")
+
+    print(f"\n✅ Enriched {count} agents across {len(teams)} teams ({len(skipped)} skipped).")
+    for team, roles in sorted(teams.items(), key=lambda kv: -len(kv[1])):
+        print(f"   • {team}: {len(roles)}")
+    print("\n🎯 Dossier compilation complete:")
+    for label, path in outputs:
+        print(f"→ {label} written to: {path}")
+
+def backup_prefill():
+    os.makedirs(os.path.dirname(BACKUP_PATH), exist_ok=True)
+    shutil.copyfile(PREFILL_PATH, BACKUP_PATH + ".tmp")
+    os.replace(BACKUP_PATH + ".tmp", BACKUP_PATH)
+    print("📦 Backup saved to ui/backup/prefill_mappings_backup.yaml")
+
 # === MAIN ===
-def compile_dossier():
+def compile_dossier(verbose=False):
     # Ensure backup folder exists
     os.makedirs(os.path.dirname(BACKUP_PATH), exist_ok=True)
 
-    # Backup original
-    if os.path.exists(PREFILL_PATH):
-        with open(PREFILL_PATH, "r") as f:
-            original = f.read()
-        with open(BACKUP_PATH, "w") as f:
-            f.write(original)
-        print("📦 Backup saved to ui/backup/prefill_mappings_backup.yaml")
+    if not os.path.exists(PREFILL_PATH):
+        print(f"❌ ERROR: {PREFILL_PATH} not found.")
+        return
 
-    # Load agents
-    with open(PREFILL_PATH, "r") as f:
-        agents = yaml.safe_load(f)
+    # Read once: the same bytes feed the backup and the parser
+    with open(PREFILL_PATH, "rb") as f:
+        original = f.read()
+    write_atomic(BACKUP_PATH, original)
+    print("📦 Backup saved to ui/backup/prefill_mappings_backup.yaml")
+
+    with gc_paused():
+        agents = yaml.load(original, Loader=Loader)
 
     if not isinstance(agents, list):
         print("❌ ERROR: prefill_mappings.yaml must be a top-level list of agent dictionaries.")
@@ -84,40 +192,146 @@ def compile_dossier():
 
     enriched_agents = []
     teams = defaultdict(list)
+    skipped = []
 
     for i, agent in enumerate(agents, start=1):
-        if not isinstance(agent, dict):
-            print(f"⚠️ Skipping non-dict entry at index {i}: {type(agent)}")
-            continue
-        if "role" not in agent or "tasks" not in agent:
-            print(f"⚠️ Skipping incomplete agent at index {i}: missing 'role' or 'tasks'")
+        reason = enrich_agent(agent, i)
+        if reason:
+            skipped.append(reason)
             continue
 
-        agent["employee_id"] = f"AGENT-{i:04d}"
-        agent["name"] = generate_name()
-        agent["team"] = infer_team(agent["role"])
-        agent["persona"] = infer_persona(agent["role"])
-        agent["tools_assigned"] = infer_tools(agent["tasks"])
-        agent["hourly_rate"] = infer_rate(agent["tools_assigned"])
-        agent["physical_form"] = random.choice(PHYSICAL_FORMS)
-
         enriched_agents.append(agent)
         teams[agent["team"]].append(agent["role"])
 
-        print(f"✅ Enriched agent {agent['employee_id']}: {agent['role']} → Team: {agent['team']}")
+        if verbose:
+            print(f"✅ Enriched agent {agent['employee_id']}: {agent['role']} → Team: {agent['team']}")
 
-    # Write enriched mappings
-    with open(PREFILL_PATH, "w") as f:
-        yaml.dump(enriched_agents, f, sort_keys=False)
-    with open(TEAMS_PATH, "w") as f:
-        yaml.dump(dict(teams), f, sort_keys=False)
-    with open(MASTER_FORGE_PATH, "w") as f:
-        yaml.dump(enriched_agents, f, sort_keys=False)
+    # Serialize the enriched list once; prefill mappings and master forge share the bytes
+    with gc_paused():
+        enriched = dump_yaml(enriched_agents)
+        team_bytes = dump_yaml(dict(teams))
+    write_atomic(PREFILL_PATH, enriched)
+    write_atomic(TEAMS_PATH, team_bytes)
+    write_atomic(MASTER_FORGE_PATH, enriched)
 
-    print("\n🎯 Dossier compilation complete:")
-    print(f"→ Enriched agents written to: {PREFILL_PATH}")
-    print(f"→ Teams written to: {TEAMS_PATH}")
-    print(f"→ Master Forge written to: {MASTER_FORGE_PATH}")
+    print_summary(len(enriched_agents), teams, skipped, [
+        ("Enriched agents", PREFILL_PATH), ("Teams", TEAMS_PATH), ("Master Forge", MASTER_FORGE_PATH)])
+
+# === SHARDED MODE ===
+def split_sequence(path, shard_size):
+    """Yield (first 1-based index, raw YAML bytes) shards of a top-level block sequence.
+
+    Items are cut at column-0 "- " lines, so the file is never parsed as a whole.
+    """
+    shard, count, first = [], 0, 1
+    with open(path, "rb") as f:
+        for line in f:
+            if line.startswith(b"-") and line[1:2] in (b" ", b"\n", b"\r", b""):
+                if count == shard_size:
+                    yield first, b"".join(shard)
+                    first += count
+                    shard, count = [], 0
+                count += 1
+            elif not count:
+                continue  # header comments / document marker before the first item
+            shard.append(line)
+    if count:
+        yield first, b"".join(shard)
+
+def enrich_shard(job):
+    """Parse, enrich and serialize one shard. The RNG depends only on (seed, shard number)."""
+    shard_no, first, raw, seed = job
+    rng = random.Random(seed * 1_000_003 + shard_no)
+    with gc_paused():
+        agents = yaml.load(raw, Loader=Loader) or []
+    enriched, skipped = [], []
+    for i, agent in enumerate(agents, start=first):
+        reason = enrich_agent(agent, i, rng)
+        if reason:
+            skipped.append(reason)
+        else:
+            enriched.append(agent)
+    with gc_paused():
+        chunk = dump_yaml(enriched) if enriched else b""
+    roster = "".join(json.dumps(a, ensure_ascii=False, separators=(",", ":")) + "\n" for a in enriched)
+    team_roles = [(a["team"], a["role"]) for a in enriched]
+    return chunk, roster.encode("utf-8"), team_roles, skipped
+
+def iter_shards(jobs, workers):
+    """Enriched shards in input order, with at most 2 * workers shards in flight."""
+    if workers == 1:
+        yield from map(enrich_shard, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for job in jobs:
+            window.append(pool.submit(enrich_shard, job))
+            if len(window) >= 2 * workers:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+def compile_dossier_sharded(shard_size=SHARD_SIZE, workers=None, seed=DEFAULT_SEED):
+    """Enrich prefill mappings shard by shard in a process pool.
+
+    Output is reproducible for a given (seed, shard_size). Shards are streamed into
+    prefill_mappings.yaml, master_forge.yaml and a compact JSONL roster in input order;
+    all outputs are swapped in atomically once complete.
+    """
+    if not os.path.exists(PREFILL_PATH):
+        print(f"❌ ERROR: {PREFILL_PATH} not found.")
+        return
+    shards = split_sequence(PREFILL_PATH, shard_size)
+    head = next(shards, None)
+    if head is None:
+        print("❌ ERROR: prefill_mappings.yaml must be a top-level block list of agent dictionaries.")
+        return
+    backup_prefill()
+
+    workers = workers or os.cpu_count() or 1
+    shards = itertools.chain([head], shards)
+    jobs = ((n, first, raw, seed) for n, (first, raw) in enumerate(shards))
+    outputs = [PREFILL_PATH, MASTER_FORGE_PATH, ROSTER_PATH]
+    tmp = {path: f"{path}.{os.getpid()}.tmp" for path in outputs}
+    files = {path: open(tmp[path], "wb") for path in outputs}
+    teams = defaultdict(list)
+    skipped = []
+    count = 0
+    try:
+        for chunk, roster, team_roles, shard_skipped in iter_shards(jobs, workers):
+            files[PREFILL_PATH].write(chunk)
+            files[MASTER_FORGE_PATH].write(chunk)
+            files[ROSTER_PATH].write(roster)
+            for team, role in team_roles:
+                teams[team].append(role)
+            skipped.extend(shard_skipped)
+            count += len(team_roles)
+    except BaseException:
+        for path in outputs:
+            files[path].close()
+            os.remove(tmp[path])
+        raise
+    for path in outputs:
+        if not count and path != ROSTER_PATH:
+            files[path].write(b"[]\n")
+        files[path].close()
+        os.replace(tmp[path], path)
+    with gc_paused():
+        write_atomic(TEAMS_PATH, dump_yaml(dict(teams)))
+
+    print_summary(count, teams, skipped, [
+        ("Enriched agents", PREFILL_PATH), ("Teams", TEAMS_PATH),
+        ("Master Forge", MASTER_FORGE_PATH), ("JSONL roster", ROSTER_PATH)])
 
 if __name__ == "__main__":
-    compile_dossier()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Compile agent dossiers from ui/prefill_mappings.yaml")
+    parser.add_argument("--verbose", action="store_true", help="print one line per enriched agent")
+    parser.add_argument("--sharded", action="store_true", help="enrich in parallel shards and emit a JSONL roster")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    if args.sharded:
+        compile_dossier_sharded(args.shard_size, args.workers, args.seed)
+    else:
+        compile_dossier(verbose=args.verbose)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Similarity Index
+─────────────────────────────────────────
+Local content similarity for agents and deliverables, no model download:
+ - texts become hashed bag-of-words vectors (signed feature hashing, DIM buckets)
+ - sublinear TF weighted by IDF fitted on the indexed corpus, L2-normalized
+ - all items live in one float32 matrix; a batch of queries is one matrix product
+ - top-k uses argpartition per row, so ranking cost is linear in the corpus
+
+Requires NumPy. Callers treat an ImportError as "no similarity available" and
+fall back to their previous behaviour.
+"""
+import zlib, math
+import numpy as np
+from agentic_masters_genesis_forge_v1_crewai_project.deliverable_index import tokenize
+
+DIM = 1024
+QUERY_BATCH = 1024  # rows per matrix product when querying many texts at once
+
+def _bucket(token, dim):
+    h = zlib.crc32(token.encode("utf-8"))
+    return h % dim, (1.0 if h & 0x80000000 else -1.0)
+
+def hashed_counts(text, dim=DIM):
+    """Signed term-frequency vector of `text` (sublinear tf)."""
+    counts = {}
+    for tok in tokenize(text):
+        counts[tok] = counts.get(tok, 0) + 1
+    vec = np.zeros(dim, dtype=np.float32)
+    for tok, n in counts.items():
+        i, sign = _bucket(tok, dim)
+        vec[i] += sign * (1.0 + math.log(n))
+    return vec
+
+def _normalize(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+def agent_profile(agent):
+    """Searchable text of an agents.yaml entry: role, description, objectives and capabilities."""
+    parts = [agent.get("role") or "", agent.get("description") or ""]
+    for field in ("objectives", "capabilities"):
+        value = agent.get(field) or []
+        parts.extend(value if isinstance(value, list) else [str(value)])
+    return "\n".join(str(p) for p in parts)
+
+class SimilarityIndex:
+    def __init__(self, dim=DIM):
+        self.dim = dim
+        self.keys = []
+        self.idf = np.ones(dim, dtype=np.float32)
+        self.matrix = np.zeros((0, dim), dtype=np.float32)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def build(self, items):
+        """Index (key, text) pairs; texts are consumed one at a time. Keys must be unique."""
+        keys, rows, seen = [], [], set()
+        for key, text in items:
+            if key in seen:
+                raise ValueError(f"duplicate similarity key: {key!r}")
+            seen.add(key)
+            keys.append(key)
+            rows.append(hashed_counts(text, self.dim))
+        raw = np.vstack(rows) if rows else np.zeros((0, self.dim), dtype=np.float32)
+        df = np.count_nonzero(raw, axis=0)
+        self.idf = (np.log((1 + len(keys)) / (1 + df)) + 1).astype(np.float32)
+        self.keys = keys
+        self.matrix = _normalize(raw * self.idf)
+        return self
+
+    def vectors(self, texts):
+        raw = np.vstack([hashed_counts(t, self.dim) for t in texts]) if texts else np.zeros((0, self.dim), dtype=np.float32)
+        return _normalize(raw * self.idf)
+
+    def top_k(self, texts, k=5, exclude=None):
+        """Best (key, score) matches for each query text, as one list per text.
+
+        `exclude`, if given, holds one collection of keys to skip per query.
+        """
+        return self._rank(self.vectors(list(texts)), k, exclude)
+
+    def related(self, k=5):
+        """Nearest neighbours of every indexed item (itself excluded), in index order."""
+        return self._rank(self.matrix, k, None, skip_self=True)
+
+    def _rank(self, queries, k, exclude, skip_self=False):
+        n = len(self.keys)
+        if not n:
+            return [[] for _ in range(len(queries))]
+        positions = {key: i for i, key in enumerate(self.keys)} if exclude else {}
+        results = []
+        for start in range(0, len(queries), QUERY_BATCH):
+            scores = queries[start:start + QUERY_BATCH] @ self.matrix.T
+            for row, sims in enumerate(scores):
+                if skip_self:
+                    sims[start + row] = -np.inf
+                for key in exclude[start + row] if exclude else ():
+                    if key in positions:
+                        sims[positions[key]] = -np.inf
+                kk = min(k, n)
+                best = np.argpartition(-sims, kk - 1)[:kk]
+                best = best[np.argsort(-sims[best])]
+                results.append([(self.keys[i], float(sims[i])) for i in best if np.isfinite(sims[i])])
+        return results
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Streams agents and tasks configs for the Realms to Riches Forge.
+
+The spec (roles + phases) drives both outputs: every phase names a role, and
+agent names and task bindings are derived from the same role index, so a task's
+`agent` always refers to an agent that was generated. Records are written one
+at a time as YAML or JSONL, so memory stays flat for any team count.
+
+    python generate_forge_config.py --teams 1000 --format jsonl --out-dir /tmp/forge
+    python generate_forge_config.py --spec my_spec.yaml --kind tasks
+"""
+
+import os, sys, json, argparse
+import yaml
+
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+DEFAULT_OUT_DIR = "src/agentic_masters_genesis_forge/config"
+
+ROLES = [
+    "Architect", "Compiler", "System Analyst", "Data Engineer",
+    "Language Designer", "Security Auditor", "AI Trainer",
+    "Testing Engineer", "Integration Specialist", "Neural Broadcaster"
+]
+
+# Core forge construction sequence: (role, title, description)
+PHASES = [
+    ("Architect", "Forge Core Blueprint",
+     "Design the neural forge core architecture, including data pipelines, "
+     "execution environment, and memory management subsystems."),
+    ("Compiler", "Language Genesis",
+     "Draft the syntax, semantics, and grammar of the new Forge programming language."),
+    ("System Analyst", "Diagnostics Engine",
+     "Develop real-time system diagnostics and fault-detection modules."),
+    ("Data Engineer", "Knowledge Pipeline",
+     "Create ingestion and preprocessing pipelines for internal and external data."),
+    ("Language Designer", "Language Specification",
+     "Formalize tokenization, parsing, and AST handling."),
+    ("Security Auditor", "Security Framework",
+     "Implement multi-layer validation, sandboxing, and key management."),
+    ("AI Trainer", "Agent Training Suite",
+     "Develop prompt libraries, validation datasets, and fine-tuning workflow."),
+    ("Testing Engineer", "Testing Framework",
+     "Build pytest/unittest-based frameworks and CI/CD hooks."),
+    ("Integration Specialist", "System Integration",
+     "Integrate all forge components, verify dependencies, and deploy simulation."),
+    ("Neural Broadcaster", "Presentation Layer",
+     "Create narrative presentation and voice integration scripts.")
+]
+
+CAPABILITIES = [
+    "Autonomous reasoning", "Tool execution", "Report generation",
+    "Source-code synthesis", "Self-validation"
+]
+AGENT_TOOLS = [
+    "custom_tool.py",
+    "forge_project/performance_overdrive.py",
+    "forge_project/forge_master_runner.py"
+]
+VALIDATION = [
+    "Syntax linting",
+    "Unit test execution",
+    "Integration verification",
+    "Peer review by adjacent team"
+]
+
+# === SPEC ===
+class Spec:
+    def __init__(self, roles=ROLES, phases=PHASES):
+        self.roles = list(roles)
+        self.phases = [tuple(p) for p in phases]
+        self.role_index = {role: i for i, role in enumerate(self.roles, start=1)}
+        if len(self.role_index) != len(self.roles):
+            raise ValueError("duplicate role names in spec")
+        unknown = sorted({role for role, _, _ in self.phases} - set(self.role_index))
+        if unknown:
+            raise ValueError(f"phases reference roles that are not in the spec: {', '.join(unknown)}")
+
+    @classmethod
+    def load(cls, path):
+        """YAML/JSON spec: {roles: [...], phases: [{role, title, description}, ...]}."""
+        with open(path, encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        roles = data.get("roles", ROLES)
+        phases = [(p["role"], p["title"], p.get("description", "")) for p in data.get("phases", [])]
+        return cls(roles, phases or [p for p in PHASES if p[0] in roles])
+
+    def only_roles(self, roles):
+        """Restrict the spec to `roles`, keeping only their phases."""
+        wanted = set(roles)
+        missing = sorted(wanted - set(self.role_index))
+        if missing:
+            raise ValueError(f"unknown roles: {', '.join(missing)}")
+        return Spec([r for r in self.roles if r in wanted], [p for p in self.phases if p[0] in wanted])
+
+# === RECORDS ===
+def agent_name(role, team, index):
+    return f"{role} {team}-{index}"
+
+def iter_agents(spec, teams):
+    for team in range(1, teams + 1):
+        for role in spec.roles:
+            i = spec.role_index[role]
+            yield {
+                "id": f"T{team:02d}_A{i:02d}",
+                "name": agent_name(role, team, i),
+                "team": f"Team {team}",
+                "role": role,
+                "description": f"{role} responsible for the {role.lower()} phase of Forge development.",
+                "capabilities": list(CAPABILITIES),
+                "tools": list(AGENT_TOOLS),
+                "memory_file": "memory/crew_memory.json",
+                "output_dir": f"deliverables/team_{team}",
+            }
+
+def iter_tasks(spec, teams):
+    # role index is looked up in a dict, never by searching the phase list
+    n = 0
+    for team in range(1, teams + 1):
+        for role, title, desc in spec.phases:
+            n += 1
+            yield {
+                "id": f"task_{n}",
+                "agent": agent_name(role, team, spec.role_index[role]),
+                "title": title,
+                "instructions": f"[Team {team}] {desc}",
+                "output": {
+                    "file": f"deliverables/{title.replace(' ', '_').lower()}_team{team}.md",
+                    "format": "markdown",
+                    "validation": list(VALIDATION),
+                },
+            }
+
+# === WRITERS ===
+def write_stream(path, key, records, fmt="yaml"):
+    """Write records one at a time; YAML as `key:` followed by a block list, JSONL one per line."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    count = 0
+    with open(tmp, "w", encoding="utf-8") as f:
+        if fmt == "yaml":
+            f.write(f"{key}:\n")
+        for record in records:
+            if fmt == "yaml":
+                f.write(yaml.dump([record], Dumper=Dumper, sort_keys=False, default_flow_style=False))
+            else:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            count += 1
+        if fmt == "yaml" and not count:
+            f.seek(0)
+            f.truncate()
+            f.write(f"{key}: []\n")
+    os.replace(tmp, path)
+    return count
+
+def generate(kind, spec, teams, out_dir=DEFAULT_OUT_DIR, fmt="yaml"):
+    ext = "yaml" if fmt == "yaml" else "jsonl"
+    written = {}
+    if kind in ("agents", "both"):
+        path = os.path.join(out_dir, f"agents.{ext}")
+        written[path] = write_stream(path, "agents", iter_agents(spec, teams), fmt)
+    if kind in ("tasks", "both"):
+        path = os.path.join(out_dir, f"tasks.{ext}")
+        written[path] = write_stream(path, "tasks", iter_tasks(spec, teams), fmt)
+    return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate Forge agents/tasks configs")
+    parser.add_argument("--kind", choices=["agents", "tasks", "both"], default="both")
+    parser.add_argument("--teams", type=int, default=20)
+    parser.add_argument("--spec", help="YAML/JSON file with roles and phases")
+    parser.add_argument("--roles", help="comma-separated subset of roles to generate")
+    parser.add_argument("--format", choices=["yaml", "jsonl"], default="yaml")
+    parser.add_argument("--out-dir", default=DEFAULT_OUT_DIR)
+    args = parser.parse_args(argv)
+
+    try:
+        spec = Spec.load(args.spec) if args.spec else Spec()
+        if args.roles:
+            spec = spec.only_roles([r.strip() for r in args.roles.split(",") if r.strip()])
+    except (OSError, ValueError, KeyError, yaml.YAMLError) as e:
+        print(f"❌ Invalid spec: {e}")
+        return 1
+    for path, count in generate(args.kind, spec, args.teams, args.out_dir, args.format).items():
+        print(f"✅ Generated {count} {os.path.basename(path).split('.')[0]} into {path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
-import os, yaml
+import os
+from agentic_masters_genesis_forge_v1_crewai_project.config_validator import validate_config
 
 REQUIRED_FOLDERS = ["config", "tools", "knowledge", "ui"]
 REQUIRED_FILES = [
@@ -10,16 +11,6 @@ REQUIRED_FILES = [
     "pyproject.toml"
 ]
 
-def validate_yaml(path, key):
-    try:
-        with open(path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        if isinstance(data, dict) and key in data:
-            return True
-        return False
-    except Exception:
-        return False
-
 def validate_forge(path):
     print(f"\n🔍 Validating Forge at: {path}\n")
 
@@ -37,9 +28,12 @@ def validate_forge(path):
         else:
             print(f"✅ Found file: {file}")
 
-    # Validate YAML
-    agents_ok = validate_yaml(os.path.join(path, "config", "agents.yaml"), "agents")
-    tasks_ok = validate_yaml(os.path.join(path, "config", "tasks.yaml"), "tasks")
+    # Validate YAML (schema + cross-references, one pass)
+    config = validate_config(os.path.join(path, "config"))
+    for issue in config.issues:
+        print(f"   ❌ {issue}")
+    agents_ok = not any(os.path.basename(i.file) == "agents.yaml" for i in config.issues)
+    tasks_ok = not any(os.path.basename(i.file) == "tasks.yaml" for i in config.issues)
 
     print(f"🧠 Agents.yaml valid: {'✅' if agents_ok else '❌'}")
     print(f"📋 Tasks.yaml valid: {'✅' if tasks_ok else '❌'}")
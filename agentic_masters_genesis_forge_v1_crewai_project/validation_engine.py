@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Validation Engine
+──────────────────────────────────────────
+Runs the `validation` steps declared per task in config/tasks.yaml:
+ - "Syntax linting"           → markdown structure + code-block syntax
+ - "Unit test execution"      → python test blocks present and compilable
+ - "Integration verification" → JSON/YAML blocks parse
+ - anything else              → reported as manual (e.g. peer review)
+
+Validators are plain functions registered with @validator(name) and return a
+list of issue strings. Deliverables are validated concurrently in a process
+pool and results are cached by content hash, so unchanged files are free.
+Generated code is only parsed/compiled, never executed.
+"""
+import os, re, ast, json, hashlib
+from concurrent.futures import ProcessPoolExecutor
+import yaml
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config")
+CACHE_PATH = os.path.join("deliverables", ".validation_cache.json")
+
+VALIDATORS = {}
+
+STEP_VALIDATORS = {
+    "syntax linting": ["markdown", "python_syntax", "data_syntax"],
+    "unit test execution": ["unit_tests"],
+    "integration verification": ["data_syntax"],
+}
+DEFAULT_STEPS = ["Syntax linting"]
+
+FENCE = re.compile(r"^```[ \t]*([\w+-]*)[^\n]*\n(.*?)^```", re.M | re.S)
+
+def validator(name):
+    """Register a validator: fn(text, blocks) -> list of issue strings."""
+    def register(fn):
+        VALIDATORS[name] = fn
+        return fn
+    return register
+
+def code_blocks(text):
+    return [(lang.lower(), body) for lang, body in FENCE.findall(text)]
+
+# ------------------ BUILT-IN VALIDATORS ------------------
+
+@validator("markdown")
+def check_markdown(text, blocks):
+    if not text.strip():
+        return ["empty deliverable"]
+    issues = []
+    if not re.search(r"^#{1,6} \S", text, re.M):
+        issues.append("no markdown heading")
+    return issues + check_fences(text, blocks)
+
+@validator("fences")
+def check_fences(text, blocks):
+    return ["unbalanced code fence"] if len(re.findall(r"^```", text, re.M)) % 2 else []
+
+@validator("python_syntax")
+def check_python(text, blocks):
+    issues = []
+    for i, (lang, body) in enumerate(blocks, 1):
+        if lang in ("python", "py"):
+            try:
+                ast.parse(body)
+            except SyntaxError as e:
+                issues.append(f"python block {i}: {e.msg} (line {e.lineno})")
+    return issues
+
+@validator("data_syntax")
+def check_data(text, blocks):
+    issues = []
+    for i, (lang, body) in enumerate(blocks, 1):
+        try:
+            if lang == "json":
+                json.loads(body)
+            elif lang in ("yaml", "yml"):
+                yaml.safe_load(body)
+        except (ValueError, yaml.YAMLError) as e:
+            issues.append(f"{lang} block {i}: {str(e).splitlines()[0]}")
+    return issues
+
+@validator("unit_tests")
+def check_tests(text, blocks):
+    tests = [body for lang, body in blocks if lang in ("python", "py")
+             and re.search(r"^\s*(def test_\w+|class \w+\(.*TestCase\))", body, re.M)]
+    if not tests:
+        return ["no python test block found"]
+    issues = []
+    for i, body in enumerate(tests, 1):
+        try:
+            compile(body, f"<test block {i}>", "exec")
+        except SyntaxError as e:
+            issues.append(f"test block {i}: {e.msg} (line {e.lineno})")
+    return issues
+
+# ------------------ ENGINE ------------------
+
+def validators_for(steps):
+    names, manual = [], []
+    for step in steps or DEFAULT_STEPS:
+        mapped = STEP_VALIDATORS.get(step.strip().lower())
+        if mapped is None:
+            manual.append(step)
+        for name in mapped or []:
+            if name not in names:
+                names.append(name)
+    return names, manual
+
+def run_validators(text, names):
+    blocks = code_blocks(text)
+    results = {}
+    for name in names:
+        try:
+            results[name] = VALIDATORS[name](text, blocks)
+        except Exception as e:
+            results[name] = [f"validator crashed: {e}"]
+    return results
+
+def _work(job):
+    key, text, names = job
+    return key, run_validators(text, names)
+
+class ValidationEngine:
+    def __init__(self, cache_path=CACHE_PATH, workers=None):
+        self.cache_path = cache_path
+        self.workers = workers
+        self.cache = {}
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    self.cache = json.load(f)
+            except (OSError, ValueError):
+                self.cache = {}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        tmp = self.cache_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f)
+        os.replace(tmp, self.cache_path)
+
+    def validate(self, items):
+        """items: iterable of (path, steps). Returns one report dict per path."""
+        reports, jobs = [], []
+        for path, steps in items:
+            names, manual = validators_for(steps)
+            report = {"file": path, "manual": manual, "results": {}, "ok": False}
+            reports.append(report)
+            if not os.path.exists(path):
+                report["results"] = {"exists": ["file missing"]}
+                continue
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                text = f.read()
+            digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            key = f"{digest}:{','.join(names)}"
+            report["key"] = key
+            if key not in self.cache:
+                jobs.append((key, text, names))
+
+        if jobs:
+            if len(jobs) == 1 or self.workers == 1:
+                done = list(map(_work, jobs))
+            else:
+                workers = self.workers or os.cpu_count() or 1
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    done = list(pool.map(_work, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
+            for key, results in done:
+                self.cache[key] = results
+            self.save()
+
+        for report in reports:
+            key = report.pop("key", None)
+            if key:
+                report["results"] = self.cache[key]
+            report["ok"] = not any(report["results"].values())
+        return reports
+
+def task_items(tasks_path=os.path.join(CONFIG_DIR, "tasks.yaml"), root="."):
+    """(output file, validation steps) for every task declaring an output file."""
+    with open(tasks_path, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    tasks = data.get("tasks", []) if isinstance(data, dict) else data or []
+    if isinstance(tasks, dict):
+        tasks = list(tasks.values())
+    items = []
+    for task in tasks:
+        output = task.get("output") if isinstance(task, dict) else None
+        if isinstance(output, dict) and output.get("file"):
+            items.append((os.path.join(root, output["file"]), output.get("validation") or DEFAULT_STEPS))
+    return items
+
+def validate_text(text, steps=DEFAULT_STEPS):
+    """In-process validation of a single deliverable body."""
+    names, _ = validators_for(steps)
+    return run_validators(text, names)
+
+if __name__ == "__main__":
+    reports = ValidationEngine().validate(task_items())
+    passed = sum(r["ok"] for r in reports)
+    for r in reports:
+        if not r["ok"]:
+            issues = "; ".join(i for v in r["results"].values() for i in v)
+            print(f"❌ {r['file']}: {issues}")
+    print(f"\n✅ {passed}/{len(reports)} deliverables passed validation.")
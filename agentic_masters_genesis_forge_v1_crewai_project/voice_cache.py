@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Realms to Riches | Forge Voice Cache
+────────────────────────────────────
+Shared on-disk cache for synthesized narration:
+ - Keys are full SHA-256 digests of (model, voice id, text)
+ - Clips live in <root>/cache/<ab>/<key>.wav, described by <root>/voice_index.json
+ - Least-recently-used clips are evicted once the cache exceeds max_bytes
+ - prefetch() synthesizes known phrases on a background thread
+ - the index is rewritten at most every INDEX_FLUSH seconds, once at the end
+   of a batch, and on close() / interpreter exit
+ - Audio is requested as raw PCM (22.05 kHz mono) and wrapped as WAV in memory;
+   MP3 is only decoded, once, if the provider refuses PCM
+ - clip() returns decoded samples for playback straight from memory
+ - Synthesis is pluggable (FORGE_TTS_BACKEND): elevenlabs, pyttsx3, or the
+   offline deterministic "tone" backend for headless / no-network runs;
+   FORGE_AUDIO_OUT=null skips the audio device entirely
+
+Cache hits never touch the network, ffmpeg or a temp file, so repeated
+narration starts instantly.
+
+Batch-synthesize every literal narration line of the cinematic scripts:
+    python -m agentic_masters_genesis_forge_v1_crewai_project.voice_cache --backend tone
+"""
+import os, io, ast, sys, json, math, time, wave, array, atexit, hashlib, argparse, tempfile, threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+VOICES_DIR = os.path.join("assets", "voices")
+INDEX_NAME = "voice_index.json"
+MAX_BYTES = int(os.getenv("FORGE_VOICE_CACHE_MB", "256")) * 1024 * 1024
+INDEX_FLUSH = 5.0
+PCM_RATE = 22050
+CLIP_MEMORY = 32
+TTS_BACKEND = os.getenv("FORGE_TTS_BACKEND", "elevenlabs")
+AUDIO_OUT = os.getenv("FORGE_AUDIO_OUT", "device")
+
+ELEVEN_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
+DEFAULT_MODEL = "eleven_multilingual_v2"
+VOICE_IDS = {
+    "Adam": "Eeg4uu5XxPosS7qxJsTI",
+    "Elli": "jAiFFKFYK8uW3TnWlXah",
+    "Charlotte": "BrOny4Lkm3SsSmSNv8hv",
+    "Roger": "CwhRBWXzGAHq8TQ4Fs17"
+}
+
+def voice_id(agent):
+    return VOICE_IDS.get(agent, VOICE_IDS["Adam"])
+
+def cache_key(voice, text, model=DEFAULT_MODEL):
+    return hashlib.sha256(json.dumps([model, voice, text], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+# ------------------ AUDIO ------------------
+
+class Clip:
+    """Decoded PCM samples, ready to hand to an audio device."""
+
+    def __init__(self, pcm, rate=PCM_RATE, channels=1, width=2):
+        self.pcm, self.rate, self.channels, self.width = pcm, rate, channels, width
+
+    @property
+    def seconds(self):
+        return len(self.pcm) / float(self.rate * self.channels * self.width)
+
+def pcm_to_wav(pcm, rate=PCM_RATE, channels=1, width=2):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(width)
+        w.setframerate(rate)
+        w.writeframes(pcm)
+    return buf.getvalue()
+
+def wav_to_clip(data):
+    with wave.open(io.BytesIO(data), "rb") as w:
+        return Clip(w.readframes(w.getnframes()), w.getframerate(), w.getnchannels(), w.getsampwidth())
+
+def play_pcm(clip):
+    """Play a Clip from memory: simpleaudio if installed, else pydub."""
+    if clip is None or AUDIO_OUT == "null":
+        return
+    try:
+        import simpleaudio as sa
+        sa.play_buffer(clip.pcm, clip.channels, clip.width, clip.rate).wait_done()
+    except ImportError:
+        from pydub import AudioSegment
+        from pydub.playback import play
+        play(AudioSegment(data=clip.pcm, sample_width=clip.width, frame_rate=clip.rate, channels=clip.channels))
+
+# ------------------ SYNTHESIS ------------------
+
+def elevenlabs_wav(voice, text, model=DEFAULT_MODEL, api_key=None, timeout=30):
+    """Synthesize `text` with ElevenLabs and return WAV bytes, or None without a key / on failure.
+
+    Asks for raw PCM so no decoder runs; falls back to decoding the MP3 stream in memory.
+    """
+    api_key = api_key or os.getenv("ELEVENLABS_API_KEY", "").strip()
+    if not api_key:
+        return None
+    import requests
+    headers = {"xi-api-key": api_key, "Content-Type": "application/json"}
+    payload = {"text": text, "model_id": model}
+    url = ELEVEN_URL.format(voice_id=voice)
+    r = requests.post(url, params={"output_format": f"pcm_{PCM_RATE}"}, headers=headers, json=payload, timeout=timeout)
+    if r.ok and not r.headers.get("Content-Type", "").startswith("audio/mpeg"):
+        return pcm_to_wav(r.content)
+    if not r.ok:
+        r = requests.post(url, headers={**headers, "Accept": "audio/mpeg"}, json=payload, timeout=timeout)
+        if not r.ok:
+            return None
+    from pydub import AudioSegment
+    sound = AudioSegment.from_file(io.BytesIO(r.content), format="mp3")
+    sound = sound.set_frame_rate(PCM_RATE).set_channels(1).set_sample_width(2)
+    return pcm_to_wav(sound.raw_data)
+
+# ------------------ BACKENDS ------------------
+
+class TTSBackend:
+    """synth(voice, text, model) -> WAV bytes or None. `model` names the cache namespace."""
+    name = "base"
+    model = DEFAULT_MODEL
+
+    def __call__(self, voice, text, model=None):
+        raise NotImplementedError
+
+class ElevenLabsBackend(TTSBackend):
+    name = "elevenlabs"
+
+    def __init__(self, api_key=None, model=DEFAULT_MODEL):
+        self.api_key = api_key
+        self.model = model
+
+    def __call__(self, voice, text, model=None):
+        return elevenlabs_wav(voice, text, model or self.model, self.api_key)
+
+class ToneBackend(TTSBackend):
+    """Offline stand-in: one short tone per word, pitch derived from voice and word. Fully deterministic."""
+    name = "tone"
+    model = "tone-v1"
+
+    def __init__(self, word_seconds=0.22, gap_seconds=0.05, max_seconds=20.0):
+        self.word_seconds, self.gap_seconds, self.max_seconds = word_seconds, gap_seconds, max_seconds
+
+    @staticmethod
+    def _pitch(*parts):
+        h = hashlib.sha256("|".join(parts).encode("utf-8")).digest()
+        return 140 + int.from_bytes(h[:2], "big") % 220
+
+    def __call__(self, voice, text, model=None):
+        base = self._pitch(voice)
+        word_n, gap = int(PCM_RATE * self.word_seconds), bytes(2 * int(PCM_RATE * self.gap_seconds))
+        budget = int(self.max_seconds / (self.word_seconds + self.gap_seconds))
+        out = bytearray()
+        for word in text.split()[:budget] or [""]:
+            freq = (base + self._pitch(voice, word.lower())) / 2.0
+            step = 2 * math.pi * freq / PCM_RATE
+            fade = max(1, word_n // 10)
+            samples = array.array("h", (int(9000 * min(1.0, i / fade, (word_n - i) / fade) * math.sin(step * i))
+                                        for i in range(word_n)))
+            if sys.byteorder == "big":
+                samples.byteswap()
+            out += samples.tobytes() + gap
+        return pcm_to_wav(bytes(out))
+
+class Pyttsx3Backend(TTSBackend):
+    """Local engine rendered to WAV. The engine is created once and reused."""
+    name = "pyttsx3"
+    model = "pyttsx3"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.engine = None
+
+    def __call__(self, voice, text, model=None):
+        with self.lock:
+            if self.engine is None:
+                import pyttsx3
+                self.engine = pyttsx3.init()
+            fd, path = tempfile.mkstemp(suffix=".wav")
+            os.close(fd)
+            try:
+                self.engine.save_to_file(text, path)
+                self.engine.runAndWait()
+                with open(path, "rb") as f:
+                    return f.read() or None
+            finally:
+                os.remove(path)
+
+BACKENDS = {"elevenlabs": ElevenLabsBackend, "tone": ToneBackend, "pyttsx3": Pyttsx3Backend}
+_BACKENDS = {}
+
+def get_backend(name=None):
+    """Shared backend instance by name (default: FORGE_TTS_BACKEND)."""
+    name = (name or TTS_BACKEND).lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown TTS backend: {name}")
+    if name not in _BACKENDS:
+        _BACKENDS[name] = BACKENDS[name]()
+    return _BACKENDS[name]
+
+_LOCAL_ENGINE = {}
+_LOCAL_LOCK = threading.Lock()
+
+def speak_locally(text):
+    """Blocking pyttsx3 fallback that reuses one engine instead of re-initializing per call."""
+    if AUDIO_OUT == "null":
+        return
+    with _LOCAL_LOCK:
+        if "engine" not in _LOCAL_ENGINE:
+            import pyttsx3
+            _LOCAL_ENGINE["engine"] = pyttsx3.init()
+        engine = _LOCAL_ENGINE["engine"]
+        engine.say(text)
+        engine.runAndWait()
+
+# ------------------ CACHE ------------------
+
+class VoiceCache:
+    def __init__(self, root=VOICES_DIR, max_bytes=MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(root, INDEX_NAME)
+        self.entries = {}
+        self.lock = threading.RLock()
+        self.inflight = {}
+        self.clips = OrderedDict()
+        self.dirty = False
+        self.flushed = 0.0
+        os.makedirs(root, exist_ok=True)
+        self.entries = self._read_index()
+        atexit.register(self.flush)
+
+    def path(self, key):
+        return os.path.join(self.root, "cache", key[:2], key + ".wav")
+
+    # ------------------ INDEX ------------------
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f).get("entries", {})
+        except (OSError, ValueError):
+            return {}
+
+    def flush(self):
+        """Persist the index, merging entries written meanwhile by other processes."""
+        with self.lock:
+            if not self.dirty:
+                return
+            merged = self._read_index()
+            for key, entry in self.entries.items():
+                if key not in merged or merged[key]["last_used"] < entry["last_used"]:
+                    merged[key] = entry
+            self.entries = {k: e for k, e in merged.items() if os.path.exists(self.path(k))}
+            tmp = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"entries": self.entries}, f, ensure_ascii=False)
+            os.replace(tmp, self.index_path)
+            self.dirty = False
+            self.flushed = time.time()
+
+    def _flush_if_due(self):
+        if time.time() - self.flushed > INDEX_FLUSH:
+            self.flush()
+
+    def close(self):
+        """Persist any index changes still pending."""
+        self.flush()
+
+    def total_bytes(self):
+        with self.lock:
+            return sum(e["bytes"] for e in self.entries.values())
+
+    # ------------------ LOOKUP ------------------
+
+    def get(self, voice, text, model=DEFAULT_MODEL):
+        """Path of the cached clip, or None. Marks the clip as recently used."""
+        key = cache_key(voice, text, model)
+        path = self.path(key)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or not os.path.exists(path):
+                self.entries.pop(key, None)
+                return None
+            entry["last_used"] = time.time()
+            self.dirty = True
+            self._flush_if_due()
+        return path
+
+    def put(self, voice, text, data, model=DEFAULT_MODEL, label=None):
+        key = cache_key(voice, text, model)
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        now = time.time()
+        with self.lock:
+            self.entries[key] = {"voice": voice, "model": model, "label": label, "text": text[:120],
+                                 "bytes": len(data), "created": now, "last_used": now}
+            self.dirty = True
+            self.evict(keep=key)
+            # batches flush once when they finish; otherwise at most every INDEX_FLUSH seconds
+            self._flush_if_due()
+        return path
+
+    def evict(self, keep=None):
+        """Drop least-recently-used clips until the cache fits in max_bytes. Returns bytes freed."""
+        with self.lock:
+            total, freed = self.total_bytes(), 0
+            for key, entry in sorted(self.entries.items(), key=lambda kv: kv[1]["last_used"]):
+                if total - freed <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                try:
+                    os.remove(self.path(key))
+                except OSError:
+                    pass
+                freed += entry["bytes"]
+                del self.entries[key]
+                self.dirty = True
+            return freed
+
+    def clip(self, voice, text, model=None, synth=None, label=None):
+        """Decoded Clip for a phrase (synthesizing on a miss), or None. Recent clips stay in memory."""
+        synth, model = _resolve(synth, model)
+        key = cache_key(voice, text, model)
+        with self.lock:
+            clip = self.clips.get(key)
+            if clip is not None:
+                self.clips.move_to_end(key)
+        if clip is not None:
+            self.get(voice, text, model)  # keep disk LRU in step
+            return clip
+        path = self.fetch(voice, text, model, synth, label)
+        if not path:
+            return None
+        with open(path, "rb") as f:
+            clip = wav_to_clip(f.read())
+        with self.lock:
+            self.clips[key] = clip
+            if len(self.clips) > CLIP_MEMORY:
+                self.clips.popitem(last=False)
+        return clip
+
+    def fetch(self, voice, text, model=None, synth=None, label=None):
+        """Cached clip path, synthesizing on a miss. Concurrent misses for one phrase synthesize once."""
+        synth, model = _resolve(synth, model)
+        path = self.get(voice, text, model)
+        if path:
+            return path
+        key = cache_key(voice, text, model)
+        with self.lock:
+            event = self.inflight.get(key)
+            owner = event is None
+            if owner:
+                event = self.inflight[key] = threading.Event()
+        if not owner:
+            event.wait()
+            return self.get(voice, text, model)
+        try:
+            data = synth(voice, text, model)
+            return self.put(voice, text, data, model, label) if data else None
+        finally:
+            with self.lock:
+                self.inflight.pop(key, None)
+            event.set()
+
+    def prefetch(self, phrases, model=None, synth=None):
+        """Warm the cache for [(agent, text)] on a daemon thread. Returns the thread."""
+        def run():
+            for agent, text in phrases:
+                try:
+                    self.fetch(voice_id(agent), text, model, synth, label=agent)
+                except Exception as e:
+                    print(f"⚠️ Voice prefetch skipped ({agent}): {e}")
+            self.flush()
+        thread = threading.Thread(target=run, name="voice-prefetch", daemon=True)
+        thread.start()
+        return thread
+
+    def synthesize_all(self, phrases, model=None, synth=None, workers=4):
+        """Batch-fill the cache for [(agent, text)]. Returns counts and elapsed seconds."""
+        synth, model = _resolve(synth, model)
+        phrases = list(dict.fromkeys(phrases))
+        stats = {"phrases": len(phrases), "cached": 0, "synthesized": 0, "failed": 0}
+        start = time.time()
+
+        def one(item):
+            agent, text = item
+            if self.get(voice_id(agent), text, model):
+                return "cached"
+            try:
+                return "synthesized" if self.fetch(voice_id(agent), text, model, synth, label=agent) else "failed"
+            except Exception:
+                return "failed"
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for outcome in pool.map(one, phrases):
+                stats[outcome] += 1
+        self.flush()
+        stats["seconds"] = round(time.time() - start, 3)
+        return stats
+
+def _resolve(synth, model):
+    synth = synth or get_backend()
+    return synth, model or getattr(synth, "model", DEFAULT_MODEL)
+
+_CACHES = {}
+
+def get_cache(root=VOICES_DIR):
+    root = os.path.abspath(root)
+    if root not in _CACHES:
+        _CACHES[root] = VoiceCache(root)
+    return _CACHES[root]
+
+def narration(agent, text, root=VOICES_DIR, model=None, synth=None):
+    """Cached WAV path for `agent` speaking `text`, or None if it could not be synthesized."""
+    return get_cache(root).fetch(voice_id(agent), text, model, synth, label=agent)
+
+def narration_clip(agent, text, root=VOICES_DIR, model=None, synth=None):
+    """In-memory Clip for `agent` speaking `text`, or None if it could not be synthesized."""
+    return get_cache(root).clip(voice_id(agent), text, model, synth, label=agent)
+
+# ------------------ BATCH SYNTHESIS ------------------
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "archive", "old_forge_project_files")
+NARRATION_SCRIPTS = ["forge_system_launch.py", "forge_presentation_neural.py", "performance_overdrive.py",
+                     "forge_master_runner.py"]
+NARRATION_CALLS = {"speak": "Adam", "holographic_voice": None, "say": None, "adam_speak": "Adam"}
+
+def script_phrases(paths):
+    """Literal (agent, text) narration lines found in scripts, read with ast (nothing is imported)."""
+    phrases = []
+    for path in paths:
+        with open(path, encoding="utf-8-sig") as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Tuple) and len(node.elts) == 2 \
+                    and all(isinstance(e, ast.Constant) and isinstance(e.value, str) for e in node.elts) \
+                    and node.elts[0].value in VOICE_IDS:
+                phrases.append((node.elts[0].value, node.elts[1].value))  # e.g. LAUNCH_PHRASES entries
+                continue
+            if not isinstance(node, ast.Call):
+                continue
+            name = getattr(node.func, "id", None) or getattr(node.func, "attr", None)
+            if name not in NARRATION_CALLS:
+                continue
+            args = [a.value if isinstance(a, ast.Constant) and isinstance(a.value, str) else None for a in node.args]
+            if len(args) >= 2 and args[0] in VOICE_IDS and args[1]:
+                phrases.append((args[0], args[1]))
+            elif len(args) == 1 and args[0] and NARRATION_CALLS[name]:
+                phrases.append((NARRATION_CALLS[name], args[0]))
+    return list(dict.fromkeys(phrases))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch-synthesize forge narration into the voice cache.")
+    parser.add_argument("scripts", nargs="*", help="scripts to scan (default: the cinematic launch scripts)")
+    parser.add_argument("--backend", default=None, help=f"one of {', '.join(BACKENDS)} (default {TTS_BACKEND})")
+    parser.add_argument("--root", default=VOICES_DIR, help="voice cache directory")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args(argv)
+    scripts = args.scripts or [os.path.join(SCRIPTS_DIR, name) for name in NARRATION_SCRIPTS]
+    phrases = script_phrases(scripts)
+    backend = get_backend(args.backend)
+    stats = get_cache(args.root).synthesize_all(phrases, synth=backend, workers=args.workers)
+    print(f"🎙️ {backend.name}: {stats['phrases']} phrases — {stats['synthesized']} synthesized, "
+          f"{stats['cached']} cached, {stats['failed']} failed in {stats['seconds']}s")
+    return 0 if not stats["failed"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
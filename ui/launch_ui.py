@@ -1,11 +1,34 @@
 import yaml
 import os
+import json
 import streamlit as st
+from agentic_masters_genesis_forge_v1_crewai_project.launch_jobs import get_queue, ACTIVE
+
+MAPPINGS_PATH = "ui/prefill_mappings.yaml"
+ROSTER_PATH = "ui/roster.jsonl"
+PAGE_SIZES = [10, 25, 50, 100]
+POLL_SECONDS = 1.5
+LOG_TAIL = 200
+TABLE_COLUMNS = ["employee_id", "name", "role", "team", "persona", "tools", "hourly_rate", "physical_form", "tasks"]
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # === Load Mappings ===
-def load_mappings(file_path="ui/prefill_mappings.yaml"):
-    with open(file_path, "r") as f:
-        return yaml.safe_load(f)  # Top-level list of agents
+def file_stamp(path):
+    """(mtime, size) of a file; part of the cache key so edits invalidate cached data."""
+    info = os.stat(path)
+    return info.st_mtime_ns, info.st_size
+
+def read_mappings(file_path=MAPPINGS_PATH):
+    # The sharded compiler's JSONL roster holds the same agents and skips YAML parsing
+    if os.path.exists(ROSTER_PATH) and file_stamp(ROSTER_PATH)[0] >= file_stamp(file_path)[0]:
+        with open(ROSTER_PATH, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    with open(file_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=Loader)  # Top-level list of agents
+
+def load_mappings(file_path=MAPPINGS_PATH):
+    return _cached_forge(file_path, file_stamp(file_path))["mappings"]
 
 # === Group Agents by Team ===
 def group_agents_by_team(mappings):
@@ -15,6 +38,50 @@ def group_agents_by_team(mappings):
         teams.setdefault(team_key, []).append(agent)
     return teams
 
+def table_row(agent):
+    return {
+        "employee_id": agent.get("employee_id", "ID Missing"),
+        "name": agent.get("name", "Unnamed"),
+        "role": agent.get("role", "Unknown"),
+        "team": agent.get("team", "Unassigned"),
+        "persona": agent.get("persona", "N/A"),
+        "tools": ", ".join(agent.get("tools_assigned", [])),
+        "hourly_rate": agent.get("hourly_rate"),
+        "physical_form": agent.get("physical_form", "N/A"),
+        "tasks": len(agent.get("tasks", [])),
+    }
+
+def agent_card(agent):
+    """One markdown block per agent instead of a widget per field."""
+    return "\n".join([
+        f"### {agent.get('name', 'Unnamed')} ({agent.get('employee_id', 'ID Missing')})",
+        f"**Role:** {agent.get('role', 'Unknown')}  ",
+        f"**Team:** {agent.get('team', 'Unassigned')}  ",
+        f"**Persona:** {agent.get('persona', 'N/A')}  ",
+        f"**Tools Assigned:** {', '.join(agent.get('tools_assigned', []))}  ",
+        f"**Hourly Rate:** ${agent.get('hourly_rate', 'N/A')}/hr  ",
+        f"**Form:** {agent.get('physical_form', 'N/A')}  ",
+        "**Tasks:**",
+    ])
+
+def task_block(agent):
+    return "\n".join(task.get("default_filename", "filename missing") for task in agent.get("tasks", []))
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _cached_forge(file_path, stamp):
+    """Parsed mappings plus everything derived from them, rebuilt only when the file changes.
+
+    cache_resource hands back the same objects on every rerun (no copy), so callers must not mutate them.
+    """
+    mappings = read_mappings(file_path)
+    teams = group_agents_by_team(mappings)
+    return {
+        "mappings": mappings,
+        "teams": teams,
+        "rows": {team: [table_row(a) for a in agents] for team, agents in teams.items()},
+        "cards": {team: [(agent_card(a), task_block(a)) for a in agents] for team, agents in teams.items()},
+    }
+
 # === UI: Project Type + Prompt ===
 def project_selector():
     st.sidebar.title("🧠 Project Intelligence")
@@ -25,11 +92,64 @@ def project_selector():
 # === UI: Team Activation ===
 def team_activation_ui(teams):
     st.sidebar.title("🧩 Activate Teams")
-    active_teams = []
+    active = []
     for team, agents in teams.items():
         if st.sidebar.checkbox(f"Activate {team} Team ({len(agents)} agents)"):
-            active_teams.extend(agents)
-    return active_teams
+            active.append(team)
+    return active
+
+# === UI: Agent Views ===
+def render_table(forge, active_teams):
+    rows = [row for team in active_teams for row in forge["rows"][team]]
+    st.dataframe(rows, column_order=TABLE_COLUMNS, hide_index=True, use_container_width=True)
+
+def render_cards(forge, active_teams, total):
+    size_col, page_col = st.columns(2)
+    page_size = size_col.selectbox("Agents per page", PAGE_SIZES, index=1)
+    pages = max(1, -(-total // page_size))
+    page = page_col.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, step=1)
+
+    # walk the precomputed per-team cards and slice out just this page
+    start, end = (page - 1) * page_size, page * page_size
+    offset = 0
+    for team in active_teams:
+        cards = forge["cards"][team]
+        if offset + len(cards) > start and offset < end:
+            for card, tasks in cards[max(0, start - offset):end - offset]:
+                st.markdown(card)
+                st.code(tasks, language=None)
+        offset += len(cards)
+        if offset >= end:
+            break
+    st.caption(f"Showing {start + 1}–{min(end, total)} of {total} agents")
+
+# === UI: Launch Jobs ===
+# re-run only the jobs panel on a timer, so polling never reruns the whole page
+@st.fragment(run_every=POLL_SECONDS)
+def launch_jobs_panel():
+    """Progress for this session's launches, read incrementally from the job status store."""
+    job_ids = st.session_state.get("launch_jobs", [])
+    if not job_ids:
+        return
+    store = get_queue().store
+    logs = st.session_state.setdefault("launch_logs", {})
+    st.subheader("📡 Launch Jobs")
+    for job_id in reversed(job_ids):
+        job = store.get(job_id)
+        if job is None:
+            continue
+        lines, cursor = logs.get(job_id, ([], 0))
+        new = store.events(job_id, after=cursor)
+        if new:
+            lines = (lines + [e["message"] for e in new])[-LOG_TAIL:]
+            cursor = new[-1]["seq"]
+        logs[job_id] = (lines, cursor)
+
+        total = job["total"] or 1
+        label = f"Job {job_id} — {job['status']} · {job['done']}/{job['total']} tasks · {job['errors']} errors"
+        with st.expander(label, expanded=job["status"] in ACTIVE):
+            st.progress(min(1.0, job["done"] / total))
+            st.code("\n".join(lines[-20:]) or "waiting…", language=None)
 
 # === Main UI ===
 def main():
@@ -37,35 +157,33 @@ def main():
     st.title("🚀 Master Forge Agent Launcher")
 
     try:
-        mappings = load_mappings()
+        forge = _cached_forge(MAPPINGS_PATH, file_stamp(MAPPINGS_PATH))
     except Exception as e:
         st.error(f"Failed to load mappings: {e}")
         return
 
-    teams = group_agents_by_team(mappings)
+    teams = forge["teams"]
     project_type, project_prompt = project_selector()
-    active_agents = team_activation_ui(teams)
+    active_teams = team_activation_ui(teams)
+    active_agents = [agent for team in active_teams for agent in teams[team]]
 
     st.subheader("🧠 Active Agents")
     if not active_agents:
         st.info("No teams activated yet. Use the sidebar to activate one or more teams.")
     else:
-        for agent in active_agents:
-            st.markdown(f"### {agent.get('name', 'Unnamed')} ({agent.get('employee_id', 'ID Missing')})")
-            st.markdown(f"**Role:** {agent.get('role', 'Unknown')}")
-            st.markdown(f"**Team:** {agent.get('team', 'Unassigned')}")
-            st.markdown(f"**Persona:** {agent.get('persona', 'N/A')}")
-            st.markdown(f"**Tools Assigned:** {', '.join(agent.get('tools_assigned', []))}")
-            st.markdown(f"**Hourly Rate:** ${agent.get('hourly_rate', 'N/A')}/hr")
-            st.markdown(f"**Form:** {agent.get('physical_form', 'N/A')}")
-            st.markdown("**Tasks:**")
-            for task in agent.get("tasks", []):
-                st.code(task.get("default_filename", "filename missing"))
-
-    if st.button("🔥 Launch Selected Agents"):
-        st.success(f"Launching {len(active_agents)} agents for a {project_type} project...")
+        view = st.radio("View", ["Table", "Cards"], horizontal=True)
+        if view == "Table":
+            render_table(forge, active_teams)
+        else:
+            render_cards(forge, active_teams, len(active_agents))
+
+    if st.button("🔥 Launch Selected Agents", disabled=not active_agents):
+        job_id = get_queue().submit(active_agents, project_type, project_prompt)
+        st.session_state.setdefault("launch_jobs", []).append(job_id)
+        st.success(f"Launching {len(active_agents)} agents for a {project_type} project... (job {job_id})")
         st.markdown(f"**Project Prompt:** {project_prompt}")
-        # TODO: Inject dispatch logic here
+
+    launch_jobs_panel()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
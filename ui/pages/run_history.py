@@ -0,0 +1,65 @@
+import time
+import streamlit as st
+from agentic_masters_genesis_forge_v1_crewai_project.run_metrics import get_metrics, PERCENTILES
+
+REFRESH_SECONDS = 5
+RUN_LIMIT = 50
+
+# === Metrics Queries (rollup tables only, never crew_memory.json) ===
+@st.cache_data(ttl=REFRESH_SECONDS, show_spinner=False)
+def load_runs(limit=RUN_LIMIT):
+    return get_metrics().runs(limit)
+
+@st.cache_data(ttl=REFRESH_SECONDS, show_spinner=False)
+def load_breakdown(run_id):
+    metrics = get_metrics()
+    teams = metrics.teams(run_id)
+    for row in teams:
+        row.update({f"p{q}": v for q, v in metrics.latency("team", row["team"], run_id).items()})
+    return {
+        "latency": metrics.latency("run", "", run_id),
+        "teams": teams,
+        "agents": metrics.agents(run_id, limit=100),
+    }
+
+def fmt_seconds(value):
+    return "–" if value is None else f"{value * 1000:.0f} ms"
+
+# === Page ===
+def main():
+    st.set_page_config(page_title="Forge Run History", layout="wide")
+    st.title("📊 Forge Run History")
+
+    runs = load_runs()
+    if not runs:
+        st.info("No runs recorded yet. Run the crew or launch agents from the launcher "
+                "(older runs can be imported with `python run_metrics.py --backfill`).")
+        return
+
+    st.subheader("🗂️ Runs")
+    st.dataframe([{
+        "run": r["run_id"],
+        "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(r["started"])),
+        "completions": r["completions"],
+        "errors": r["errors"],
+        "repairs": r["repairs"],
+        "error rate": f"{r['errors'] / max(1, r['completions'] + r['errors']):.1%}",
+    } for r in runs], hide_index=True)
+
+    labels = {"All runs": None, **{f"{r['run_id']} ({time.ctime(r['started'])})": r["run_id"] for r in runs}}
+    run_id = labels[st.selectbox("Breakdown for", list(labels))]
+    data = load_breakdown(run_id)
+
+    cols = st.columns(len(PERCENTILES))
+    for col, q in zip(cols, PERCENTILES):
+        col.metric(f"p{q} task latency", fmt_seconds(data["latency"][q]))
+
+    st.subheader("🧩 Teams")
+    st.dataframe([{**row, **{f"p{q}": fmt_seconds(row[f"p{q}"]) for q in PERCENTILES}} for row in data["teams"]],
+                 hide_index=True)
+
+    st.subheader("🤖 Agents (most errors first)")
+    st.dataframe(data["agents"], hide_index=True)
+
+if __name__ == "__main__":
+    main()